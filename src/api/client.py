@@ -6,6 +6,7 @@ Zentrale Klasse für alle API-Anfragen.
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import threading
 from typing import Optional, Dict, Any, Callable
@@ -21,6 +22,19 @@ MAX_RETRIES = 3
 RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 RETRY_BACKOFF_FACTOR = 1.0
 
+# Connection-Pool: genug Keep-Alive-Verbindungen fuer parallele Worker
+# (Bulk-Downloads, Uploads). Retries laufen ueber _request_with_retry,
+# daher ohne urllib3-Retry am Adapter.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# Chunk-Groesse beim Streaming-Download (konstanter Speicher pro Download)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Kurzer Timeout fuer den Verbindungstest (Login-Dialog), damit ein
+# nicht erreichbarer Server nicht fuer den vollen Request-Timeout blockiert
+CONNECTION_CHECK_TIMEOUT = 5
+
 
 @dataclass
 class APIConfig:
@@ -52,6 +66,9 @@ class APIClient:
         self.config = config or APIConfig()
         self._token: Optional[str] = None
         self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
         self._auth_refresh_callback: Optional[Callable[[], bool]] = None
         self._forced_logout_callback: Optional[Callable[[str], None]] = None
         self._auth_refresh_lock = threading.Lock()
@@ -74,6 +91,14 @@ class APIClient:
         """Prüft ob ein Token gesetzt ist."""
         return self._token is not None
     
+    def close(self) -> None:
+        """Schliesst die Keep-Alive-Verbindungen der Session.
+        
+        Die Session bleibt benutzbar; spaetere Requests bauen neue
+        Verbindungen auf.
+        """
+        self._session.close()
+    
     def _get_headers(self) -> Dict[str, str]:
         """Erstellt die HTTP-Header für Anfragen."""
         headers = {
@@ -609,7 +634,8 @@ class APIClient:
             raise APIError(f"Upload-Fehler: {e}")
     
     def download_file(self, endpoint: str, target_path: str, 
-                       max_retries: int = MAX_RETRIES) -> str:
+                       max_retries: int = MAX_RETRIES,
+                       cancel_event: Optional[threading.Event] = None) -> str:
         """
         Datei von der API herunterladen mit Retry-Logik.
         
@@ -617,6 +643,8 @@ class APIClient:
             endpoint: API-Endpunkt
             target_path: Zielpfad fuer die Datei
             max_retries: Maximale Anzahl Versuche (veraltet, zentral konfiguriert)
+            cancel_event: Optionales Event; ist es gesetzt, wird der laufende
+                Download zwischen zwei Chunks abgebrochen (APIError)
             
         Returns:
             Pfad zur heruntergeladenen Datei
@@ -625,18 +653,19 @@ class APIClient:
             APIError: Nach allen fehlgeschlagenen Versuchen
         """
         try:
-            return self._download_file_inner(endpoint, target_path)
+            return self._download_file_inner(endpoint, target_path, cancel_event)
         except APIError as e:
             # Bei 401: Token-Refresh versuchen und Retry
             if e.status_code == 401 and self._try_auth_refresh(str(e)):
                 logger.info(f"Token erneuert, wiederhole DOWNLOAD {endpoint}")
                 try:
-                    return self._download_file_inner(endpoint, target_path)
+                    return self._download_file_inner(endpoint, target_path, cancel_event)
                 except APIError:
                     raise  # Retry auch fehlgeschlagen
             raise  # Kein Refresh moeglich oder kein 401
     
-    def _download_file_inner(self, endpoint: str, target_path: str) -> str:
+    def _download_file_inner(self, endpoint: str, target_path: str,
+                             cancel_event: Optional[threading.Event] = None) -> str:
         """Innere Download-Logik (ohne 401-Retry)."""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         logger.debug(f"DOWNLOAD {url} -> {target_path}")
@@ -668,13 +697,27 @@ class APIClient:
                     status_code=response.status_code
                 )
             
-            # Erfolg - Datei schreiben
+            # Erfolg - Datei in .part streamen und erst komplett umbenennen,
+            # damit Cache-Pruefungen nie eine halbe Datei sehen
+            part_path = f"{target_path}.part"
             bytes_written = 0
-            with open(target_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        bytes_written += len(chunk)
+            try:
+                with open(part_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if cancel_event is not None and cancel_event.is_set():
+                            # Verbindung schliessen statt den Rest zu lesen
+                            response.close()
+                            raise APIError("Download abgebrochen")
+                        if chunk:
+                            f.write(chunk)
+                            bytes_written += len(chunk)
+                os.replace(part_path, target_path)
+            except BaseException:
+                try:
+                    os.remove(part_path)
+                except OSError:
+                    pass
+                raise
             
             logger.debug(f"Download erfolgreich: {bytes_written} bytes -> {target_path}")
             return target_path
@@ -688,7 +731,12 @@ class APIClient:
     def check_connection(self) -> bool:
         """Prüft ob die API erreichbar ist."""
         try:
-            response = self.get("/")
-            return response.get('status') == 'ok'
-        except APIError:
+            response = self._request_with_retry(
+                'GET', f"{self.base_url}/",
+                headers=self._get_headers(),
+                timeout=CONNECTION_CHECK_TIMEOUT,
+                verify=self.config.verify_ssl
+            )
+            return self._handle_response(response).get('status') == 'ok'
+        except (APIError, requests.RequestException):
             return False
@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 import re
+import threading
 from pathlib import Path
 
 from .client import APIClient, APIError
@@ -219,6 +220,17 @@ class Document:
         return (self.mime_type == 'application/pdf' or 
                 self.original_filename.lower().endswith('.pdf'))
     
+    @property
+    def ai_state(self) -> str:
+        """KI-Benennungsstatus als Schluessel: 'renamed', 'error', 'pending' oder 'na'."""
+        if self.ai_renamed:
+            return 'renamed'
+        if self.ai_processing_error:
+            return 'error'
+        if self.is_pdf:
+            return 'pending'
+        return 'na'
+    
     @property
     def is_xml(self) -> bool:
         """Prueft ob das Dokument eine XML-Datei ist."""
@@ -604,7 +616,8 @@ class DocumentsAPI:
             return None
     
     def download(self, doc_id: int, target_dir: str, 
-                  filename_override: Optional[str] = None) -> Optional[str]:
+                  filename_override: Optional[str] = None,
+                  cancel_event: Optional[threading.Event] = None) -> Optional[str]:
         """
         Dokument herunterladen mit robuster Fehlerbehandlung.
         
@@ -612,6 +625,7 @@ class DocumentsAPI:
             doc_id: Dokument-ID
             target_dir: Zielverzeichnis
             filename_override: Optionaler Dateiname (sonst original_filename aus API)
+            cancel_event: Optionales Event zum Abbrechen eines laufenden Downloads
             
         Returns:
             Pfad zur heruntergeladenen Datei oder None
@@ -650,7 +664,8 @@ class DocumentsAPI:
         try:
             result = self.client.download_file(
                 f'/documents/{doc_id}',
-                str(target_path)
+                str(target_path),
+                cancel_event=cancel_event,
             )
             logger.info(f"Dokument heruntergeladen: {result}")
             return result
@@ -706,7 +721,10 @@ class DocumentsAPI:
             return 0
         except APIError as e:
             logger.error(f"Bulk-Loeschen fehlgeschlagen: {e}")
-            # Fallback: Einzeln loeschen (Abwaertskompatibilitaet)
+            # Fallback nur wenn der Bulk-Endpoint fehlt (alte Server-Version);
+            # bei Netz-/Serverfehlern wuerden N Einzel-Requests nur mehr Last erzeugen
+            if e.status_code not in (404, 405):
+                return 0
             count = 0
             for doc_id in doc_ids:
                 if self.delete(doc_id):
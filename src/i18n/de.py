@@ -1092,6 +1092,7 @@ DUPLICATE_COMPARE_ACTION_MOVE = "Verschieben"
 DUPLICATE_COMPARE_ACTION_COLOR = "Farbe"
 DUPLICATE_COMPARE_NOT_FOUND = "Gegenstueck konnte nicht gefunden werden"
 DUPLICATE_COMPARE_ERROR = "Fehler bei Aktion: {error}"
+DUPLICATE_COMPARE_INCOMPLETE = "Server hat nur {done} von {total} Dokument(en) geaendert"
 DUPLICATE_COMPARE_CONFIRM_DELETE = "Soll dieses Dokument wirklich geloescht werden?\n\n{filename}"
 
 # === Worker-/UseCase-Fehlermeldungen ===
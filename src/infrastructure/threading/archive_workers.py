@@ -9,10 +9,12 @@ ein Re-Export in ui/archive/workers.py.
 from typing import Optional, List
 from pathlib import Path
 import os
+import time
 import logging
 import tempfile
+import threading
 
-from PySide6.QtCore import Qt, Signal, QThread
+from PySide6.QtCore import Qt, Signal, QThread, QObject, QRunnable, QThreadPool
 
 from api.client import APIClient
 from api.documents import DocumentsAPI, safe_cache_filename
@@ -356,6 +358,98 @@ class PreviewDownloadWorker(QThread):
             self.download_error.emit(str(e))
 
 
+PREVIEW_POOL_MAX_THREADS = 4
+_preview_pool: Optional[QThreadPool] = None
+
+
+def get_preview_pool() -> QThreadPool:
+    """Eigener, begrenzter Thread-Pool fuer Vorschau-Downloads.
+
+    Threads werden wiederverwendet und die Zahl paralleler Verbindungen
+    bleibt gedeckelt. Der globale Pool bleibt unangetastet.
+    """
+    global _preview_pool
+    if _preview_pool is None:
+        _preview_pool = QThreadPool()
+        _preview_pool.setMaxThreadCount(PREVIEW_POOL_MAX_THREADS)
+    return _preview_pool
+
+
+class PreviewDownloadSignals(QObject):
+    """Signale fuer PreviewDownloadRunnable (QRunnable hat keine eigenen)."""
+    download_finished = Signal(object)
+    download_error = Signal(str)
+
+
+class PreviewDownloadRunnable(QRunnable):
+    """Vorschau-Download als QRunnable fuer get_preview_pool().
+
+    Gleiche Cache-Logik wie PreviewDownloadWorker. Abgebrochen wird ueber
+    ein threading.Event, das mehrere Runnables teilen koennen; nach dem
+    Abbruch wird kein Signal mehr gesendet.
+    """
+
+    def __init__(self, docs_api: DocumentsAPI, doc_id: int, cache_dir: str,
+                 filename: str, cancel_event: threading.Event):
+        super().__init__()
+        self.signals = PreviewDownloadSignals()
+        self.docs_api = docs_api
+        self.doc_id = doc_id
+        self.cache_dir = cache_dir
+        self.filename = filename
+        self.cancel_event = cancel_event
+
+    def run(self):
+        if self.cancel_event.is_set():
+            return
+        try:
+            cache_name = safe_cache_filename(self.doc_id, self.filename)
+            cached_path = os.path.join(self.cache_dir, cache_name)
+            try:
+                cached = os.stat(cached_path).st_size > 0
+            except OSError:
+                cached = False
+            if cached:
+                logger.info(f"Vorschau aus Cache: {cached_path}")
+                result = cached_path
+            else:
+                result = self.docs_api.download(
+                    self.doc_id, self.cache_dir,
+                    filename_override=cache_name,
+                    cancel_event=self.cancel_event)
+        except Exception as e:
+            if not self.cancel_event.is_set():
+                self.signals.download_error.emit(str(e))
+            return
+        if not self.cancel_event.is_set():
+            self.signals.download_finished.emit(result)
+
+
+def resolve_target_names(filenames: List[str], target_dir: str) -> List[str]:
+    """Legt die endgueltigen Dateinamen eines Download-Stapels fest.
+
+    Geprueft wird gegen die im Zielordner vorhandenen Dateien und die bereits
+    vergebenen Namen des Stapels (Suffix _1, _2, ... wie in
+    DocumentsAPI.download). Muss vor dem Start paralleler Downloads laufen:
+    deren eigene Existenzpruefung sieht noch als .part geschriebene Dateien
+    nicht und wuerde denselben Namen doppelt vergeben.
+    """
+    try:
+        taken = {name.lower() for name in os.listdir(target_dir)}
+    except OSError:
+        taken = set()
+    result = []
+    for fname in filenames:
+        base, ext = os.path.splitext(fname)
+        candidate, counter = fname, 1
+        while candidate.lower() in taken:
+            candidate = f"{base}_{counter}{ext}"
+            counter += 1
+        taken.add(candidate.lower())
+        result.append(candidate)
+    return result
+
+
 class MultiDownloadWorker(QThread):
     """Worker zum Herunterladen mehrerer Dateien via DownloadDocument UseCase.
 
@@ -367,6 +461,9 @@ class MultiDownloadWorker(QThread):
     all_finished = Signal(int, int, list, list)
     progress = Signal(int, int, str)
 
+    # Anzahl gleichzeitig laufender Downloads (aktuell + vorausgeladen)
+    PREFETCH_DEPTH = 2
+
     def __init__(self, repository, documents: list, target_dir: str):
         super().__init__()
         self._repo = repository
@@ -378,40 +475,62 @@ class MultiDownloadWorker(QThread):
         self._cancelled = True
 
     def run(self):
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
         from usecases.archive.download_document import DownloadDocument
         uc = DownloadDocument(self._repo)
 
-        erfolge = 0
-        fehler = 0
-        fehler_liste = []
-        erfolgreiche_doc_ids = []
+        self._erfolge = 0
+        self._fehler = 0
+        self._fehler_liste = []
+        self._erfolgreiche_doc_ids = []
         total = len(self.documents)
 
-        for i, doc in enumerate(self.documents):
-            if self._cancelled:
-                break
+        # Zielnamen vorab festlegen, damit parallele Downloads nie dieselbe
+        # Datei treffen (auch nicht nach der Suffix-Vergabe)
+        filenames = resolve_target_names(
+            [doc.original_filename for doc in self.documents], self.target_dir,
+        )
+
+        # Pipeline: waehrend ein Dokument auf Platte geschrieben wird, laeuft
+        # bereits der Request fuers naechste (max. PREFETCH_DEPTH gleichzeitig).
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.PREFETCH_DEPTH) as executor:
+            for i, (doc, filename) in enumerate(zip(self.documents, filenames)):
+                if self._cancelled:
+                    break
 
-            self.progress.emit(i + 1, total, doc.original_filename)
+                if len(pending) >= self.PREFETCH_DEPTH:
+                    self._collect(*pending.popleft())
 
-            try:
-                result = uc.execute(doc, self.target_dir)
-                if result.success:
-                    self.file_finished.emit(doc.id, doc.original_filename, result.saved_path)
-                    erfolgreiche_doc_ids.append(doc.id)
-                    erfolge += 1
-                else:
-                    from i18n.de import WORKER_DOWNLOAD_FAILED
-                    error_msg = result.error or WORKER_DOWNLOAD_FAILED
-                    self.file_error.emit(doc.id, doc.original_filename, error_msg)
-                    fehler_liste.append(f"{doc.original_filename}: {error_msg}")
-                    fehler += 1
-            except Exception as e:
-                error_msg = str(e)
-                self.file_error.emit(doc.id, doc.original_filename, error_msg)
-                fehler_liste.append(f"{doc.original_filename}: {error_msg}")
-                fehler += 1
+                self.progress.emit(i + 1, total, doc.original_filename)
+                pending.append((doc, executor.submit(
+                    uc.execute, doc, self.target_dir, filename=filename,
+                )))
 
-        self.all_finished.emit(erfolge, fehler, fehler_liste, erfolgreiche_doc_ids)
+            while pending:
+                self._collect(*pending.popleft())
+
+        self.all_finished.emit(
+            self._erfolge, self._fehler, self._fehler_liste, self._erfolgreiche_doc_ids,
+        )
+
+    def _collect(self, doc, future):
+        """Wertet einen abgeschlossenen Download aus und emittiert die Signale."""
+        try:
+            result = future.result()
+            if result.success:
+                self.file_finished.emit(doc.id, doc.original_filename, result.saved_path)
+                self._erfolgreiche_doc_ids.append(doc.id)
+                self._erfolge += 1
+                return
+            from i18n.de import WORKER_DOWNLOAD_FAILED
+            error_msg = result.error or WORKER_DOWNLOAD_FAILED
+        except Exception as e:
+            error_msg = str(e)
+        self.file_error.emit(doc.id, doc.original_filename, error_msg)
+        self._fehler_liste.append(f"{doc.original_filename}: {error_msg}")
+        self._fehler += 1
 
 
 class BoxDownloadWorker(QThread):
@@ -870,94 +989,118 @@ class AIRenameWorker(QThread):
     2. Stufe 1 (Triage): Schnelle Kategorisierung mit GPT-4o-mini
     3. Stufe 2 (Detail): Detailanalyse mit GPT-4o nur bei Bedarf
     4. Umbenennung auf Server (via Repository)
+
+    Dokumente werden in Bloecken von ``batch_size`` parallel verarbeitet,
+    damit sich die Latenzen der KI-Requests ueberlappen. Die globale
+    KI-Semaphore (get_ai_semaphore) begrenzt die Last weiterhin.
     """
     finished = Signal(list)
     progress = Signal(int, int, str)
     single_finished = Signal(int, bool, str)
     error = Signal(str)
 
-    def __init__(self, api_client: APIClient, repository, documents: List):
+    DEFAULT_BATCH_SIZE = 4
+    # Mindestabstand zwischen progress-Signalen (~30 Hz), das letzte kommt immer
+    PROGRESS_MIN_INTERVAL = 0.033
+
+    def __init__(self, api_client: APIClient, repository, documents: List,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
         super().__init__()
         self.api_client = api_client
         self._repo = repository
         self.documents = documents
+        self.batch_size = max(1, batch_size)
         self._cancelled = False
 
     def cancel(self):
         self._cancelled = True
 
-    def run(self):
-        from api.openrouter import OpenRouterClient, DocumentClassification
+    def _rename_single(self, openrouter, doc) -> tuple:
+        """Verarbeitet ein Dokument und liefert (doc_id, success, result)."""
+        if doc.ai_renamed:
+            logger.info(f"Ueberspringe bereits umbenanntes Dokument: {doc.original_filename}")
+            return (doc.id, True, doc.original_filename)
 
-        results = []
-        total = len(self.documents)
+        if not doc.is_pdf:
+            logger.info(f"Ueberspringe Nicht-PDF: {doc.original_filename}")
+            return (doc.id, True, doc.original_filename)
 
         try:
-            openrouter = OpenRouterClient(self.api_client)
+            temp_dir = tempfile.mkdtemp(prefix='bipro_ai_')
+            pdf_path = self._repo.download(
+                doc.id, temp_dir, filename_override=doc.original_filename,
+            )
 
-            for i, doc in enumerate(self.documents):
-                if self._cancelled:
-                    logger.info("KI-Benennung abgebrochen")
-                    break
+            if not pdf_path or not os.path.exists(pdf_path):
+                raise Exception("Download fehlgeschlagen")
 
-                self.progress.emit(i + 1, total, doc.original_filename)
-                logger.info(f"Verarbeite {i+1}/{total}: {doc.original_filename}")
+            classification = openrouter.classify_pdf_smart(pdf_path)
+            logger.info(f"Klassifikation: {classification.target_box} ({classification.confidence})")
 
-                if doc.ai_renamed:
-                    logger.info(f"Ueberspringe bereits umbenanntes Dokument: {doc.original_filename}")
-                    results.append((doc.id, True, doc.original_filename))
-                    self.single_finished.emit(doc.id, True, doc.original_filename)
-                    continue
+            original_ext = os.path.splitext(doc.original_filename)[1] or '.pdf'
+            new_filename = classification.generate_filename(original_ext)
 
-                if not doc.is_pdf:
-                    logger.info(f"Ueberspringe Nicht-PDF: {doc.original_filename}")
-                    results.append((doc.id, True, doc.original_filename))
-                    self.single_finished.emit(doc.id, True, doc.original_filename)
-                    continue
+            success = self._repo.rename_document(
+                doc.id, new_filename, mark_ai_renamed=True,
+            )
 
-                try:
-                    temp_dir = tempfile.mkdtemp(prefix='bipro_ai_')
-                    pdf_path = self._repo.download(
-                        doc.id, temp_dir, filename_override=doc.original_filename,
-                    )
+            if not success:
+                raise Exception("Server-Update fehlgeschlagen")
+            logger.info(f"Umbenannt: {doc.original_filename} -> {new_filename}")
+
+            try:
+                os.unlink(pdf_path)
+                os.rmdir(temp_dir)
+            except OSError:
+                pass
 
-                    if not pdf_path or not os.path.exists(pdf_path):
-                        raise Exception("Download fehlgeschlagen")
+            return (doc.id, True, new_filename)
 
-                    classification = openrouter.classify_pdf_smart(pdf_path)
-                    logger.info(f"Klassifikation: {classification.target_box} ({classification.confidence})")
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Fehler bei {doc.original_filename}: {error_msg}")
 
-                    original_ext = os.path.splitext(doc.original_filename)[1] or '.pdf'
-                    new_filename = classification.generate_filename(original_ext)
+            try:
+                self._repo.update(doc.id, ai_processing_error=error_msg[:500])
+            except Exception:
+                pass
 
-                    success = self._repo.rename_document(
-                        doc.id, new_filename, mark_ai_renamed=True,
-                    )
+            return (doc.id, False, error_msg)
 
-                    if success:
-                        logger.info(f"Umbenannt: {doc.original_filename} -> {new_filename}")
-                        results.append((doc.id, True, new_filename))
-                        self.single_finished.emit(doc.id, True, new_filename)
-                    else:
-                        raise Exception("Server-Update fehlgeschlagen")
+    def run(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from api.openrouter import OpenRouterClient, DocumentClassification
 
-                    try:
-                        os.unlink(pdf_path)
-                        os.rmdir(temp_dir)
-                    except OSError:
-                        pass
+        results = []
+        total = len(self.documents)
+        done = 0
+        last_progress = 0.0
 
-                except Exception as e:
-                    error_msg = str(e)
-                    logger.error(f"Fehler bei {doc.original_filename}: {error_msg}")
+        try:
+            openrouter = OpenRouterClient(self.api_client)
 
-                    try:
-                        self._repo.update(doc.id, ai_processing_error=error_msg[:500])
-                    except Exception:
-                        pass
+            with ThreadPoolExecutor(max_workers=self.batch_size) as executor:
+                for start in range(0, total, self.batch_size):
+                    if self._cancelled:
+                        logger.info("KI-Benennung abgebrochen")
+                        break
 
-                    results.append((doc.id, False, error_msg))
-                    self.single_finished.emit(doc.id, False, error_msg)
+                    batch = self.documents[start:start + self.batch_size]
+                    logger.info(
+                        f"Verarbeite {start + 1}-{start + len(batch)}/{total}"
+                    )
+                    # map() liefert die Ergebnisse in Eingabe-Reihenfolge
+                    for doc, result in zip(
+                        batch,
+                        executor.map(lambda d: self._rename_single(openrouter, d), batch),
+                    ):
+                        done += 1
+                        now = time.monotonic()
+                        if done == total or now - last_progress >= self.PROGRESS_MIN_INTERVAL:
+                            last_progress = now
+                            self.progress.emit(done, total, doc.original_filename)
+                        results.append(result)
+                        self.single_finished.emit(*result)
 
             self.finished.emit(results)
 
@@ -972,6 +1115,9 @@ __all__ = [
     'MissingAiDataWorker',
     'MultiUploadWorker',
     'PreviewDownloadWorker',
+    'PreviewDownloadSignals',
+    'PreviewDownloadRunnable',
+    'get_preview_pool',
     'MultiDownloadWorker',
     'BoxDownloadWorker',
     'CreditsWorker',
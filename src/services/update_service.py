@@ -10,6 +10,8 @@ import hashlib
 import tempfile
 import subprocess
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -36,6 +38,11 @@ PINNED_CERT_HASHES = [
     # Bis dahin: Pinning deaktiviert (nur verify=True)
 ]
 
+# Segmentierter Download: Anzahl paralleler Range-Requests und Mindestgroesse,
+# ab der sich die Aufteilung lohnt (darunter ein einzelner Stream)
+DOWNLOAD_PARALLEL_SEGMENTS = 4
+DOWNLOAD_PARALLEL_MIN_SIZE = 8 * 1024 * 1024
+
 
 @dataclass
 class UpdateInfo:
@@ -143,8 +150,8 @@ class UpdateService:
         # Alte Downloads bereinigen
         self._cleanup_old_downloads()
         
-        filename = f"ACENCIA-ATLAS-Setup-{update_info.latest_version}.exe"
-        target_path = Path(UPDATE_TEMP_DIR) / filename
+        target_path = self._installer_path(update_info)
+        part_path = self._part_path(target_path)
         
         logger.info(f"Lade Update herunter: {update_info.download_url} -> {target_path}")
         
@@ -161,7 +168,7 @@ class UpdateService:
             downloaded = 0
             sha256_hash = hashlib.sha256()
             
-            with open(target_path, 'wb') as f:
+            with open(part_path, 'wb') as f:
                 for chunk in response.iter_content(chunk_size=65536):
                     if chunk:
                         f.write(chunk)
@@ -176,8 +183,6 @@ class UpdateService:
             if update_info.sha256:
                 computed_hash = sha256_hash.hexdigest()
                 if computed_hash.lower() != update_info.sha256.lower():
-                    # Datei loeschen bei Hash-Mismatch
-                    target_path.unlink(missing_ok=True)
                     logger.error(
                         f"SHA256-Mismatch! Erwartet: {update_info.sha256}, "
                         f"Berechnet: {computed_hash}"
@@ -185,12 +190,201 @@ class UpdateService:
                     raise UpdateDownloadError("SHA256-Hash stimmt nicht ueberein")
                 logger.info("SHA256-Verifikation erfolgreich")
             
+            # Erst die vollstaendige, gepruefte Datei erhaelt den Installer-Namen
+            os.replace(part_path, target_path)
+            self._mark_complete(target_path, downloaded)
             return target_path
             
         except requests.RequestException as e:
             logger.error(f"Download-Fehler: {e}")
-            target_path.unlink(missing_ok=True)
             raise UpdateDownloadError(f"Download fehlgeschlagen: {e}")
+        finally:
+            part_path.unlink(missing_ok=True)
+    
+    def download_update_parallel(
+        self,
+        update_info: UpdateInfo,
+        parallel: int = DOWNLOAD_PARALLEL_SEGMENTS,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Path:
+        """
+        Laedt den Installer in parallelen HTTP-Range-Segmenten herunter.
+        
+        Jedes Segment schreibt an seinen Offset in eine vorab angelegte
+        .part-Datei; erst nach Groessen- und Hash-Pruefung wird sie auf den
+        Installer-Namen umbenannt. Schlaegt ein Segment fehl, brechen die
+        uebrigen beim naechsten Chunk ab. Unterstuetzt der Server keine
+        Ranges (oder ist die Datei klein), wird auf download_update()
+        zurueckgefallen.
+        
+        Args:
+            update_info: UpdateInfo mit download_url und sha256
+            parallel: Anzahl gleichzeitiger Segmente
+            progress_callback: Optional - wird mit (bytes_downloaded, total_bytes)
+                aufgerufen (serialisiert, auch wenn mehrere Segmente laufen)
+            
+        Returns:
+            Pfad zur heruntergeladenen Datei
+            
+        Raises:
+            UpdateDownloadError: Bei Download-/Verifikationsfehler
+        """
+        try:
+            head = requests.head(
+                update_info.download_url,
+                allow_redirects=True,
+                timeout=30,
+                verify=True
+            )
+            head.raise_for_status()
+            total_size = int(head.headers.get('content-length', 0))
+            accepts_ranges = head.headers.get('accept-ranges', '').lower() == 'bytes'
+        except (requests.RequestException, ValueError) as e:
+            logger.debug(f"HEAD fuer Range-Download fehlgeschlagen: {e}")
+            total_size, accepts_ranges = 0, False
+        
+        if (parallel < 2 or not accepts_ranges
+                or total_size < DOWNLOAD_PARALLEL_MIN_SIZE
+                or (update_info.file_size and update_info.file_size != total_size)):
+            return self.download_update(update_info, progress_callback=progress_callback)
+        
+        os.makedirs(UPDATE_TEMP_DIR, exist_ok=True)
+        self._cleanup_old_downloads()
+        target_path = self._installer_path(update_info)
+        part_path = self._part_path(target_path)
+        
+        logger.info(
+            f"Lade Update in {parallel} Segmenten herunter: "
+            f"{update_info.download_url} -> {target_path}"
+        )
+        
+        # .part-Datei vorab auf Endgroesse bringen, Segmente schreiben an ihren Offset
+        try:
+            with open(part_path, 'wb') as f:
+                f.truncate(total_size)
+        except OSError as e:
+            raise UpdateDownloadError(f"Download fehlgeschlagen: {e}")
+        
+        segment_size = -(-total_size // parallel)
+        ranges = [
+            (start, min(start + segment_size, total_size) - 1)
+            for start in range(0, total_size, segment_size)
+        ]
+        lock = threading.Lock()
+        failed = threading.Event()
+        downloaded = 0
+        
+        def fetch(byte_range):
+            nonlocal downloaded
+            start, end = byte_range
+            response = requests.get(
+                update_info.download_url,
+                headers={'Range': f'bytes={start}-{end}'},
+                stream=True,
+                timeout=300,
+                verify=True
+            )
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise UpdateDownloadError("Server ignoriert Range-Anfrage")
+            written = 0
+            with open(part_path, 'r+b') as f:
+                f.seek(start)
+                for chunk in response.iter_content(chunk_size=65536):
+                    if failed.is_set():
+                        return
+                    if chunk:
+                        f.write(chunk)
+                        written += len(chunk)
+                        with lock:
+                            downloaded += len(chunk)
+                            if progress_callback:
+                                progress_callback(downloaded, total_size)
+            if written != end - start + 1:
+                raise UpdateDownloadError(
+                    f"Segment {start}-{end} unvollstaendig: {written} Bytes"
+                )
+        
+        try:
+            try:
+                with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                    futures = [pool.submit(fetch, r) for r in ranges]
+                    # Beim ersten Fehler sofort die uebrigen Segmente stoppen
+                    done, _pending = wait(futures, return_when=FIRST_EXCEPTION)
+                    for future in done:
+                        if future.exception() is not None:
+                            failed.set()
+                            raise future.exception()
+            except (requests.RequestException, UpdateDownloadError, OSError) as e:
+                logger.error(f"Download-Fehler: {e}")
+                raise UpdateDownloadError(f"Download fehlgeschlagen: {e}")
+            
+            if downloaded != total_size:
+                raise UpdateDownloadError(
+                    f"Download unvollstaendig: {downloaded} von {total_size} Bytes"
+                )
+            
+            logger.info(f"Download abgeschlossen: {downloaded} Bytes")
+            
+            # SHA256-Verifikation (Segmente kommen ungeordnet, daher ueber die Datei)
+            if update_info.sha256:
+                computed_hash = self._file_sha256(part_path)
+                if computed_hash.lower() != update_info.sha256.lower():
+                    logger.error(
+                        f"SHA256-Mismatch! Erwartet: {update_info.sha256}, "
+                        f"Berechnet: {computed_hash}"
+                    )
+                    raise UpdateDownloadError("SHA256-Hash stimmt nicht ueberein")
+                logger.info("SHA256-Verifikation erfolgreich")
+            
+            # Erst die vollstaendige, gepruefte Datei erhaelt den Installer-Namen
+            os.replace(part_path, target_path)
+            self._mark_complete(target_path, downloaded)
+        finally:
+            part_path.unlink(missing_ok=True)
+        
+        return target_path
+    
+    def get_cached_installer(self, update_info: UpdateInfo) -> Optional[Path]:
+        """
+        Liefert einen bereits vollstaendig geladenen Installer fuer diese Version.
+        
+        Ein Treffer muss ueber SHA256 verifizierbar sein. Ist kein Hash
+        bekannt, genuegt nur die Abschluss-Markierung eines fertigen
+        Downloads (mit passender Groesse) - die Groesse allein beweist
+        nicht, dass alle Bytes angekommen sind.
+        
+        Args:
+            update_info: UpdateInfo der gewuenschten Version
+            
+        Returns:
+            Pfad zum Installer oder None wenn neu geladen werden muss
+        """
+        target_path = self._installer_path(update_info)
+        try:
+            size = target_path.stat().st_size
+        except OSError:
+            return None
+        if update_info.file_size and size != update_info.file_size:
+            return None
+        
+        if update_info.sha256:
+            try:
+                computed_hash = self._file_sha256(target_path)
+            except OSError:
+                return None
+            if computed_hash.lower() != update_info.sha256.lower():
+                return None
+        else:
+            try:
+                marked_size = int(self._complete_marker(target_path).read_text().strip())
+            except (OSError, ValueError):
+                return None
+            if marked_size != size:
+                return None
+        
+        logger.info(f"Verwende bereits geladenen Installer: {target_path}")
+        return target_path
     
     def install_update(self, installer_path: Path,
                        launch_after_install: bool = True) -> None:
@@ -226,6 +420,39 @@ class UpdateService:
             logger.error(f"Installer konnte nicht gestartet werden: {e}")
             raise UpdateDownloadError(f"Installation fehlgeschlagen: {e}")
     
+    @staticmethod
+    def _installer_path(update_info: UpdateInfo) -> Path:
+        """Zielpfad des Installers fuer eine Version."""
+        filename = f"ACENCIA-ATLAS-Setup-{update_info.latest_version}.exe"
+        return Path(UPDATE_TEMP_DIR) / filename
+    
+    @staticmethod
+    def _part_path(target_path: Path) -> Path:
+        """Temporaerer Pfad, unter dem ein Download bis zur Pruefung liegt."""
+        return target_path.with_name(target_path.name + '.part')
+    
+    @staticmethod
+    def _complete_marker(target_path: Path) -> Path:
+        """Markierung eines abgeschlossenen Downloads (enthaelt die Bytezahl)."""
+        return target_path.with_name(target_path.name + '.complete')
+    
+    def _mark_complete(self, target_path: Path, size: int) -> None:
+        """Haelt fest, dass target_path vollstaendig geladen wurde."""
+        try:
+            self._complete_marker(target_path).write_text(str(size))
+        except OSError as e:
+            # Ohne Markierung wird nur nicht wiederverwendet (ausser per SHA256)
+            logger.debug(f"Download-Markierung nicht geschrieben: {e}")
+    
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        """SHA256 einer Datei, blockweise gelesen."""
+        sha256_hash = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha256_hash.update(chunk)
+        return sha256_hash.hexdigest()
+    
     def _cleanup_old_downloads(self) -> None:
         """Loescht alte heruntergeladene Installer."""
         try:
@@ -233,7 +460,7 @@ class UpdateService:
                 return
             for f in os.listdir(UPDATE_TEMP_DIR):
                 filepath = os.path.join(UPDATE_TEMP_DIR, f)
-                if os.path.isfile(filepath) and f.endswith('.exe'):
+                if os.path.isfile(filepath) and f.endswith(('.exe', '.exe.part', '.exe.complete')):
                     try:
                         os.unlink(filepath)
                         logger.debug(f"Alter Download geloescht: {f}")
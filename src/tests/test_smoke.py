@@ -341,6 +341,17 @@ class TestDocumentDataclass:
         assert doc.version == 3
         assert doc.previous_version_id == 41
         assert doc.classification_source == 'rule_bipro'
+    
+    def test_document_ai_state(self):
+        """Document.ai_state liefert den KI-Status in Prioritaetsreihenfolge."""
+        from api.documents import Document
+        
+        base = {'id': 1, 'filename': 'a.pdf'}
+        assert Document.from_dict({**base, 'ai_renamed': 1,
+                                   'ai_processing_error': 'x'}).ai_state == 'renamed'
+        assert Document.from_dict({**base, 'ai_processing_error': 'x'}).ai_state == 'error'
+        assert Document.from_dict(base).ai_state == 'pending'
+        assert Document.from_dict({'id': 2, 'filename': 'a.txt'}).ai_state == 'na'
 
 
 # ==============================================================================
@@ -0,0 +1,171 @@
+"""
+Tests fuer den Installer-Download des UpdateService.
+
+Prueft den segmentierten Download mit gemockten requests.head/requests.get
+(206-Antworten, verkuerztes Segment, Server ohne Range-Support) sowie die
+Wiederverwendung bereits geladener Installer.
+
+Ausfuehrung:
+    python -m pytest src/tests/test_update_service.py -v
+"""
+
+import hashlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+PAYLOAD = bytes(range(256)) * 64  # 16 KiB
+
+
+class _FakeResponse:
+    """Minimaler Ersatz fuer requests.Response (nur was der Service nutzt)."""
+
+    def __init__(self, body: bytes, status_code: int = 200, headers: dict = None):
+        self._body = body
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=65536):
+        for i in range(0, len(self._body), 1024):
+            yield self._body[i:i + 1024]
+
+
+def _fake_get(short_segment_start=None, ignore_range=False):
+    """requests.get-Ersatz, der Range-Header wie ein Server auswertet."""
+
+    def get(url, headers=None, **kwargs):
+        range_header = (headers or {}).get('Range')
+        if not range_header or ignore_range:
+            return _FakeResponse(PAYLOAD, 200)
+        start, end = (int(x) for x in range_header.split('=')[1].split('-'))
+        body = PAYLOAD[start:end + 1]
+        if start == short_segment_start:
+            body = body[:len(body) // 2]
+        return _FakeResponse(body, 206)
+
+    return get
+
+
+def _head(accept_ranges: bool = True):
+    headers = {'content-length': str(len(PAYLOAD))}
+    if accept_ranges:
+        headers['accept-ranges'] = 'bytes'
+    return MagicMock(return_value=_FakeResponse(b'', 200, headers))
+
+
+class TestParallelDownload:
+    """download_update_parallel mit gemocktem HTTP."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        import services.update_service as us
+
+        with patch.object(us, 'UPDATE_TEMP_DIR', str(tmp_path)), \
+                patch.object(us, 'DOWNLOAD_PARALLEL_MIN_SIZE', 1024):
+            yield us.UpdateService(MagicMock())
+
+    @staticmethod
+    def _info(sha256=''):
+        from services.update_service import UpdateInfo
+
+        return UpdateInfo(
+            current_version='1.0.0', latest_version='9.9.9',
+            update_available=True, mandatory=False, deprecated=False,
+            download_url='https://example.invalid/setup.exe',
+            sha256=sha256, file_size=len(PAYLOAD),
+        )
+
+    def test_segments_are_assembled_in_order(self, service, tmp_path):
+        sha = hashlib.sha256(PAYLOAD).hexdigest()
+        with patch('services.update_service.requests.head', _head()), \
+                patch('services.update_service.requests.get', side_effect=_fake_get()) as get:
+            path = service.download_update_parallel(self._info(sha), parallel=4)
+
+        assert path.read_bytes() == PAYLOAD
+        assert get.call_count == 4
+        assert not list(tmp_path.glob('*.part'))
+
+    def test_short_segment_fails_without_leaving_installer(self, service, tmp_path):
+        from services.update_service import UpdateDownloadError
+
+        with patch('services.update_service.requests.head', _head()), \
+                patch('services.update_service.requests.get',
+                      side_effect=_fake_get(short_segment_start=len(PAYLOAD) // 4)):
+            with pytest.raises(UpdateDownloadError):
+                service.download_update_parallel(self._info(), parallel=4)
+
+        assert list(tmp_path.iterdir()) == []
+        assert service.get_cached_installer(self._info()) is None
+
+    def test_range_request_ignored_by_server(self, service, tmp_path):
+        from services.update_service import UpdateDownloadError
+
+        with patch('services.update_service.requests.head', _head()), \
+                patch('services.update_service.requests.get',
+                      side_effect=_fake_get(ignore_range=True)):
+            with pytest.raises(UpdateDownloadError):
+                service.download_update_parallel(self._info(), parallel=4)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_server_without_range_support_uses_single_stream(self, service):
+        with patch('services.update_service.requests.head', _head(accept_ranges=False)), \
+                patch('services.update_service.requests.get', side_effect=_fake_get()) as get:
+            path = service.download_update_parallel(self._info(), parallel=4)
+
+        assert path.read_bytes() == PAYLOAD
+        get.assert_called_once()
+        assert 'headers' not in get.call_args.kwargs
+
+    def test_installer_name_appears_only_after_verification(self, service):
+        info = self._info(hashlib.sha256(PAYLOAD).hexdigest())
+        target = service._installer_path(info)
+        seen_during_download = []
+        get = _fake_get()
+
+        def recording_get(url, **kwargs):
+            seen_during_download.append(target.exists())
+            return get(url, **kwargs)
+
+        with patch('services.update_service.requests.head', _head()), \
+                patch('services.update_service.requests.get', side_effect=recording_get):
+            service.download_update_parallel(info, parallel=4)
+
+        assert seen_during_download == [False] * 4
+        assert target.exists()
+
+
+class TestCachedInstaller:
+    """get_cached_installer darf nur vollstaendige Downloads wiederverwenden."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        import services.update_service as us
+
+        with patch.object(us, 'UPDATE_TEMP_DIR', str(tmp_path)), \
+                patch.object(us, 'DOWNLOAD_PARALLEL_MIN_SIZE', 1024):
+            yield us.UpdateService(MagicMock())
+
+    def test_matching_size_without_hash_or_marker_is_not_reused(self, service):
+        info = TestParallelDownload._info()
+        service._installer_path(info).write_bytes(b'\0' * len(PAYLOAD))
+
+        assert service.get_cached_installer(info) is None
+
+    def test_completed_download_without_hash_is_reused(self, service):
+        info = TestParallelDownload._info()
+        with patch('services.update_service.requests.head', _head()), \
+                patch('services.update_service.requests.get', side_effect=_fake_get()):
+            path = service.download_update_parallel(info, parallel=4)
+
+        assert service.get_cached_installer(info) == path
+
+    def test_hash_mismatch_is_not_reused(self, service):
+        info = TestParallelDownload._info(hashlib.sha256(PAYLOAD).hexdigest())
+        service._installer_path(info).write_bytes(b'\0' * len(PAYLOAD))
+
+        assert service.get_cached_installer(info) is None
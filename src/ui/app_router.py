@@ -888,6 +888,7 @@ class AppRouter(QMainWindow):
             self._stop_active_module_heartbeat()
             if hasattr(self, '_tray_icon'):
                 self._tray_icon.hide()
+            self.api_client.close()
             event.accept()
             QApplication.instance().quit()
             return
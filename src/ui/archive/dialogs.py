@@ -7,6 +7,8 @@ Enthaelt SmartScanDialog und DuplicateCompareDialog.
 import os
 import tempfile
 import logging
+import threading
+from functools import lru_cache
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
@@ -14,9 +16,23 @@ from PySide6.QtWidgets import (
     QMenu, QMessageBox,
 )
 from ui.toast import ToastManager
-from PySide6.QtCore import Qt, Signal, QTimer, QThread
+from PySide6.QtCore import Qt, Signal, QTimer, QThread, QCoreApplication, QObject
 
-from api.documents import Document
+from api.documents import Document, BOX_DISPLAY_NAMES, safe_cache_filename
+from i18n.de import (
+    DOC_COLOR_BLUE, DOC_COLOR_CYAN, DOC_COLOR_GREEN, DOC_COLOR_ORANGE, DOC_COLOR_PINK,
+    DOC_COLOR_PURPLE, DOC_COLOR_RED, DOC_COLOR_REMOVE, DOC_COLOR_YELLOW,
+    DUPLICATE_COMPARE_ACTION_ARCHIVE, DUPLICATE_COMPARE_ACTION_COLOR,
+    DUPLICATE_COMPARE_ACTION_DELETE, DUPLICATE_COMPARE_ACTION_MOVE,
+    DUPLICATE_COMPARE_ACTION_UNARCHIVE, DUPLICATE_COMPARE_ARCHIVED,
+    DUPLICATE_COMPARE_CLOSE, DUPLICATE_COMPARE_COLORED,
+    DUPLICATE_COMPARE_COLOR_REMOVED, DUPLICATE_COMPARE_CONFIRM_DELETE,
+    DUPLICATE_COMPARE_COUNTERPART, DUPLICATE_COMPARE_COUNTERPART_OF_COPY,
+    DUPLICATE_COMPARE_DELETED, DUPLICATE_COMPARE_ERROR, DUPLICATE_COMPARE_INCOMPLETE,
+    DUPLICATE_COMPARE_LOADING,
+    DUPLICATE_COMPARE_MOVED, DUPLICATE_COMPARE_NO_PREVIEW, DUPLICATE_COMPARE_THIS_DOC,
+    DUPLICATE_COMPARE_TITLE, DUPLICATE_COMPARE_UNARCHIVED, DUPLICATE_TOOLTIP_ARCHIVED,
+)
 from ui.styles.tokens import (
     PRIMARY_900,
     TEXT_PRIMARY, TEXT_SECONDARY, TEXT_DISABLED, TEXT_INVERSE,
@@ -38,6 +54,130 @@ except ImportError:
 
 from utils.date_utils import format_date_german
 
+# Datum/Groesse wiederholen sich bei Duplikaten aus demselben Batch stark
+_fmt_date = lru_cache(maxsize=2048)(format_date_german)
+
+
+@lru_cache(maxsize=1024)
+def _fmt_size(size: int) -> str:
+    """Formatiert eine Dateigroesse in KB bzw. MB."""
+    size_kb = size / 1024
+    if size_kb >= 1024:
+        return f"{size_kb / 1024:.1f} MB"
+    return f"{size_kb:.0f} KB"
+
+# Stylesheets des Duplikat-Vergleichs (einmal beim Import aufgebaut)
+_QSS_FOOTER = f"QFrame {{ background: {BG_TERTIARY}; border-top: 1px solid {BORDER_DEFAULT}; }}"
+_QSS_CLOSE_BTN = f"""
+QPushButton {{
+    background: {PRIMARY_900}; color: {TEXT_INVERSE}; border: none;
+    padding: 8px 16px; border-radius: 4px; font-weight: bold;
+}}
+QPushButton:hover {{ background: {PRIMARY_900}; }}
+"""
+_QSS_SECTION_LABEL = f"font-size: 11px; color: {TEXT_DISABLED}; font-weight: bold; text-transform: uppercase;"
+_QSS_NAME_LABEL = f"font-size: 14px; font-weight: bold; color: {TEXT_PRIMARY};"
+_QSS_META_LABEL = f"font-size: 11px; color: {TEXT_SECONDARY};"
+_QSS_ID_LABEL = f"font-size: 10px; color: {TEXT_DISABLED};"
+_QSS_PREVIEW_CONTAINER = f"QFrame {{ background: {BG_TERTIARY}; border: 1px solid {BORDER_DEFAULT}; border-radius: 4px; }}"
+_QSS_LOADING_LABEL = f"color: {TEXT_DISABLED}; font-size: 12px; padding: 40px;"
+_QSS_NO_PREVIEW = f"color: {TEXT_DISABLED}; font-size: 13px; padding: 60px; font-style: italic;"
+_QSS_STATUS_LABEL = f"""
+font-size: 14px; font-weight: bold; color: {ERROR};
+padding: 8px; background: {ERROR_LIGHT}; border: 1px solid {ERROR_LIGHT};
+border-radius: 4px;
+"""
+_QSS_DELETE_BTN = f"""
+QPushButton {{
+    background: {ERROR_LIGHT}; color: {ERROR}; border: 1px solid {ERROR_LIGHT};
+    padding: 6px 12px; border-radius: 3px; font-size: 11px;
+}}
+QPushButton:hover {{ background: {ERROR_LIGHT}; }}
+QPushButton:disabled {{ background: {BG_TERTIARY}; color: {TEXT_DISABLED}; border: 1px solid {BORDER_DEFAULT}; }}
+"""
+_QSS_ARCHIVE_BTN = f"""
+QPushButton {{
+    background: {WARNING_LIGHT}; color: {AMBER}; border: 1px solid {WARNING_LIGHT};
+    padding: 6px 12px; border-radius: 3px; font-size: 11px;
+}}
+QPushButton:hover {{ background: {WARNING_LIGHT}; }}
+QPushButton:disabled {{ background: {BG_TERTIARY}; color: {TEXT_DISABLED}; border: 1px solid {BORDER_DEFAULT}; }}
+"""
+_QSS_MOVE_BTN = f"""
+QPushButton {{
+    background: {INFO_LIGHT}; color: {PRIMARY_900}; border: 1px solid {INFO_LIGHT};
+    padding: 6px 12px; border-radius: 3px; font-size: 11px;
+}}
+QPushButton:hover {{ background: {INFO_LIGHT}; }}
+QPushButton::menu-indicator {{ subcontrol-position: right center; }}
+QPushButton:disabled {{ background: {BG_TERTIARY}; color: {TEXT_DISABLED}; border: 1px solid {BORDER_DEFAULT}; }}
+"""
+_QSS_COLOR_BTN = f"""
+QPushButton {{
+    background: {INFO_LIGHT}; color: {VIOLET}; border: 1px solid {INFO_LIGHT};
+    padding: 6px 12px; border-radius: 3px; font-size: 11px;
+}}
+QPushButton:hover {{ background: {INFO_LIGHT}; }}
+QPushButton::menu-indicator {{ subcontrol-position: right center; }}
+QPushButton:disabled {{ background: {BG_TERTIARY}; color: {TEXT_DISABLED}; border: 1px solid {BORDER_DEFAULT}; }}
+"""
+_QSS_PREVIEW_ERROR = f"color: {ERROR}; font-size: 12px; padding: 40px; font-style: italic;"
+_QSS_PANE = {
+    side: f"QFrame#pane_{side} {{ background: white; border-top: 3px solid {color}; }}"
+    for side, color in (('left', ACCENT_500), ('right', BLUE_BRIGHT))
+}
+
+
+# Laufende Prewarm-Downloads: cache_path -> PreviewDownloadSignals
+_prewarm_inflight = {}
+# Gemeinsames Abbruch-Event aller Prewarm-Downloads (gesetzt bei App-Ende)
+_prewarm_abort = threading.Event()
+_prewarm_abort_hooked = False
+
+
+def _abort_on_quit(event: threading.Event, connect: bool = True) -> None:
+    """Setzt event beim Beenden der App, damit haengende Downloads sofort abbrechen.
+    
+    Mit connect=False wird die Verbindung wieder geloest.
+    """
+    app = QCoreApplication.instance()
+    if app is None:
+        return
+    if connect:
+        app.aboutToQuit.connect(event.set)
+    else:
+        try:
+            app.aboutToQuit.disconnect(event.set)
+        except (RuntimeError, TypeError):
+            pass
+
+
+def prewarm_preview(docs_api, doc_id: int, filename: str, cache_dir: str) -> None:
+    """Laedt eine PDF-Vorschau vorab in den Cache (z.B. beim Hover auf "Vergleichen").
+    
+    Bereits gecachte oder laufende Downloads werden nicht erneut gestartet.
+    Ein spaeter geoeffneter DuplicateCompareDialog haengt sich an einen
+    laufenden Prewarm-Download an, statt selbst zu laden.
+    """
+    if not HAS_PDF_VIEW or not filename or not filename.lower().endswith('.pdf'):
+        return
+    cache_path = os.path.join(cache_dir, safe_cache_filename(doc_id, filename))
+    if cache_path in _prewarm_inflight or DuplicateCompareDialog._probe_cached(cache_path):
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    global _prewarm_abort_hooked
+    if not _prewarm_abort_hooked:
+        _abort_on_quit(_prewarm_abort)
+        _prewarm_abort_hooked = True
+    from ui.archive.workers import PreviewDownloadRunnable, get_preview_pool
+    runnable = PreviewDownloadRunnable(
+        docs_api, doc_id, cache_dir, filename, _prewarm_abort)
+    signals = runnable.signals
+    signals.download_finished.connect(lambda _p: _prewarm_inflight.pop(cache_path, None))
+    signals.download_error.connect(lambda _e: _prewarm_inflight.pop(cache_path, None))
+    _prewarm_inflight[cache_path] = signals
+    get_preview_pool().start(runnable)
+
 
 class SmartScanDialog(QDialog):
     """Dialog fuer SmartScan Versand-Konfiguration."""
@@ -186,6 +326,15 @@ class DuplicateCompareDialog(QDialog):
     # Archivierbare Boxen
     _ARCHIVABLE_BOXES = {'gdv', 'courtage', 'sach', 'leben', 'kranken', 'sonstige'}
     
+    # Sammelfenster fuer Aktionen beider Seiten (ms)
+    PENDING_OPS_FLUSH_MS = 1500
+    
+    # Wartezeit bis der Scrollbereich der Vorschau nach dem Layout geprueft wird (ms)
+    SCROLL_RANGE_CHECK_MS = 100
+    
+    # Ziele im Verschieben-Menue (Reihenfolge = Menue-Reihenfolge)
+    _MOVE_TARGETS = ('gdv', 'courtage', 'sach', 'leben', 'kranken', 'sonstige', 'eingang', 'roh')
+    
     def __init__(self, doc_left: Document, doc_right: Document,
                  docs_api: 'DocumentsAPI', preview_cache_dir: str = None, parent=None):
         super().__init__(parent)
@@ -197,28 +346,69 @@ class DuplicateCompareDialog(QDialog):
         self._has_changes = False
         self._left_disabled = False
         self._right_disabled = False
-        self._workers = []
+        # Gemeinsames Abbruch-Event fuer alle Vorschau-Downloads
+        self._cancel_event = threading.Event()
+        _abort_on_quit(self._cancel_event)
+        self._preview_signals = []
+        # Laufende Vorschau-Downloads: cache_path -> wartende Seiten
+        # (Seite oder (Seite, Link-Pfad) fuer byte-identische Dokumente)
+        self._inflight = {}
         
         # PDF-Dokument-Objekte fuer QPdfView
         self._pdf_doc_left = None
         self._pdf_doc_right = None
+        self._pdf_buffers = {}    # side -> QBuffer (muss das QPdfDocument ueberleben)
+        self._deleted_sides = set()  # Seiten, deren Dokument geloescht wurde
+        self._loading_sides = set()  # Seiten mit eigenem QPdfDocument-Ladevorgang
+        self._shared_with = {}       # ladende Seite -> Seite, die das Dokument mitnutzt
         
         # Direkte Widget-Referenzen (statt findChild)
         self._pdf_views = {}      # side -> QPdfView
+        self._multi_page_conns = {}  # side -> Verbindungen fuer den MultiPage-Wechsel
+        self._range_timers = {}   # side -> QTimer (Pruefung des Scrollbereichs)
         self._loading_labels = {} # side -> QLabel
+        self._status_labels = {}  # side -> QLabel (Status-Overlay)
+        self._action_buttons = {} # side -> [QPushButton]
         
-        from i18n.de import DUPLICATE_COMPARE_TITLE
         self.setWindowTitle(DUPLICATE_COMPARE_TITLE)
         self.setMinimumSize(1200, 700)
         self.resize(1400, 900)
         
+        # Vorgemerkte Aktionen (op, doc_id, arg), gebuendelt abgeschickt
+        self._pending_ops = []
+        self._op_workers = []
+        self._emit_changes_when_done = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.PENDING_OPS_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_pending_ops)
+        
+        self._previews_started = False
         self._setup_ui()
-        # Previews erst nach show() starten (QPdfView braucht sichtbares Fenster)
-        QTimer.singleShot(100, self._download_previews)
+    
+    def showEvent(self, event):
+        """Startet die Previews erst nach show() (QPdfView braucht sichtbares Fenster)."""
+        super().showEvent(event)
+        if self._previews_started:
+            return
+        self._previews_started = True
+        if self._all_previews_cached():
+            # Alles im Cache (z.B. per prewarm_preview): ohne Verzoegerung laden
+            self._download_previews()
+        else:
+            QTimer.singleShot(100, self._download_previews)
+    
+    def _all_previews_cached(self) -> bool:
+        """Prueft ob beide PDF-Vorschauen bereits im Cache liegen."""
+        for doc in (self._doc_left, self._doc_right):
+            if self._is_pdf(doc) and not self._probe_cached(os.path.join(
+                    self._preview_cache_dir,
+                    safe_cache_filename(doc.id, doc.original_filename))):
+                return False
+        return True
     
     def _setup_ui(self):
         """Baut das Dialog-Layout auf."""
-        from i18n.de import DUPLICATE_COMPARE_CLOSE
         
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -254,20 +444,14 @@ class DuplicateCompareDialog(QDialog):
         
         # Footer mit Schliessen-Button
         footer = QFrame()
-        footer.setStyleSheet(f"QFrame {{ background: {BG_TERTIARY}; border-top: 1px solid {BORDER_DEFAULT}; }}")
+        footer.setStyleSheet(_QSS_FOOTER)
         footer_layout = QHBoxLayout(footer)
         footer_layout.setContentsMargins(16, 8, 16, 8)
         
         footer_layout.addStretch()
         close_btn = QPushButton(DUPLICATE_COMPARE_CLOSE)
         close_btn.setFixedWidth(140)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {PRIMARY_900}; color: {TEXT_INVERSE}; border: none;
-                padding: 8px 16px; border-radius: 4px; font-weight: bold;
-            }}
-            QPushButton:hover {{ background: {PRIMARY_900}; }}
-        """)
+        close_btn.setStyleSheet(_QSS_CLOSE_BTN)
         close_btn.clicked.connect(self.close)
         footer_layout.addWidget(close_btn)
         footer_layout.addStretch()
@@ -276,26 +460,11 @@ class DuplicateCompareDialog(QDialog):
     
     def _build_document_pane(self, doc: Document, side: str, label_key: str) -> QFrame:
         """Erstellt eine Seite des Vergleichs (Header + Preview + Aktionen)."""
-        from i18n.de import (
-            DUPLICATE_COMPARE_THIS_DOC, DUPLICATE_COMPARE_COUNTERPART,
-            DUPLICATE_COMPARE_COUNTERPART_OF_COPY, DUPLICATE_COMPARE_NO_PREVIEW,
-            DUPLICATE_COMPARE_LOADING, DUPLICATE_COMPARE_ACTION_DELETE,
-            DUPLICATE_COMPARE_ACTION_ARCHIVE, DUPLICATE_COMPARE_ACTION_UNARCHIVE,
-            DUPLICATE_COMPARE_ACTION_MOVE, DUPLICATE_COMPARE_ACTION_COLOR,
-            DUPLICATE_TOOLTIP_ARCHIVED
-        )
-        from api.documents import BOX_DISPLAY_NAMES
         from html import escape
         
         pane = QFrame()
         pane.setObjectName(f"pane_{side}")
-        border_color = ACCENT_500 if side == 'left' else BLUE_BRIGHT
-        pane.setStyleSheet(f"""
-            QFrame#{pane.objectName()} {{
-                background: white;
-                border-top: 3px solid {border_color};
-            }}
-        """)
+        pane.setStyleSheet(_QSS_PANE[side])
         
         layout = QVBoxLayout(pane)
         layout.setContentsMargins(12, 12, 12, 8)
@@ -310,46 +479,40 @@ class DuplicateCompareDialog(QDialog):
             section_label = DUPLICATE_COMPARE_COUNTERPART_OF_COPY
         
         header_label = QLabel(section_label)
-        header_label.setStyleSheet(
-            f"font-size: 11px; color: {TEXT_DISABLED}; font-weight: bold; text-transform: uppercase;")
+        header_label.setStyleSheet(_QSS_SECTION_LABEL)
         layout.addWidget(header_label)
         
         # Dateiname
         name_label = QLabel(escape(doc.original_filename))
-        name_label.setStyleSheet(f"font-size: 14px; font-weight: bold; color: {TEXT_PRIMARY};")
+        name_label.setStyleSheet(_QSS_NAME_LABEL)
         name_label.setWordWrap(True)
         layout.addWidget(name_label)
         
         # Meta-Zeile: Box | Datum | Groesse | ggf. Archiviert
         box_emoji = self._BOX_EMOJIS.get(doc.box_type, '\U0001f4c1')
         box_name = BOX_DISPLAY_NAMES.get(doc.box_type, doc.box_type or '')
-        date_display = format_date_german(doc.created_at)
+        date_display = _fmt_date(doc.created_at)
         
         meta_parts = [f"{box_emoji} {escape(box_name)}"]
         if date_display:
             meta_parts.append(date_display)
         if doc.file_size:
-            size_kb = doc.file_size / 1024
-            if size_kb >= 1024:
-                meta_parts.append(f"{size_kb / 1024:.1f} MB")
-            else:
-                meta_parts.append(f"{size_kb:.0f} KB")
+            meta_parts.append(_fmt_size(doc.file_size))
         if doc.is_archived:
             meta_parts.append(f"\U0001f4e6 {DUPLICATE_TOOLTIP_ARCHIVED}")
         
         meta_label = QLabel(" | ".join(meta_parts))
-        meta_label.setStyleSheet(f"font-size: 11px; color: {TEXT_SECONDARY};")
+        meta_label.setStyleSheet(_QSS_META_LABEL)
         layout.addWidget(meta_label)
         
         # ID
         id_label = QLabel(f"ID: {doc.id}")
-        id_label.setStyleSheet(f"font-size: 10px; color: {TEXT_DISABLED};")
+        id_label.setStyleSheet(_QSS_ID_LABEL)
         layout.addWidget(id_label)
         
         # --- Vorschau-Bereich ---
         preview_container = QFrame()
-        preview_container.setStyleSheet(
-            f"QFrame {{ background: {BG_TERTIARY}; border: 1px solid {BORDER_DEFAULT}; border-radius: 4px; }}")
+        preview_container.setStyleSheet(_QSS_PREVIEW_CONTAINER)
         preview_layout = QVBoxLayout(preview_container)
         preview_layout.setContentsMargins(0, 0, 0, 0)
         
@@ -361,13 +524,28 @@ class DuplicateCompareDialog(QDialog):
             # Seite 0: Loading
             loading_label = QLabel(DUPLICATE_COMPARE_LOADING)
             loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            loading_label.setStyleSheet(f"color: {TEXT_DISABLED}; font-size: 12px; padding: 40px;")
+            loading_label.setStyleSheet(_QSS_LOADING_LABEL)
             stack.addWidget(loading_label)
             
             # Seite 1: QPdfView (sichtbar und gelayoutet von Anfang an)
+            # Erst nur eine Seite rendern; MultiPage beim ersten Scrollen
             pdf_view = QPdfView(stack)
-            pdf_view.setPageMode(QPdfView.PageMode.MultiPage)
+            pdf_view.setPageMode(QPdfView.PageMode.SinglePage)
             pdf_view.setZoomMode(QPdfView.ZoomMode.FitToWidth)
+            # Passt die erste Seite ganz, gibt es kein Scrollen: dann nach
+            # dem Layout (Bereich erst nach dem Zoom-Durchlauf stabil) umschalten
+            range_timer = QTimer(pdf_view)
+            range_timer.setSingleShot(True)
+            range_timer.setInterval(self.SCROLL_RANGE_CHECK_MS)
+            range_timer.timeout.connect(lambda s=side: self._check_scroll_range(s))
+            self._range_timers[side] = range_timer
+            scroll_bar = pdf_view.verticalScrollBar()
+            self._multi_page_conns[side] = (
+                scroll_bar.valueChanged.connect(
+                    lambda _v, s=side: self._enable_multi_page(s)),
+                scroll_bar.rangeChanged.connect(
+                    lambda _min, _max: range_timer.start()),
+            )
             stack.addWidget(pdf_view)
             
             # Loading-Seite zuerst anzeigen
@@ -381,8 +559,7 @@ class DuplicateCompareDialog(QDialog):
             # Kein PDF oder kein QPdfView
             no_preview = QLabel(DUPLICATE_COMPARE_NO_PREVIEW)
             no_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_preview.setStyleSheet(
-                f"color: {TEXT_DISABLED}; font-size: 13px; padding: 60px; font-style: italic;")
+            no_preview.setStyleSheet(_QSS_NO_PREVIEW)
             preview_layout.addWidget(no_preview)
         
         layout.addWidget(preview_container, 1)
@@ -391,13 +568,10 @@ class DuplicateCompareDialog(QDialog):
         status_label = QLabel("")
         status_label.setObjectName(f"status_{side}")
         status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        status_label.setStyleSheet(f"""
-            font-size: 14px; font-weight: bold; color: {ERROR};
-            padding: 8px; background: {ERROR_LIGHT}; border: 1px solid {ERROR_LIGHT};
-            border-radius: 4px;
-        """)
+        status_label.setStyleSheet(_QSS_STATUS_LABEL)
         status_label.setVisible(False)
         layout.addWidget(status_label)
+        self._status_labels[side] = status_label
         
         # --- Aktions-Buttons ---
         actions_frame = QFrame()
@@ -408,16 +582,10 @@ class DuplicateCompareDialog(QDialog):
         
         # Loeschen
         delete_btn = QPushButton(DUPLICATE_COMPARE_ACTION_DELETE)
-        delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {ERROR_LIGHT}; color: {ERROR}; border: 1px solid {ERROR_LIGHT};
-                padding: 6px 12px; border-radius: 3px; font-size: 11px;
-            }}
-            QPushButton:hover {{ background: {ERROR_LIGHT}; }}
-            QPushButton:disabled {{ background: {BG_TERTIARY}; color: {TEXT_DISABLED}; border: 1px solid {BORDER_DEFAULT}; }}
-        """)
+        delete_btn.setStyleSheet(_QSS_DELETE_BTN)
         delete_btn.clicked.connect(lambda: self._delete_document(side))
         actions_layout.addWidget(delete_btn)
+        action_buttons = [delete_btn]
         
         # Archivieren / Entarchivieren
         if doc.box_type in self._ARCHIVABLE_BOXES:
@@ -427,64 +595,30 @@ class DuplicateCompareDialog(QDialog):
             else:
                 archive_btn = QPushButton(DUPLICATE_COMPARE_ACTION_ARCHIVE)
                 archive_btn.clicked.connect(lambda: self._archive_document(side))
-            archive_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: {WARNING_LIGHT}; color: {AMBER}; border: 1px solid {WARNING_LIGHT};
-                    padding: 6px 12px; border-radius: 3px; font-size: 11px;
-                }}
-                QPushButton:hover {{ background: {WARNING_LIGHT}; }}
-                QPushButton:disabled {{ background: {BG_TERTIARY}; color: {TEXT_DISABLED}; border: 1px solid {BORDER_DEFAULT}; }}
-            """)
+            archive_btn.setStyleSheet(_QSS_ARCHIVE_BTN)
             actions_layout.addWidget(archive_btn)
+            action_buttons.append(archive_btn)
         
         # Verschieben (mit Dropdown-Menue)
         move_btn = QPushButton(DUPLICATE_COMPARE_ACTION_MOVE)
-        move_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {INFO_LIGHT}; color: {PRIMARY_900}; border: 1px solid {INFO_LIGHT};
-                padding: 6px 12px; border-radius: 3px; font-size: 11px;
-            }}
-            QPushButton:hover {{ background: {INFO_LIGHT}; }}
-            QPushButton::menu-indicator {{ subcontrol-position: right center; }}
-            QPushButton:disabled {{ background: {BG_TERTIARY}; color: {TEXT_DISABLED}; border: 1px solid {BORDER_DEFAULT}; }}
-        """)
+        move_btn.setStyleSheet(_QSS_MOVE_BTN)
         move_menu = QMenu(move_btn)
-        move_targets = ['gdv', 'courtage', 'sach', 'leben', 'kranken', 'sonstige', 'eingang', 'roh']
-        for box_type in move_targets:
+        for box_type, label in self._move_menu_items():
             if box_type == doc.box_type:
                 continue  # Aktuelle Box ueberspringen
-            emoji = self._BOX_EMOJIS.get(box_type, '\U0001f4c1')
-            display = BOX_DISPLAY_NAMES.get(box_type, box_type)
-            action = move_menu.addAction(f"{emoji} {display}")
+            action = move_menu.addAction(label)
             action.triggered.connect(
                 lambda checked, bt=box_type, s=side: self._move_document(s, bt))
         move_btn.setMenu(move_menu)
         actions_layout.addWidget(move_btn)
+        action_buttons.append(move_btn)
         
         # Farbe (mit Dropdown-Menue)
         color_btn = QPushButton(DUPLICATE_COMPARE_ACTION_COLOR)
-        color_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {INFO_LIGHT}; color: {VIOLET}; border: 1px solid {INFO_LIGHT};
-                padding: 6px 12px; border-radius: 3px; font-size: 11px;
-            }}
-            QPushButton:hover {{ background: {INFO_LIGHT}; }}
-            QPushButton::menu-indicator {{ subcontrol-position: right center; }}
-            QPushButton:disabled {{ background: {BG_TERTIARY}; color: {TEXT_DISABLED}; border: 1px solid {BORDER_DEFAULT}; }}
-        """)
-        from ui.styles.tokens import DOCUMENT_DISPLAY_COLORS
-        from i18n.de import (DOC_COLOR_GREEN, DOC_COLOR_RED, DOC_COLOR_BLUE,
-                              DOC_COLOR_ORANGE, DOC_COLOR_PURPLE, DOC_COLOR_PINK,
-                              DOC_COLOR_CYAN, DOC_COLOR_YELLOW, DOC_COLOR_REMOVE)
-        color_labels = {
-            'green': DOC_COLOR_GREEN, 'red': DOC_COLOR_RED, 'blue': DOC_COLOR_BLUE,
-            'orange': DOC_COLOR_ORANGE, 'purple': DOC_COLOR_PURPLE, 'pink': DOC_COLOR_PINK,
-            'cyan': DOC_COLOR_CYAN, 'yellow': DOC_COLOR_YELLOW,
-        }
+        color_btn.setStyleSheet(_QSS_COLOR_BTN)
         color_menu = QMenu(color_btn)
-        for color_key, color_label in color_labels.items():
-            hex_color = DOCUMENT_DISPLAY_COLORS.get(color_key, BORDER_DEFAULT)
-            action = color_menu.addAction(f"\u25cf {color_label}")
+        for color_key, label in self._color_menu_items():
+            action = color_menu.addAction(label)
             action.triggered.connect(
                 lambda checked, ck=color_key, s=side: self._color_document(s, ck))
         color_menu.addSeparator()
@@ -492,12 +626,60 @@ class DuplicateCompareDialog(QDialog):
         remove_action.triggered.connect(lambda: self._color_document(side, None))
         color_btn.setMenu(color_menu)
         actions_layout.addWidget(color_btn)
+        action_buttons.append(color_btn)
+        self._action_buttons[side] = action_buttons
         
         actions_layout.addStretch()
         layout.addWidget(actions_frame)
         
         return pane
     
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _move_menu_items(cls) -> tuple:
+        """(box_type, Label) fuer das Verschieben-Menue, einmalig aufgebaut."""
+        items = []
+        for box_type in cls._MOVE_TARGETS:
+            emoji = cls._BOX_EMOJIS.get(box_type, '\U0001f4c1')
+            display = BOX_DISPLAY_NAMES.get(box_type, box_type)
+            items.append((box_type, f"{emoji} {display}"))
+        return tuple(items)
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _color_menu_items(cls) -> tuple:
+        """(color_key, Label) fuer das Farb-Menue, einmalig aufgebaut."""
+        color_labels = {
+            'green': DOC_COLOR_GREEN, 'red': DOC_COLOR_RED, 'blue': DOC_COLOR_BLUE,
+            'orange': DOC_COLOR_ORANGE, 'purple': DOC_COLOR_PURPLE, 'pink': DOC_COLOR_PINK,
+            'cyan': DOC_COLOR_CYAN, 'yellow': DOC_COLOR_YELLOW,
+        }
+        return tuple((key, f"\u25cf {label}") for key, label in color_labels.items())
+    
+    def _enable_multi_page(self, side: str):
+        """Schaltet die Vorschau beim ersten Scrollen auf MultiPage um."""
+        pdf_view = self._pdf_views.get(side)
+        if pdf_view is None or pdf_view.pageMode() == QPdfView.PageMode.MultiPage:
+            return
+        # Nur die eigenen Verbindungen loesen - die Scrollbar ist intern
+        # auch mit dem Viewport der QPdfView verbunden
+        for conn in self._multi_page_conns.pop(side, ()):
+            QObject.disconnect(conn)
+        range_timer = self._range_timers.pop(side, None)
+        if range_timer is not None:
+            range_timer.stop()
+        pdf_view.setPageMode(QPdfView.PageMode.MultiPage)
+    
+    def _check_scroll_range(self, side: str):
+        """MultiPage sofort, wenn die erste Seite ganz passt (kein Scrollen moeglich)."""
+        pdf_view = self._pdf_views.get(side)
+        if pdf_view is None or side not in self._multi_page_conns:
+            return
+        pdf_doc = pdf_view.document()
+        if (pdf_doc is not None and pdf_doc.pageCount() > 1
+                and pdf_view.verticalScrollBar().maximum() == 0):
+            self._enable_multi_page(side)
+    
     def _is_pdf(self, doc: Document) -> bool:
         """Prueft ob ein Dokument ein PDF ist."""
         if doc.mime_type and 'pdf' in doc.mime_type.lower():
@@ -505,72 +687,192 @@ class DuplicateCompareDialog(QDialog):
         name = (doc.original_filename or '').lower()
         return name.endswith('.pdf')
     
+    def _are_identical_files(self) -> bool:
+        """Prueft ob linkes und rechtes Dokument byte-identisch sind (gleicher SHA256).
+        
+        Inhaltsduplikate (content_duplicate_of_id) haben nur denselben Text
+        bei anderem Datei-Hash und duerfen sich daher KEINE Datei teilen.
+        """
+        left_hash = self._doc_left.content_hash
+        return bool(left_hash) and left_hash == self._doc_right.content_hash
+    
     def _download_previews(self):
-        """Startet den Download beider PDF-Vorschauen parallel."""
+        """Startet den Download beider PDF-Vorschauen.
+        
+        Beide Seiten teilen sich einen Download, wenn sie auf denselben
+        Cache-Pfad zeigen oder byte-identisch sind. Die zweite Seite bekommt
+        die Datei dann per Hardlink (Fallback: Kopie) statt eines eigenen
+        HTTP-Requests. Verbleibende Downloads laufen ueber dieselbe
+        requests.Session des APIClient und nutzen so dessen Connection-Pool
+        (kein zweiter TLS-Handshake); einen Batch-Endpunkt gibt es serverseitig nicht.
+        """
+        if not HAS_PDF_VIEW:
+            return
         os.makedirs(self._preview_cache_dir, exist_ok=True)
         
+        # Cache-Pfade beider Seiten (sanitisierter Dateiname fuer Windows-Kompatibilitaet)
+        targets = {}
         for side, doc in [('left', self._doc_left), ('right', self._doc_right)]:
-            if not self._is_pdf(doc) or not HAS_PDF_VIEW:
+            if self._is_pdf(doc) and side not in self._deleted_sides:
+                targets[side] = os.path.join(
+                    self._preview_cache_dir,
+                    safe_cache_filename(doc.id, doc.original_filename))
+        
+        # Byte-identische Dokumente: nur eine Seite laden, die andere verlinken
+        links = {}
+        if len(targets) == 2 and targets['left'] != targets['right'] \
+                and self._are_identical_files():
+            if self._probe_cached(targets['right']) and not self._probe_cached(targets['left']):
+                links['left'] = targets.pop('left')
+            else:
+                links['right'] = targets.pop('right')
+        
+        for side, cached in targets.items():
+            if self._probe_cached(cached):
+                self._on_preview_ready(side, cached)
                 continue
             
-            # Cache-Check (sanitisierter Dateiname fuer Windows-Kompatibilitaet)
-            from api.documents import safe_cache_filename
-            cached = os.path.join(self._preview_cache_dir,
-                                  safe_cache_filename(doc.id, doc.original_filename))
-            if os.path.exists(cached) and os.path.getsize(cached) > 0:
-                self._on_preview_ready(side, cached)
+            # Laufender Download fuer denselben Pfad: nur Seite anhaengen
+            if cached in self._inflight:
+                self._inflight[cached].append(side)
                 continue
+            self._inflight[cached] = [side]
             
-            # Download starten
-            from ui.archive.workers import PreviewDownloadWorker
-            worker = PreviewDownloadWorker(
+            # Laufender Prewarm-Download: an dessen Signale anhaengen
+            prewarm = _prewarm_inflight.get(cached)
+            if prewarm is not None:
+                prewarm.download_finished.connect(
+                    lambda path, c=cached: self._on_shared_preview_ready(c, path))
+                prewarm.download_error.connect(
+                    lambda err, c=cached: self._on_shared_preview_error(c, err))
+                continue
+            
+            doc = self._get_doc(side)
+            from ui.archive.workers import PreviewDownloadRunnable, get_preview_pool
+            runnable = PreviewDownloadRunnable(
                 self._docs_api, doc.id, self._preview_cache_dir,
-                filename=doc.original_filename,
-                cache_dir=self._preview_cache_dir)
-            worker.download_finished.connect(
-                lambda path, s=side: self._on_preview_ready(s, path))
-            worker.download_error.connect(
-                lambda err, s=side: self._on_preview_error(s, err))
-            self._workers.append(worker)
-            worker.start()
+                doc.original_filename, self._cancel_event)
+            runnable.signals.download_finished.connect(
+                lambda path, c=cached: self._on_shared_preview_ready(c, path))
+            runnable.signals.download_error.connect(
+                lambda err, c=cached: self._on_shared_preview_error(c, err))
+            # Signal-Objekt halten, damit es bis zur Zustellung lebt
+            self._preview_signals.append(runnable.signals)
+            get_preview_pool().start(runnable)
+        
+        for side, link_path in links.items():
+            source = targets[self._other_side(side)]
+            if self._probe_cached(source):
+                self._on_preview_ready(side, self._link_preview(source, link_path))
+            else:
+                self._inflight[source].append((side, link_path))
+    
+    @staticmethod
+    def _probe_cached(path: str) -> bool:
+        """Prueft mit einem einzigen stat() ob eine nicht-leere Vorschau im Cache liegt."""
+        try:
+            return os.stat(path).st_size > 0
+        except OSError:
+            return False
+    
+    @staticmethod
+    def _other_side(side: str) -> str:
+        return 'right' if side == 'left' else 'left'
+    
+    @staticmethod
+    def _link_preview(source: str, link_path: str) -> str:
+        """Legt die Vorschau eines byte-identischen Dokuments unter link_path ab.
+        
+        Hardlink statt zweitem Download (os.link funktioniert auch auf NTFS);
+        ohne Hardlink-Support wird kopiert. Schlaegt beides fehl, wird die
+        Quelldatei direkt verwendet.
+        """
+        if DuplicateCompareDialog._probe_cached(link_path):
+            return link_path
+        try:
+            if os.path.lexists(link_path):
+                os.remove(link_path)  # leerer/abgebrochener Cache-Eintrag
+            os.link(source, link_path)
+            return link_path
+        except OSError:
+            try:
+                import shutil
+                shutil.copyfile(source, link_path)
+                return link_path
+            except OSError as e:
+                logger.debug(f"Vorschau-Kopie fehlgeschlagen, nutze Quelle: {e}")
+                return source
+    
+    def _on_shared_preview_ready(self, cache_path: str, path):
+        """Verteilt einen abgeschlossenen Download an alle wartenden Seiten."""
+        if self._cancel_event.is_set():
+            return
+        for waiter in self._inflight.pop(cache_path, []):
+            if isinstance(waiter, tuple):
+                side, link_path = waiter
+                if path and os.path.exists(path):
+                    self._on_preview_ready(side, self._link_preview(path, link_path))
+                else:
+                    self._on_preview_ready(side, path)
+            else:
+                self._on_preview_ready(waiter, path)
+    
+    def _on_shared_preview_error(self, cache_path: str, error: str):
+        """Meldet einen Download-Fehler an alle wartenden Seiten."""
+        if self._cancel_event.is_set():
+            return
+        for waiter in self._inflight.pop(cache_path, []):
+            side = waiter[0] if isinstance(waiter, tuple) else waiter
+            self._on_preview_error(side, error)
     
     def _on_preview_ready(self, side: str, path):
         """Callback wenn PDF-Download fertig ist."""
-        if not path or not os.path.exists(path):
+        if not path or not self._probe_cached(path):
             self._on_preview_error(side, "Datei nicht gefunden")
             return
         
-        pdf_view = self._pdf_views.get(side)
-        stack = self._loading_labels.get(side)
+        if not self._pdf_views.get(side) or side in self._deleted_sides:
+            return
         
-        if pdf_view:
-            pdf_doc = QPdfDocument(self)
-            
-            # QPdfDocument.load() kann fehlschlagen bei Sonderzeichen im Pfad.
-            # Wir pruefen den Status und laden ggf. von QBuffer als Fallback.
-            load_error = pdf_doc.load(path)
-            
-            # Status pruefen (Error = 2 in QPdfDocument.Error enum)
-            if pdf_doc.status() == QPdfDocument.Status.Error:
-                logger.warning(f"QPdfDocument.load() fehlgeschlagen fuer {path}, versuche QBuffer-Fallback")
-                self._load_pdf_via_buffer(side, path, pdf_view, stack)
-                return
-            
-            pdf_view.setDocument(pdf_doc)
-            
-            # Stack auf QPdfView-Seite (Index 1) umschalten
-            if stack:
-                stack.setCurrentIndex(1)
-            
-            if side == 'left':
-                self._pdf_doc_left = pdf_doc
+        # Byte-identische Dokumente: ein QPdfDocument fuer beide Views
+        other = self._other_side(side)
+        if other in self._loading_sides and self._are_identical_files():
+            shared = self._pdf_doc_left if other == 'left' else self._pdf_doc_right
+            if shared is not None:
+                self._show_pdf(side, shared)
             else:
-                self._pdf_doc_right = pdf_doc
-            
-            logger.info(f"PDF-Vorschau geladen ({side}): {path}")
+                self._shared_with[other] = side
+            return
+        
+        self._loading_sides.add(side)
+        self._load_pdf_via_buffer(side, path)
+    
+    def _load_targets(self, side: str) -> list:
+        """Seiten, die das fuer side geladene QPdfDocument anzeigen sollen."""
+        sides = (side, self._shared_with.get(side))
+        return [s for s in sides if s and s not in self._deleted_sides]
+    
+    def _show_pdf(self, side: str, pdf_doc):
+        """Zeigt ein fertig geladenes QPdfDocument auf der Seite an."""
+        self._pdf_views[side].setDocument(pdf_doc)
+        stack = self._loading_labels.get(side)
+        if stack:
+            stack.setCurrentIndex(1)
+        # Ohne Scrollbereich kommt evtl. kein rangeChanged - selbst pruefen
+        range_timer = self._range_timers.get(side)
+        if range_timer is not None:
+            range_timer.start()
+        if side == 'left':
+            self._pdf_doc_left = pdf_doc
+        else:
+            self._pdf_doc_right = pdf_doc
     
-    def _load_pdf_via_buffer(self, side, path, pdf_view, stack):
-        """Laedt PDF ueber QBuffer im Hintergrund (Fallback fuer Sonderzeichen-Pfade)."""
+    def _load_pdf_via_buffer(self, side: str, path: str):
+        """Liest das PDF einmal im Hintergrund und laedt es ueber einen QBuffer.
+        
+        QPdfDocument.load(path) scheitert bei Sonderzeichen im Pfad; der
+        Umweg ueber die Bytes vermeidet den zweiten Parse-Versuch.
+        """
 
         class _R(QThread):
             done = Signal(bytes)
@@ -586,29 +888,26 @@ class DuplicateCompareDialog(QDialog):
                     self.failed.emit(str(e))
 
         def _on_read(data: bytes):
+            if not self._load_targets(side):
+                return
             try:
                 from PySide6.QtCore import QBuffer, QByteArray
-                from PySide6.QtPdf import QPdfDocument
                 pdf_doc = QPdfDocument(self)
                 buf = QBuffer(self)
                 buf.setData(QByteArray(data))
                 buf.open(QBuffer.OpenModeFlag.ReadOnly)
+                # Buffer muss so lange leben wie das QPdfDocument
+                self._pdf_buffers[side] = buf
+                # Erst bei Ready anzeigen (kein leerer Zwischen-Repaint)
+                pdf_doc.statusChanged.connect(
+                    lambda status: self._on_pdf_status(side, pdf_doc, status, path))
                 pdf_doc.load(buf)
-                setattr(self, f'_pdf_buffer_{side}', buf)
-                pdf_view.setDocument(pdf_doc)
-                if stack:
-                    stack.setCurrentIndex(1)
-                if side == 'left':
-                    self._pdf_doc_left = pdf_doc
-                else:
-                    self._pdf_doc_right = pdf_doc
-                logger.info(f"PDF-Vorschau via Buffer geladen ({side}): {path}")
             except Exception as e:
-                logger.error(f"QBuffer-Fallback fehlgeschlagen ({side}): {e}")
+                logger.error(f"PDF-Vorschau konnte nicht geladen werden ({side}): {e}")
                 self._on_preview_error(side, str(e))
 
         def _on_fail(msg: str):
-            logger.error(f"QBuffer-Fallback fehlgeschlagen ({side}): {msg}")
+            logger.error(f"PDF-Vorschau konnte nicht gelesen werden ({side}): {msg}")
             self._on_preview_error(side, msg)
 
         w = _R(path, parent=self)
@@ -617,6 +916,20 @@ class DuplicateCompareDialog(QDialog):
         setattr(self, f'_buf_read_worker_{side}', w)
         w.start()
 
+    def _on_pdf_status(self, side: str, pdf_doc, status, path: str):
+        """Zeigt das PDF erst an, wenn QPdfDocument fertig geladen hat."""
+        if status == QPdfDocument.Status.Ready:
+            for target in self._load_targets(side):
+                self._show_pdf(target, pdf_doc)
+            logger.info(f"PDF-Vorschau geladen ({side}): {path}")
+        elif status == QPdfDocument.Status.Error:
+            pdf_doc.close()
+            buf = self._pdf_buffers.pop(side, None)
+            if buf:
+                buf.close()
+            for target in self._load_targets(side):
+                self._on_preview_error(target, f"PDF ungueltig: {path}")
+    
     def _on_preview_error(self, side: str, error: str):
         """Callback bei Download-Fehler."""
         stack = self._loading_labels.get(side)
@@ -624,12 +937,42 @@ class DuplicateCompareDialog(QDialog):
             # Loading-Label (Index 0) mit Fehlermeldung aktualisieren
             loading = stack.widget(0)
             if loading:
-                from i18n.de import DUPLICATE_COMPARE_NO_PREVIEW
                 loading.setText(DUPLICATE_COMPARE_NO_PREVIEW)
-                loading.setStyleSheet(
-                    f"color: {ERROR}; font-size: 12px; padding: 40px; font-style: italic;")
+                loading.setStyleSheet(_QSS_PREVIEW_ERROR)
         logger.warning(f"PDF-Vorschau Fehler ({side}): {error}")
     
+    def _release_preview(self, side: str, text: str):
+        """Gibt die Vorschau eines geloeschten Dokuments frei.
+        
+        QPdfDocument und Buffer werden geschlossen und die Seite zeigt nur
+        noch ein Label; ausstehende Downloads/Lesevorgaenge fuer diese Seite
+        werden ignoriert.
+        """
+        self._deleted_sides.add(side)
+        other = self._other_side(side)
+        pdf_doc = self._pdf_doc_left if side == 'left' else self._pdf_doc_right
+        other_doc = self._pdf_doc_right if side == 'left' else self._pdf_doc_left
+        # Geteiltes Dokument (byte-identisch) bleibt fuer die andere Seite offen
+        shared = (pdf_doc is not None and pdf_doc is other_doc) or (
+            self._shared_with.get(side) == other and other not in self._deleted_sides)
+        if side == 'left':
+            self._pdf_doc_left = None
+        else:
+            self._pdf_doc_right = None
+        if not shared:
+            # QPdfView haelt das Dokument per QPointer, deleteLater reicht
+            if pdf_doc:
+                pdf_doc.close()
+                pdf_doc.deleteLater()
+            buf = self._pdf_buffers.pop(side, None)
+            if buf:
+                buf.close()
+                buf.deleteLater()
+        stack = self._loading_labels.get(side)
+        if stack:
+            stack.widget(0).setText(text)
+            stack.setCurrentIndex(0)
+    
     def _get_doc(self, side: str) -> Document:
         """Gibt das Dokument fuer die angegebene Seite zurueck."""
         return self._doc_left if side == 'left' else self._doc_right
@@ -640,19 +983,15 @@ class DuplicateCompareDialog(QDialog):
     
     def _mark_pane_modified(self, side: str, status_text: str):
         """Markiert eine Seite als modifiziert (deaktiviert Buttons, zeigt Status)."""
-        pane = self._left_pane if side == 'left' else self._right_pane
-        
         # Status-Label anzeigen
-        status = pane.findChild(QLabel, f"status_{side}")
+        status = self._status_labels.get(side)
         if status:
             status.setText(status_text)
             status.setVisible(True)
         
         # Aktions-Buttons deaktivieren
-        actions = pane.findChild(QFrame, f"actions_{side}")
-        if actions:
-            for btn in actions.findChildren(QPushButton):
-                btn.setEnabled(False)
+        for btn in self._action_buttons.get(side, []):
+            btn.setEnabled(False)
         
         # Seite als deaktiviert markieren
         if side == 'left':
@@ -668,7 +1007,6 @@ class DuplicateCompareDialog(QDialog):
             return
         
         doc = self._get_doc(side)
-        from i18n.de import DUPLICATE_COMPARE_CONFIRM_DELETE, DUPLICATE_COMPARE_DELETED
         
         reply = QMessageBox.question(
             self, DUPLICATE_COMPARE_DELETED,
@@ -679,86 +1017,164 @@ class DuplicateCompareDialog(QDialog):
         if reply != QMessageBox.StandardButton.Yes:
             return
         
-        from ui.async_worker import AsyncWorker
-        from i18n.de import DUPLICATE_COMPARE_ERROR as _err_tpl
-        w = AsyncWorker(lambda: self._docs_api.delete(doc.id), parent=self)
-        w.finished.connect(lambda _: self._mark_pane_modified(side, f"\u274c {DUPLICATE_COMPARE_DELETED}"))
-        w.error.connect(lambda msg: ToastManager.instance().show_error(_err_tpl.format(error=msg)))
-        setattr(self, f'_del_worker_{side}', w)
-        w.start()
+        self._queue_op('delete', side, None, f"\u274c {DUPLICATE_COMPARE_DELETED}")
+        self._release_preview(side, DUPLICATE_COMPARE_DELETED)
     
     def _archive_document(self, side: str):
-        """Archiviert das Dokument (async)."""
+        """Archiviert das Dokument (gebuendelt)."""
         if self._is_side_disabled(side):
             return
-        doc = self._get_doc(side)
-        from ui.async_worker import AsyncWorker
-        from i18n.de import DUPLICATE_COMPARE_ARCHIVED, DUPLICATE_COMPARE_ERROR
-        w = AsyncWorker(lambda: self._docs_api.archive_documents([doc.id]), parent=self)
-        w.finished.connect(lambda _: self._mark_pane_modified(side, f"\U0001f4e6 {DUPLICATE_COMPARE_ARCHIVED}"))
-        w.error.connect(lambda msg: ToastManager.instance().show_error(DUPLICATE_COMPARE_ERROR.format(error=msg)))
-        setattr(self, f'_arc_worker_{side}', w)
-        w.start()
+        self._queue_op('archive', side, None, f"\U0001f4e6 {DUPLICATE_COMPARE_ARCHIVED}")
     
     def _unarchive_document(self, side: str):
-        """Entarchiviert das Dokument (async)."""
+        """Entarchiviert das Dokument (gebuendelt)."""
         if self._is_side_disabled(side):
             return
-        doc = self._get_doc(side)
-        from ui.async_worker import AsyncWorker
-        from i18n.de import DUPLICATE_COMPARE_UNARCHIVED, DUPLICATE_COMPARE_ERROR
-        w = AsyncWorker(lambda: self._docs_api.unarchive_documents([doc.id]), parent=self)
-        w.finished.connect(lambda _: self._mark_pane_modified(side, f"\U0001f4e4 {DUPLICATE_COMPARE_UNARCHIVED}"))
-        w.error.connect(lambda msg: ToastManager.instance().show_error(DUPLICATE_COMPARE_ERROR.format(error=msg)))
-        setattr(self, f'_unarc_worker_{side}', w)
-        w.start()
+        self._queue_op('unarchive', side, None, f"\U0001f4e4 {DUPLICATE_COMPARE_UNARCHIVED}")
     
     def _move_document(self, side: str, target_box: str):
-        """Verschiebt das Dokument in eine andere Box (async)."""
+        """Verschiebt das Dokument in eine andere Box (gebuendelt)."""
         if self._is_side_disabled(side):
             return
-        doc = self._get_doc(side)
-        from ui.async_worker import AsyncWorker
-        from i18n.de import DUPLICATE_COMPARE_MOVED, DUPLICATE_COMPARE_ERROR
-        from api.documents import BOX_DISPLAY_NAMES
         box_name = BOX_DISPLAY_NAMES.get(target_box, target_box)
         emoji = self._BOX_EMOJIS.get(target_box, '\U0001f4c1')
-        w = AsyncWorker(lambda: self._docs_api.move_documents([doc.id], target_box), parent=self)
-        w.finished.connect(lambda _: self._mark_pane_modified(
-            side, f"{emoji} {DUPLICATE_COMPARE_MOVED.format(box=box_name)}"))
-        w.error.connect(lambda msg: ToastManager.instance().show_error(DUPLICATE_COMPARE_ERROR.format(error=msg)))
-        setattr(self, f'_move_worker_{side}', w)
-        w.start()
+        self._queue_op('move', side, target_box,
+                       f"{emoji} {DUPLICATE_COMPARE_MOVED.format(box=box_name)}")
     
     def _color_document(self, side: str, color_key):
-        """Setzt die Farbmarkierung des Dokuments (async)."""
+        """Setzt die Farbmarkierung des Dokuments (gebuendelt)."""
         if self._is_side_disabled(side):
             return
-        doc = self._get_doc(side)
-        from ui.async_worker import AsyncWorker
-        from i18n.de import DUPLICATE_COMPARE_COLORED, DUPLICATE_COMPARE_COLOR_REMOVED, DUPLICATE_COMPARE_ERROR
         label = f"\U0001f3a8 {DUPLICATE_COMPARE_COLORED}" if color_key else DUPLICATE_COMPARE_COLOR_REMOVED
-        w = AsyncWorker(lambda: self._docs_api.set_documents_color([doc.id], color_key), parent=self)
-        w.finished.connect(lambda _: self._mark_pane_modified(side, label))
-        w.error.connect(lambda msg: ToastManager.instance().show_error(DUPLICATE_COMPARE_ERROR.format(error=msg)))
-        setattr(self, f'_color_worker_{side}', w)
+        self._queue_op('color', side, color_key, label)
+    
+    def _queue_op(self, op: str, side: str, arg, status_text: str):
+        """Merkt eine Aktion vor und markiert die Seite sofort als modifiziert.
+        
+        Aktionen beider Seiten werden gesammelt und nach PENDING_OPS_FLUSH_MS
+        bzw. spaetestens beim Schliessen in einem Bulk-Request pro Aktionstyp
+        an die API geschickt.
+        """
+        self._pending_ops.append((op, side, self._get_doc(side).id, arg))
+        self._mark_pane_modified(side, status_text)
+        self._flush_timer.start()
+    
+    def _flush_pending_ops(self):
+        """Schickt alle vorgemerkten Aktionen im Hintergrund an die API.
+        
+        Die Seiten sind bereits optimistisch als modifiziert markiert;
+        fehlgeschlagene Aktionen werden per _rollback_pane zurueckgenommen.
+        """
+        if not self._pending_ops:
+            return
+        ops, self._pending_ops = self._pending_ops, []
+        
+        from ui.async_worker import AsyncWorker
+        w = AsyncWorker(lambda: self._apply_ops(ops), parent=self)
+        w.finished.connect(lambda failed: self._on_ops_applied(w, failed))
+        w.error.connect(lambda msg: self._on_ops_applied(
+            w, [(op[1], msg) for op in ops]))
+        self._op_workers.append(w)
         w.start()
     
+    def _apply_ops(self, ops: list) -> list:
+        """Fuehrt vorgemerkte Aktionen gruppiert nach (Typ, Argument) aus.
+        
+        Laeuft im Worker-Thread. Fehler einzelner Gruppen brechen die
+        uebrigen nicht ab. Die Bulk-Methoden der DocumentsAPI fangen
+        APIError selbst ab und liefern nur die Anzahl geaenderter
+        Dokumente; bleibt sie unter der Gruppengroesse, gilt die ganze
+        Gruppe als fehlgeschlagen (welche IDs betroffen sind, ist unbekannt).
+        
+        Returns:
+            Liste (side, Fehlermeldung) der fehlgeschlagenen Aktionen
+        """
+        groups = {}
+        for op, side, doc_id, arg in ops:
+            groups.setdefault((op, arg), []).append((side, doc_id))
+        
+        failed = []
+        for (op, arg), entries in groups.items():
+            ids = [doc_id for _side, doc_id in entries]
+            try:
+                if op == 'delete':
+                    done = self._docs_api.delete_documents(ids)
+                elif op == 'archive':
+                    done = self._docs_api.archive_documents(ids)
+                elif op == 'unarchive':
+                    done = self._docs_api.unarchive_documents(ids)
+                elif op == 'move':
+                    done = self._docs_api.move_documents(ids, arg)
+                elif op == 'color':
+                    done = self._docs_api.set_documents_color(ids, arg)
+                else:
+                    continue
+            except Exception as e:
+                logger.error(f"Duplikat-Aktion '{op}' fehlgeschlagen: {e}")
+                failed.extend((side, str(e)) for side, _doc_id in entries)
+                continue
+            if (done or 0) < len(ids):
+                error = DUPLICATE_COMPARE_INCOMPLETE.format(done=done or 0, total=len(ids))
+                logger.error(f"Duplikat-Aktion '{op}' unvollstaendig: {error}")
+                failed.extend((side, error) for side, _doc_id in entries)
+        return failed
+    
+    def _on_ops_applied(self, worker, failed: list):
+        """Nimmt fehlgeschlagene Aktionen zurueck und meldet Aenderungen nach dem Schliessen."""
+        if worker in self._op_workers:
+            self._op_workers.remove(worker)
+        for side, error in failed:
+            self._rollback_pane(side, error)
+        if self._emit_changes_when_done and not self._op_workers:
+            self._emit_changes_when_done = False
+            self.documents_changed.emit()
+    
+    def _rollback_pane(self, side: str, error: str):
+        """Macht die optimistische Markierung einer Seite nach API-Fehler rueckgaengig."""
+        ToastManager.instance().show_error(DUPLICATE_COMPARE_ERROR.format(error=error))
+        status = self._status_labels.get(side)
+        if status:
+            status.setVisible(False)
+        for btn in self._action_buttons.get(side, []):
+            btn.setEnabled(True)
+        if side == 'left':
+            self._left_disabled = False
+        else:
+            self._right_disabled = False
+        
+        # Vorschau eines faelschlich als geloescht markierten Dokuments wieder laden
+        if side in self._deleted_sides:
+            self._deleted_sides.discard(side)
+            self._loading_sides.discard(side)
+            stack = self._loading_labels.get(side)
+            if stack:
+                stack.widget(0).setText(DUPLICATE_COMPARE_LOADING)
+            doc = self._get_doc(side)
+            cached = os.path.join(self._preview_cache_dir,
+                                  safe_cache_filename(doc.id, doc.original_filename))
+            if self._probe_cached(cached):
+                self._on_preview_ready(side, cached)
+            else:
+                self._on_preview_error(side, "Vorschau nicht im Cache")
+    
     def closeEvent(self, event):
         """Beim Schliessen: Worker stoppen und ggf. Signal senden."""
-        for worker in self._workers:
-            if worker.isRunning():
-                worker.cancel()
-                worker.wait(1000)
+        # Laufende Vorschau-Downloads abbrechen, ohne den UI-Thread zu blockieren
+        self._cancel_event.set()
+        _abort_on_quit(self._cancel_event, connect=False)
         
-        # PDF-Dokumente freigeben
-        if self._pdf_doc_left:
-            self._pdf_doc_left.close()
-        if self._pdf_doc_right:
-            self._pdf_doc_right.close()
+        # PDF-Dokumente freigeben (geteiltes Dokument nur einmal)
+        for pdf_doc in {self._pdf_doc_left, self._pdf_doc_right} - {None}:
+            pdf_doc.close()
         
+        # Vorgemerkte Aktionen sofort abschicken; Refresh erst wenn alle durch sind
+        self._flush_timer.stop()
+        self._flush_pending_ops()
         if self._has_changes:
-            self.documents_changed.emit()
+            if self._op_workers:
+                self._emit_changes_when_done = True
+            else:
+                self.documents_changed.emit()
         
         super().closeEvent(event)
 
@@ -767,4 +1183,5 @@ __all__ = [
     'SmartScanDialog',
     '_SmartScanDialog',
     'DuplicateCompareDialog',
+    'prewarm_preview',
 ]
@@ -11,6 +11,9 @@ from infrastructure.threading.archive_workers import (
     MissingAiDataWorker,
     MultiUploadWorker,
     PreviewDownloadWorker,
+    PreviewDownloadSignals,
+    PreviewDownloadRunnable,
+    get_preview_pool,
     MultiDownloadWorker,
     BoxDownloadWorker,
     CreditsWorker,
@@ -31,6 +34,9 @@ __all__ = [
     'MissingAiDataWorker',
     'MultiUploadWorker',
     'PreviewDownloadWorker',
+    'PreviewDownloadSignals',
+    'PreviewDownloadRunnable',
+    'get_preview_pool',
     'MultiDownloadWorker',
     'BoxDownloadWorker',
     'CreditsWorker',
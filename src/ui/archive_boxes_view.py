@@ -1376,6 +1376,9 @@ class ArchiveBoxesView(QWidget):
                 
                 compare_action = QAction(DUPLICATE_COMPARE, self)
                 compare_action.triggered.connect(lambda: self._open_duplicate_compare(doc))
+                # Vorschauen schon beim Hover in den Cache laden
+                compare_action.hovered.connect(
+                    lambda cid=_cpart_id: self._prewarm_duplicate_previews(doc, cid))
                 menu.addAction(compare_action)
         
         menu.addSeparator()
@@ -1605,6 +1608,17 @@ class ArchiveBoxesView(QWidget):
         self._pending_select_doc_id = doc_id
         QTimer.singleShot(500, self._select_pending_document)
     
+    def _prewarm_duplicate_previews(self, doc: Document, counterpart_id: Optional[int]):
+        """Startet Vorab-Downloads der Vorschauen fuer den Duplikat-Vergleich."""
+        from ui.archive.dialogs import prewarm_preview
+        docs_api = self._presenter.get_docs_api_for_dialog()
+        cache_dir = self._preview_cache_dir
+        prewarm_preview(docs_api, doc.id, doc.original_filename, cache_dir)
+        if counterpart_id:
+            filename = (doc.duplicate_of_filename if doc.is_duplicate
+                        else doc.content_duplicate_of_filename)
+            prewarm_preview(docs_api, counterpart_id, filename, cache_dir)
+    
     def _open_duplicate_compare(self, doc: Document):
         """Oeffnet den Duplikat-Vergleichsdialog."""
         counterpart_id = doc.previous_version_id if doc.is_duplicate else doc.content_duplicate_of_id
@@ -5,9 +5,12 @@ Ansicht fuer alle Dokumente mit Upload/Download-Funktionen, PDF-Vorschau
 und KI-basierter automatischer Benennung.
 """
 
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict
 from datetime import datetime
+import atexit
+import shutil
 import tempfile
+import threading
 import os
 import logging
 
@@ -57,6 +60,38 @@ from ui.viewers.pdf_viewer import (
 )
 from ui.viewers.spreadsheet_viewer import SpreadsheetViewerDialog
 from ui.archive.dialogs import DuplicateCompareDialog
+from infrastructure.threading.archive_workers import resolve_target_names
+
+# Quelle-Spalte: source_type -> Vordergrundfarbe (einmalig erzeugt)
+_SOURCE_COLORS = {
+    'bipro_auto': QColor(INFO),
+    'self_created': QColor(SUCCESS),
+    'scan': QColor(STATUS_SCAN),
+    'mail': QColor(STATUS_MAIL),
+}
+_GDV_COLOR = QColor(SUCCESS)
+
+# KI-Spalte: Document.ai_state -> (Text, Farbe, Tooltip)
+# Tooltip None = Fehlertext des Dokuments wird eingesetzt.
+_AI_STATE_TABLE = {
+    'renamed': ("Ja", QColor(STATUS_SCAN), "Durch KI umbenannt"),
+    'error': ("Fehler", QColor(ERROR), None),
+    'pending': ("-", None, "Noch nicht durch KI verarbeitet"),
+    'na': ("", None, "Keine PDF-Datei"),
+}
+
+
+def _set_progress(progress: QProgressDialog, value: int, text: str) -> None:
+    """Setzt Wert und Text eines Fortschrittsdialogs.
+
+    Nach "Abbrechen" koennen noch gequeuete progress-Signale des Workers
+    eintreffen; setValue() wuerde den Dialog dann wieder einblenden.
+    """
+    if progress.wasCanceled():
+        return
+    progress.setValue(value)
+    progress.setLabelText(text)
+
 
 # Legacy-Worker: bleiben hier definiert fuer Backward-Kompatibilitaet
 # DocumentLoadWorker, UploadWorker, AIRenameWorker
@@ -101,6 +136,107 @@ class UploadWorker(QThread):
             self.error.emit(str(e))
 
 
+class BulkDownloadWorker(QThread):
+    """Worker zum parallelen Herunterladen mehrerer Dokumente.
+
+    Die Downloads laufen ueber einen begrenzten ThreadPoolExecutor, damit sich
+    die Latenzen der einzelnen HTTP-Requests ueberlappen. cancel() bricht auch
+    bereits laufende Downloads ab (zwischen zwei Chunks).
+    """
+    progress_update = Signal(int, str)
+    done = Signal(int, int)
+
+    MAX_DOWNLOAD_WORKERS = 6
+
+    def __init__(self, docs_api: DocumentsAPI, items: List[Tuple[int, str]],
+                 target_dir: str, parent=None):
+        super().__init__(parent)
+        self.docs_api = docs_api
+        self.items = items
+        self.target_dir = target_dir
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @staticmethod
+    def _resolve_target_names(items: List[Tuple[int, str]],
+                              target_dir: str) -> List[Tuple[int, str]]:
+        """Legt die endgueltigen Dateinamen fest, bevor parallel geladen wird
+        (siehe resolve_target_names)."""
+        names = resolve_target_names([fname for _doc_id, fname in items], target_dir)
+        return [(doc_id, name) for (doc_id, _fname), name in zip(items, names)]
+
+    def _download_one(self, doc_id: int, fname: str) -> bool:
+        if self._cancel_event.is_set():
+            return False
+        try:
+            return bool(self.docs_api.download(
+                doc_id, self.target_dir, filename_override=fname,
+                cancel_event=self._cancel_event,
+            ))
+        except Exception as e:
+            logger.error(f"Download fehlgeschlagen fuer {fname}: {e}")
+            return False
+
+    def run(self):
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        ok = fail = 0
+        items = self._resolve_target_names(self.items, self.target_dir)
+        workers = min(self.MAX_DOWNLOAD_WORKERS, max(1, len(items)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._download_one, did, fname): fname
+                for did, fname in items
+            }
+            for done_count, future in enumerate(as_completed(futures), start=1):
+                if future.result():
+                    ok += 1
+                else:
+                    fail += 1
+                self.progress_update.emit(done_count, f"Geladen: {futures[future]}")
+        self.done.emit(ok, fail)
+
+
+class BulkDeleteWorker(QThread):
+    """Worker zum Loeschen mehrerer Dokumente ueber die Bulk-API.
+
+    Pro Block von BULK_CHUNK_SIZE IDs wird genau ein Request gesendet,
+    der Fortschritt wird pro Block gemeldet.
+    """
+    progress_update = Signal(int, str)
+    done = Signal(int)
+
+    BULK_CHUNK_SIZE = 100
+
+    def __init__(self, docs_api: DocumentsAPI, doc_ids: List[int], parent=None):
+        super().__init__(parent)
+        self.docs_api = docs_api
+        self.doc_ids = doc_ids
+        self._cancelled = False
+
+    def cancel(self):
+        """Bricht nach dem aktuellen Block ab (bereits gesendete bleiben geloescht)."""
+        self._cancelled = True
+
+    def run(self):
+        ok = 0
+        total = len(self.doc_ids)
+        for start in range(0, total, self.BULK_CHUNK_SIZE):
+            if self._cancelled:
+                logger.info(f"Loeschen abgebrochen nach {ok}/{total} Dokument(en)")
+                break
+            chunk = self.doc_ids[start:start + self.BULK_CHUNK_SIZE]
+            self.progress_update.emit(start, f"Lösche {start + 1}-{start + len(chunk)}/{total}")
+            ok += self.docs_api.delete_documents(chunk)
+        self.progress_update.emit(total, f"{ok}/{total} gelöscht")
+        self.done.emit(ok)
+
+
 # AIRenameWorker: Verschoben nach infrastructure/threading/archive_workers.py
 # Re-Export fuer Backward-Kompatibilitaet
 from infrastructure.threading.archive_workers import AIRenameWorker
@@ -118,6 +254,9 @@ class ArchiveView(QWidget):
     # Signal wenn ein GDV-Dokument geöffnet werden soll
     open_gdv_requested = Signal(int, str)  # doc_id, original_filename
     
+    # Zeitfenster, in dem refresh_documents()-Aufrufe zusammengefasst werden
+    REFRESH_DEBOUNCE_MS = 150
+    
     def __init__(self, api_client: APIClient, parent=None):
         super().__init__(parent)
         
@@ -127,10 +266,22 @@ class ArchiveView(QWidget):
         self._repo = DocumentRepository(api_client)
         
         self._documents: List[Document] = []
+        # IDs der KI-Umbenennungs-Kandidaten, beim Laden aufgebaut
+        # (siehe _rebuild_document_index)
+        self._unrenamed_pdf_ids: set = set()
         self._load_worker = None
         self._upload_worker = None
         self._ai_rename_worker = None
         self._toast_manager = None
+        # Vorschau-Cache: _preview_cache_key(doc) -> lokaler PDF-Pfad
+        # (ein Temp-Ordner pro View)
+        self._pdf_cache: Dict[tuple, str] = {}
+        self._preview_temp_dir: Optional[str] = None
+        
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh_documents)
         
         self._setup_ui()
         self.refresh_documents()
@@ -254,7 +405,15 @@ class ArchiveView(QWidget):
         layout.addWidget(self.status_label)
     
     def refresh_documents(self):
-        """Dokumente vom Server laden."""
+        """Dokumente vom Server laden (entprellt).
+
+        Mehrere Aufrufe innerhalb von REFRESH_DEBOUNCE_MS (z.B. nach
+        Batch-Operationen) werden zu einem einzigen Reload zusammengefasst.
+        """
+        self._refresh_timer.start()
+    
+    def _do_refresh_documents(self):
+        """Laedt die Dokumente tatsaechlich vom Server."""
         self.status_label.setText("Lade Dokumente...")
         self.table.setEnabled(False)
         
@@ -278,10 +437,17 @@ class ArchiveView(QWidget):
     def _on_documents_loaded(self, documents: List[Document]):
         """Callback wenn Dokumente geladen wurden."""
         self._documents = documents
+        self._rebuild_document_index()
         self._populate_table()
         self.table.setEnabled(True)
         self.status_label.setText(f"{len(documents)} Dokument(e) gefunden")
     
+    def _rebuild_document_index(self):
+        """Baut den KI-Kandidaten-Index fuer die geladenen Dokumente auf."""
+        self._unrenamed_pdf_ids = {
+            d.id for d in self._documents if d.is_pdf and not d.ai_renamed
+        }
+    
     def _on_load_error(self, error: str):
         """Callback bei Ladefehler."""
         self.table.setEnabled(True)
@@ -304,37 +470,26 @@ class ArchiveView(QWidget):
             
             # Quelle
             source_item = QTableWidgetItem(doc.source_type_display)
-            if doc.source_type == 'bipro_auto':
-                source_item.setForeground(QColor(INFO))
-            elif doc.source_type == 'self_created':
-                source_item.setForeground(QColor(SUCCESS))
-            elif doc.source_type == 'scan':
-                source_item.setForeground(QColor(STATUS_SCAN))
-            elif doc.source_type == 'mail':
-                source_item.setForeground(QColor(STATUS_MAIL))
+            source_color = _SOURCE_COLORS.get(doc.source_type)
+            if source_color is not None:
+                source_item.setForeground(source_color)
             self.table.setItem(row, 2, source_item)
             
             # GDV
             gdv_item = QTableWidgetItem("Ja" if doc.is_gdv else "")
             if doc.is_gdv:
-                gdv_item.setForeground(QColor(SUCCESS))
+                gdv_item.setForeground(_GDV_COLOR)
             self.table.setItem(row, 3, gdv_item)
             
             # KI-Benennung Status
-            if doc.ai_renamed:
-                ai_item = QTableWidgetItem("Ja")
-                ai_item.setForeground(QColor(STATUS_SCAN))  # Lila fuer KI
-                ai_item.setToolTip("Durch KI umbenannt")
-            elif doc.ai_processing_error:
-                ai_item = QTableWidgetItem("Fehler")
-                ai_item.setForeground(QColor(ERROR))  # Rot fuer Fehler
-                ai_item.setToolTip(f"Fehler: {doc.ai_processing_error}")
-            elif doc.is_pdf:
-                ai_item = QTableWidgetItem("-")
-                ai_item.setToolTip("Noch nicht durch KI verarbeitet")
-            else:
-                ai_item = QTableWidgetItem("")
-                ai_item.setToolTip("Keine PDF-Datei")
+            ai_text, ai_color, ai_tooltip = _AI_STATE_TABLE[doc.ai_state]
+            ai_item = QTableWidgetItem(ai_text)
+            if ai_color is not None:
+                ai_item.setForeground(ai_color)
+            ai_item.setToolTip(
+                ai_tooltip if ai_tooltip is not None
+                else f"Fehler: {doc.ai_processing_error}"
+            )
             self.table.setItem(row, 4, ai_item)
             
             # Groesse
@@ -344,7 +499,8 @@ class ArchiveView(QWidget):
             
             # Datum im deutschen Format
             date_item = QTableWidgetItem(format_date_german(doc.created_at))
-            date_item.setToolTip(doc.created_at or "")  # Original als Tooltip
+            if doc.created_at:
+                date_item.setToolTip(doc.created_at)  # Original als Tooltip
             self.table.setItem(row, 6, date_item)
             
             # Hochgeladen von
@@ -400,7 +556,7 @@ class ArchiveView(QWidget):
                 menu.addAction(open_action)
             
             # KI-Benennung (nur fuer PDFs, die noch nicht umbenannt sind)
-            if doc.is_pdf and not doc.ai_renamed:
+            if doc.id in self._unrenamed_pdf_ids:
                 menu.addSeparator()
                 ai_rename_action = QAction("KI-Benennung", self)
                 ai_rename_action.triggered.connect(lambda: self._ai_rename_documents([doc]))
@@ -419,7 +575,7 @@ class ArchiveView(QWidget):
             menu.addAction(download_all_action)
             
             # KI-Benennung fuer mehrere (nur PDFs zaehlen)
-            pdf_docs = [d for d in selected_docs if d.is_pdf and not d.ai_renamed]
+            pdf_docs = [d for d in selected_docs if d.id in self._unrenamed_pdf_ids]
             if pdf_docs:
                 ai_rename_action = QAction(f"KI-Benennung ({len(pdf_docs)} PDFs)", self)
                 ai_rename_action.triggered.connect(lambda: self._ai_rename_documents(pdf_docs))
@@ -478,13 +634,43 @@ class ArchiveView(QWidget):
                 "Vorschau ist nur für PDF-Dateien und GDV-Dateien möglich."
             )
     
+    def _get_preview_temp_dir(self) -> str:
+        """Liefert den Temp-Ordner fuer Vorschauen (einmalig angelegt, atexit-Cleanup)."""
+        if not self._preview_temp_dir or not os.path.isdir(self._preview_temp_dir):
+            self._preview_temp_dir = tempfile.mkdtemp(prefix='bipro_preview_')
+            atexit.register(shutil.rmtree, self._preview_temp_dir, ignore_errors=True)
+        return self._preview_temp_dir
+    
+    def _show_pdf_preview(self, path: str, doc: Document):
+        """Oeffnet den PDF-Viewer fuer eine lokal vorliegende Datei."""
+        viewer = PDFViewerDialog(path, f"Vorschau: {doc.original_filename}", self)
+        viewer.exec()
+    
+    @staticmethod
+    def _preview_cache_key(doc: Document) -> tuple:
+        """Cache-Schluessel einer Vorschau: ID plus Inhaltsstand.
+
+        Wird die Datei eines Dokuments ersetzt, berechnet der Server
+        content_hash und file_size neu - die alte Vorschau passt dann
+        nicht mehr zum Schluessel.
+        """
+        return (doc.id, doc.content_hash, doc.file_size, doc.version)
+    
     def _preview_document(self, doc: Document):
-        """PDF-Vorschau anzeigen (async Download)."""
-        temp_dir = tempfile.mkdtemp(prefix='bipro_preview_')
+        """PDF-Vorschau anzeigen (async Download, wiederholte Vorschau aus Cache)."""
+        cache_key = self._preview_cache_key(doc)
+        cached_path = self._pdf_cache.get(cache_key)
+        if cached_path and os.path.exists(cached_path):
+            self._show_pdf_preview(cached_path, doc)
+            return
+
+        from api.documents import safe_cache_filename
+        temp_dir = self._get_preview_temp_dir()
+        cache_name = safe_cache_filename(doc.id, doc.original_filename)
 
         from ui.async_worker import AsyncWorker
         self._preview_worker = AsyncWorker(
-            lambda: self.docs_api.download(doc.id, temp_dir, filename_override=doc.original_filename),
+            lambda: self.docs_api.download(doc.id, temp_dir, filename_override=cache_name),
             parent=self,
         )
 
@@ -495,8 +681,8 @@ class ArchiveView(QWidget):
         def _on_done(result):
             progress.close()
             if result and os.path.exists(result):
-                viewer = PDFViewerDialog(result, f"Vorschau: {doc.original_filename}", self)
-                viewer.exec()
+                self._pdf_cache[cache_key] = result
+                self._show_pdf_preview(result, doc)
             else:
                 self._toast("show_error", "PDF konnte nicht geladen werden.")
 
@@ -548,12 +734,28 @@ class ArchiveView(QWidget):
         progress.close()
         self._toast("show_error", f"Upload fehlgeschlagen:\n{error}")
     
+    def _pick_directory(self, title: str, on_selected) -> None:
+        """Zeigt die Ordnerauswahl nicht-blockierend (open() statt exec()).
+
+        ``on_selected(path)`` wird nur bei Bestaetigung aufgerufen.
+        """
+        dialog = QFileDialog(self, title)
+        dialog.setFileMode(QFileDialog.FileMode.Directory)
+        dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        dialog.fileSelected.connect(lambda path: path and on_selected(path))
+        dialog.finished.connect(dialog.deleteLater)
+        self._dir_dialog = dialog
+        dialog.open()
+    
     def _download_document(self, doc: Document):
         """Dokument herunterladen (async)."""
-        target_dir = QFileDialog.getExistingDirectory(self, "Speicherort wählen", "")
-        if not target_dir:
-            return
-
+        self._pick_directory(
+            "Speicherort wählen",
+            lambda target_dir: self._start_download_document(doc, target_dir),
+        )
+    
+    def _start_download_document(self, doc: Document, target_dir: str):
+        """Startet den Einzel-Download nach der Ordnerauswahl."""
         from ui.async_worker import AsyncWorker
         self._dl_single_worker = AsyncWorker(
             lambda: self.docs_api.download(doc.id, target_dir, filename_override=doc.original_filename),
@@ -613,47 +815,29 @@ class ArchiveView(QWidget):
             return
 
         doc_ids = [d.id for d in selected_docs]
-        docs_api = self.docs_api
-
-        class _BulkDeleteWorker(QThread):
-            progress_update = Signal(int, str)
-            done = Signal(int)
-            def __init__(self, api, ids, parent=None):
-                super().__init__(parent)
-                self._api, self._ids = api, ids
-            def run(self):
-                ok = 0
-                for i, did in enumerate(self._ids):
-                    self.progress_update.emit(i, f"Lösche {i+1}/{len(self._ids)}")
-                    if self._api.delete(did):
-                        ok += 1
-                self.done.emit(ok)
-
-        progress = QProgressDialog("Lösche Dokumente...", None, 0, len(doc_ids), self)
+
+        progress = QProgressDialog("Lösche Dokumente...", "Abbrechen", 0, len(doc_ids), self)
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setMinimumDuration(0)
 
-        w = _BulkDeleteWorker(docs_api, doc_ids, parent=self)
-        w.progress_update.connect(lambda i, t: (progress.setValue(i), progress.setLabelText(t)))
+        w = BulkDeleteWorker(self.docs_api, doc_ids, parent=self)
+        w.progress_update.connect(lambda i, t: _set_progress(progress, i, t))
         w.done.connect(lambda _: (progress.close(), self.refresh_documents()))
+        progress.canceled.connect(w.cancel)
         self._bulk_del_worker = w
         w.start()
     
     def _get_selected_documents(self) -> List[Document]:
         """Gibt alle ausgewählten Dokumente zurück."""
+        selection = self.table.selectionModel()
+        if selection is None:
+            return []
+        # selectedRows(0) liefert pro Zeile genau einen Index (Spalte 0 = UserRole-Dokument)
         selected_docs = []
-        selected_rows = set()
-        
-        for item in self.table.selectedItems():
-            selected_rows.add(item.row())
-        
-        for row in selected_rows:
-            doc_item = self.table.item(row, 0)
-            if doc_item:
-                doc = doc_item.data(Qt.ItemDataRole.UserRole)
-                if doc:
-                    selected_docs.append(doc)
-        
+        for index in selection.selectedRows(0):
+            doc = index.data(Qt.ItemDataRole.UserRole)
+            if doc:
+                selected_docs.append(doc)
         return selected_docs
     
     def _download_selected(self):
@@ -667,50 +851,38 @@ class ArchiveView(QWidget):
             )
             return
 
-        target_dir = QFileDialog.getExistingDirectory(
-            self, f"Speicherort für {len(selected_docs)} Dokument(e) wählen", ""
+        self._pick_directory(
+            f"Speicherort für {len(selected_docs)} Dokument(e) wählen",
+            lambda target_dir: self._start_download_batch(selected_docs, target_dir),
         )
-        if not target_dir:
-            return
-
+    
+    def _start_download_batch(self, selected_docs: List[Document], target_dir: str):
+        """Startet den Bulk-Download nach der Ordnerauswahl."""
         items = [(d.id, d.original_filename) for d in selected_docs]
-        docs_api = self.docs_api
-
-        class _BulkDLWorker(QThread):
-            progress_update = Signal(int, str)
-            done = Signal(int, int)
-            def __init__(self, api, data, dest, parent=None):
-                super().__init__(parent)
-                self._api, self._data, self._dest = api, data, dest
-            def run(self):
-                ok = fail = 0
-                for i, (did, fname) in enumerate(self._data):
-                    self.progress_update.emit(i, f"Lade: {fname}")
-                    r = self._api.download(did, self._dest, filename_override=fname)
-                    if r:
-                        ok += 1
-                    else:
-                        fail += 1
-                self.done.emit(ok, fail)
 
         progress = QProgressDialog(
-            f"Lade {len(items)} Dokument(e) herunter...", None, 0, len(items), self
+            f"Lade {len(items)} Dokument(e) herunter...", "Abbrechen", 0, len(items), self
         )
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setMinimumDuration(0)
 
         def _on_done(ok, fail):
+            progress.blockSignals(True)
             progress.close()
-            if fail == 0:
+            if w.is_cancelled():
+                self._toast("show_info",
+                    f"Download abgebrochen: {ok} Dokument(e) gespeichert. Speicherort: {target_dir}")
+            elif fail == 0:
                 self._toast("show_success",
                     f"{ok} Dokument(e) erfolgreich heruntergeladen. Speicherort: {target_dir}")
             else:
                 self._toast("show_warning",
                     f"Download: {ok} erfolgreich, {fail} fehlgeschlagen. Speicherort: {target_dir}")
 
-        w = _BulkDLWorker(docs_api, items, target_dir, parent=self)
-        w.progress_update.connect(lambda i, t: (progress.setValue(i), progress.setLabelText(t)))
+        w = BulkDownloadWorker(self.docs_api, items, target_dir, parent=self)
+        w.progress_update.connect(lambda i, t: _set_progress(progress, i, t))
         w.done.connect(_on_done)
+        progress.canceled.connect(w.cancel)
         self._bulk_dl_worker = w
         w.start()
     
@@ -723,11 +895,12 @@ class ArchiveView(QWidget):
         selected_docs = self._get_selected_documents()
         
         # Nur PDFs filtern, die noch nicht umbenannt sind
-        pdf_docs = [d for d in selected_docs if d.is_pdf and not d.ai_renamed]
+        unrenamed = self._unrenamed_pdf_ids
+        pdf_docs = [d for d in selected_docs if d.id in unrenamed]
         
         if not pdf_docs:
             # Wenn nichts ausgewaehlt oder keine PDFs, alle unbennannten anbieten
-            all_unrenamed = [d for d in self._documents if d.is_pdf and not d.ai_renamed]
+            all_unrenamed = [d for d in self._documents if d.id in unrenamed]
             
             if not all_unrenamed:
                 self._toast(
@@ -810,6 +983,8 @@ class ArchiveView(QWidget):
     def _on_ai_rename_single(self, doc_id: int, success: bool, result: str):
         """Callback wenn ein einzelnes Dokument fertig ist."""
         logger.info(f"KI-Benennung Dokument {doc_id}: {'OK' if success else 'FEHLER'} - {result}")
+        if success:
+            self._unrenamed_pdf_ids.discard(doc_id)
     
     def _on_ai_rename_finished(self, results: List[Tuple[int, bool, str]]):
         """Callback wenn alle Dokumente verarbeitet wurden."""
@@ -7,6 +7,7 @@ Einzige Nutzerinteraktion: Retry-Button bei Fehler.
 """
 
 import sys
+import time
 import logging
 from typing import Optional
 from pathlib import Path
@@ -15,10 +16,14 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QProgressBar, QFrame, QSizePolicy
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
+from PySide6.QtCore import (
+    Qt, QThread, Signal, Slot, QTimer, QMetaMethod, QMetaObject, QEventLoop
+)
 from PySide6.QtGui import QFont, QIcon
 
-from services.update_service import UpdateInfo, UpdateService, UpdateDownloadError
+from services.update_service import (
+    UpdateInfo, UpdateService, UpdateDownloadError, DOWNLOAD_PARALLEL_SEGMENTS
+)
 from i18n import de as texts
 
 from ui.styles.tokens import (
@@ -32,42 +37,120 @@ from ui.styles.tokens import (
 logger = logging.getLogger(__name__)
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Stylesheets sind fuer alle Instanzen gleich und werden einmal formatiert
+_ROOT_QSS = f"background-color: {PRIMARY_0};"
+_STATUS_QSS = f"color: {PRIMARY_900};"
+_PROGRESS_QSS = f"""
+    QProgressBar {{
+        border: none;
+        border-radius: 4px;
+        background-color: {PRIMARY_100};
+    }}
+    QProgressBar::chunk {{
+        background-color: {ACCENT_500};
+        border-radius: 4px;
+    }}
+"""
+_RETRY_QSS = f"""
+    QPushButton {{
+        background-color: {ACCENT_500};
+        color: {PRIMARY_0};
+        border: none;
+        border-radius: {RADIUS_MD};
+        padding: 8px 20px;
+        font-family: {FONT_BODY};
+        font-size: {FONT_SIZE_BODY};
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background-color: #e0872f;
+    }}
+"""
+
+
 def _format_file_size(size_bytes: int) -> str:
     """Formatiert Bytes in lesbare Groesse."""
     if size_bytes <= 0:
         return "Unbekannt"
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    # Einheit direkt aus der Bitlaenge (je 10 Bit = Faktor 1024)
+    idx = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 
 class _DownloadWorker(QThread):
-    """Worker-Thread fuer den Download des Installers."""
+    """Worker-Thread fuer den Download des Installers.
+
+    Fortschritt wird gedrosselt gemeldet: nur wenn sich der ganzzahlige
+    Prozentwert aendert oder PROGRESS_MIN_INTERVAL vergangen ist.
+    requestInterruption() bricht den Download beim naechsten Chunk ab.
+
+    Das Ergebnis heisst download_finished, damit QThread.finished
+    (Thread-Ende) nicht ueberdeckt wird.
+    """
     progress = Signal(int, int)
-    finished = Signal(str)
+    download_finished = Signal(str)
     error = Signal(str)
 
-    def __init__(self, update_service: UpdateService, update_info: UpdateInfo):
+    PROGRESS_MIN_INTERVAL = 0.1  # Sekunden
+
+    def __init__(self, update_service: UpdateService, update_info: UpdateInfo,
+                 parallel: int = DOWNLOAD_PARALLEL_SEGMENTS):
         super().__init__()
         self._service = update_service
         self._info = update_info
+        self._parallel = parallel
+        self._last_pct = -1
+        self._last_emit = 0.0
+        self._pending: Optional[tuple] = None
+        self._last_sent = (-1, -1)
+        self._has_listener = False
 
     def run(self):
+        # Ohne Empfaenger keine Fortschritts-Events erzeugen
+        self._has_listener = self.isSignalConnected(QMetaMethod.fromSignal(self.progress))
         try:
-            path = self._service.download_update(
+            # Retry nach fehlgeschlagener Installation: vorhandenen Installer nutzen
+            cached = self._service.get_cached_installer(self._info)
+            if cached is not None:
+                size = cached.stat().st_size
+                self.progress.emit(size, size)
+                self.download_finished.emit(str(cached))
+                return
+            path = self._service.download_update_parallel(
                 self._info,
+                parallel=self._parallel,
                 progress_callback=self._on_progress
             )
-            self.finished.emit(str(path))
+            # Letzten (ggf. gedrosselten) Stand immer melden
+            if self._pending is not None:
+                self.progress.emit(*self._pending)
+            self.download_finished.emit(str(path))
         except UpdateDownloadError as e:
             self.error.emit(str(e))
         except Exception as e:
             self.error.emit(str(e))
 
     def _on_progress(self, downloaded: int, total: int):
-        self.progress.emit(downloaded, total)
+        # Wird pro Chunk aufgerufen - hier greift auch requestInterruption()
+        if self.isInterruptionRequested():
+            raise UpdateDownloadError("Download abgebrochen")
+        if not self._has_listener:
+            return
+        # Identische Werte nicht erneut ueber die Thread-Grenze schicken
+        if (downloaded, total) == self._last_sent:
+            return
+        pct = downloaded * 100 // total if total > 0 else -1
+        now = time.monotonic()
+        if pct != self._last_pct or now - self._last_emit >= self.PROGRESS_MIN_INTERVAL:
+            self._last_pct = pct
+            self._last_emit = now
+            self._pending = None
+            self._last_sent = (downloaded, total)
+            self.progress.emit(downloaded, total)
+        else:
+            self._pending = (downloaded, total)
 
 
 class AutoUpdateWindow(QWidget):
@@ -79,6 +162,8 @@ class AutoUpdateWindow(QWidget):
     Einzige Ausnahme: Retry-Button bei Download-Fehler.
     """
 
+    UI_REFRESH_MS = 16  # ~60 Aktualisierungen pro Sekunde
+
     def __init__(self, update_info: UpdateInfo, update_service: UpdateService,
                  parent=None):
         super().__init__(parent)
@@ -88,6 +173,12 @@ class AutoUpdateWindow(QWidget):
         self._is_downloading = False
         self._download_started = False
         self._installation_started = False
+        # Fortschritt wird gesammelt und hoechstens einmal pro Frame gezeichnet
+        self._pending_progress: Optional[tuple] = None
+        self._last_detail = ""
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(self.UI_REFRESH_MS)
+        self._ui_timer.timeout.connect(self._flush_progress)
 
         self.setWindowFlags(
             Qt.Window
@@ -101,7 +192,7 @@ class AutoUpdateWindow(QWidget):
 
     def _setup_ui(self):
         """Baut die UI auf."""
-        self.setStyleSheet(f"background-color: {PRIMARY_0};")
+        self.setStyleSheet(_ROOT_QSS)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
@@ -132,7 +223,7 @@ class AutoUpdateWindow(QWidget):
         # Status-Text
         self._status_label = QLabel(texts.AUTO_UPDATE_DOWNLOADING)
         self._status_label.setFont(QFont(FONT_BODY, 11))
-        self._status_label.setStyleSheet(f"color: {PRIMARY_900};")
+        self._status_label.setStyleSheet(_STATUS_QSS)
         self._status_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self._status_label)
 
@@ -142,17 +233,7 @@ class AutoUpdateWindow(QWidget):
         self._progress_bar.setValue(0)
         self._progress_bar.setTextVisible(False)
         self._progress_bar.setFixedHeight(8)
-        self._progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: none;
-                border-radius: 4px;
-                background-color: {PRIMARY_100};
-            }}
-            QProgressBar::chunk {{
-                background-color: {ACCENT_500};
-                border-radius: 4px;
-            }}
-        """)
+        self._progress_bar.setStyleSheet(_PROGRESS_QSS)
         layout.addWidget(self._progress_bar)
 
         # Detail-Zeile (z.B. "12.3 MB / 45.0 MB")
@@ -179,21 +260,7 @@ class AutoUpdateWindow(QWidget):
         self._retry_btn = QPushButton(texts.AUTO_UPDATE_RETRY)
         self._retry_btn.setMinimumWidth(160)
         self._retry_btn.setMinimumHeight(36)
-        self._retry_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {ACCENT_500};
-                color: {PRIMARY_0};
-                border: none;
-                border-radius: {RADIUS_MD};
-                padding: 8px 20px;
-                font-family: {FONT_BODY};
-                font-size: {FONT_SIZE_BODY};
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #e0872f;
-            }}
-        """)
+        self._retry_btn.setStyleSheet(_RETRY_QSS)
         self._retry_btn.clicked.connect(self._start_download)
         retry_layout.addWidget(self._retry_btn)
         retry_layout.addStretch()
@@ -209,46 +276,75 @@ class AutoUpdateWindow(QWidget):
         super().showEvent(event)
         if not self._download_started:
             self._download_started = True
-            QTimer.singleShot(100, self._start_download)
+            # Naechster Event-Loop-Durchlauf genuegt, damit das Fenster steht
+            QMetaObject.invokeMethod(self, "_start_download", Qt.QueuedConnection)
 
+    @Slot()
     def _start_download(self):
         """Startet den Download des Updates."""
         if self._is_downloading:
             return
 
         self._is_downloading = True
+        self._last_pct_shown = -1
+        self._progress_fmt = {'downloaded': '', 'total': None}
         self._error_frame.setVisible(False)
         self._progress_bar.setVisible(True)
         self._progress_bar.setValue(0)
         self._detail_label.setVisible(True)
         self._status_label.setText(texts.AUTO_UPDATE_DOWNLOADING)
-        self._status_label.setStyleSheet(f"color: {PRIMARY_900};")
+        self._status_label.setStyleSheet(_STATUS_QSS)
 
         self._download_worker = _DownloadWorker(self._update_service, self._update_info)
-        self._download_worker.progress.connect(self._on_progress)
-        self._download_worker.finished.connect(self._on_download_finished)
+        self._pending_progress = None
+        self._download_worker.progress.connect(self._stash_progress)
+        self._download_worker.download_finished.connect(self._on_download_finished)
         self._download_worker.error.connect(self._on_download_error)
         self._download_worker.start()
+        self._ui_timer.start()
+
+    def _stash_progress(self, downloaded: int, total: int):
+        """Merkt sich den neuesten Fortschritt fuer den naechsten Frame."""
+        self._pending_progress = (downloaded, total)
+
+    def _flush_progress(self):
+        """Zeichnet den zuletzt gemeldeten Fortschritt (Timer-Slot)."""
+        pending = self._pending_progress
+        if pending is None:
+            return
+        self._pending_progress = None
+        self._on_progress(*pending)
 
     def _on_progress(self, downloaded: int, total: int):
-        """Aktualisiert den Fortschritt."""
+        """Aktualisiert den Fortschritt (nur bei geaendertem Prozentwert)."""
         if total > 0:
             percent = int(downloaded / total * 100)
+            if percent == self._last_pct_shown:
+                return
+            self._last_pct_shown = percent
+            fmt = self._progress_fmt
+            # Gesamtgroesse aendert sich waehrend des Downloads nicht
+            if fmt['total'] is None:
+                fmt['total'] = _format_file_size(total)
+            fmt['downloaded'] = _format_file_size(downloaded)
             self._progress_bar.setValue(percent)
-            self._detail_label.setText(
-                texts.UPDATE_DOWNLOAD_PROGRESS.format(
-                    downloaded=_format_file_size(downloaded),
-                    total=_format_file_size(total),
-                )
-            )
+            self._set_detail(texts.UPDATE_DOWNLOAD_PROGRESS.format_map(fmt))
         else:
-            self._detail_label.setText(_format_file_size(downloaded))
+            self._set_detail(_format_file_size(downloaded))
+
+    def _set_detail(self, text: str):
+        """Setzt die Detail-Zeile nur bei geaendertem Text (spart Relayout)."""
+        if text != self._last_detail:
+            self._last_detail = text
+            self._detail_label.setText(text)
 
     def _on_download_finished(self, path: str):
         """Download abgeschlossen - Mutex freigeben, dann Installation starten."""
+        self._ui_timer.stop()
+        self._pending_progress = None
         self._progress_bar.setValue(100)
         self._status_label.setText(texts.AUTO_UPDATE_INSTALLING)
-        self._detail_label.setText("")
+        self._set_detail("")
 
         try:
             from main import release_single_instance_mutex
@@ -264,6 +360,8 @@ class AutoUpdateWindow(QWidget):
 
     def _on_download_error(self, error_msg: str):
         """Download fehlgeschlagen - Retry-Button anzeigen."""
+        self._ui_timer.stop()
+        self._pending_progress = None
         self._is_downloading = False
         self._progress_bar.setVisible(False)
         self._detail_label.setVisible(False)
@@ -279,9 +377,15 @@ class AutoUpdateWindow(QWidget):
     def closeEvent(self, event):
         """Verhindert Schliessen waehrend Download, erlaubt nach Installations-Start."""
         if self._installation_started:
-            if self._download_worker and self._download_worker.isRunning():
-                self._download_worker.quit()
-                self._download_worker.wait(3000)
+            worker = self._download_worker
+            if worker and worker.isRunning():
+                # Auf das Thread-Ende warten, ohne die Event-Loop zu blockieren
+                loop = QEventLoop(self)
+                worker.finished.connect(loop.quit)
+                QTimer.singleShot(3000, loop.quit)
+                worker.requestInterruption()
+                if worker.isRunning():
+                    loop.exec()
             event.accept()
         else:
             event.ignore()
@@ -5,14 +5,18 @@ Dialog für Benutzer-Anmeldung.
 """
 
 import os
+import shutil
 import logging
+import tempfile
+import time
+from typing import Optional
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLineEdit, QPushButton, QLabel, QCheckBox,
     QProgressBar
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QObject, Signal, QRunnable, QThreadPool, QSettings
 from PySide6.QtGui import QFont, QPixmap
 
 from api.client import APIClient, APIError
@@ -22,15 +26,37 @@ from ui.styles.tokens import TEXT_SECONDARY, BLUE_BRIGHT, ERROR
 
 logger = logging.getLogger(__name__)
 
+_ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
 
-class LoginWorker(QThread):
-    """Worker-Thread für Login (blockiert nicht die UI)."""
+# Ein erfolgreicher Verbindungstest gilt so lange (Sekunden) als aktuell;
+# ein Neustart innerhalb dieser Zeit ueberspringt den Test
+_CONNECTION_OK_TTL_S = 30
+_CONNECTION_OK_KEY = "login/last_connection_ok"
+
+# Farben des Status-Labels, gewaehlt ueber die dynamische Property "status"
+_STATUS_QSS = (
+    "QLabel[status='ok'] { color: green; }"
+    "QLabel[status='err'] { color: red; }"
+    f"QLabel[status='invalid'] {{ color: {ERROR}; }}"
+    "QLabel[status='muted'] { color: gray; }"
+    f"QLabel[status='secondary'] {{ color: {TEXT_SECONDARY}; }}"
+    f"QLabel[status='info'] {{ color: {BLUE_BRIGHT}; }}"
+)
+
+
+class _WorkerSignals(QObject):
+    """Signale für die Login-Runnables (QRunnable hat keine eigenen)."""
     
-    finished = Signal(object)  # AuthState
+    finished = Signal(object)
     error = Signal(str)
+
+
+class LoginRunnable(QRunnable):
+    """Login im Thread-Pool (blockiert nicht die UI)."""
     
     def __init__(self, auth_api: AuthAPI, username: str, password: str, remember: bool):
         super().__init__()
+        self.signals = _WorkerSignals()
         self.auth_api = auth_api
         self.username = username
         self.password = password
@@ -39,23 +65,64 @@ class LoginWorker(QThread):
     def run(self):
         try:
             state = self.auth_api.login(self.username, self.password, self.remember)
-            self.finished.emit(state)
+            self.signals.finished.emit(state)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+class AutoLoginRunnable(QRunnable):
+    """Auto-Login mit gespeichertem Token im Thread-Pool."""
+    
+    def __init__(self, auth_api: AuthAPI):
+        super().__init__()
+        self.signals = _WorkerSignals()
+        self.auth_api = auth_api
+    
+    def run(self):
+        try:
+            state = self.auth_api.try_auto_login()
         except Exception as e:
-            self.error.emit(str(e))
+            logger.warning(f"Auto-Login fehlgeschlagen: {e}")
+            state = AuthState(is_authenticated=False)
+        self.signals.finished.emit(state)
 
 
-class ConnectionCheckWorker(QThread):
-    """Worker-Thread für Verbindungstest."""
+class ClientInitRunnable(QRunnable):
+    """Baut API-Client und Auth-API im Thread-Pool auf."""
     
-    finished = Signal(bool)
+    def __init__(self):
+        super().__init__()
+        self.signals = _WorkerSignals()
+    
+    def run(self):
+        client = APIClient()
+        self.signals.finished.emit((client, AuthAPI(client)))
+
+
+class ConnectionCheckRunnable(QRunnable):
+    """Verbindungstest im Thread-Pool."""
     
     def __init__(self, client: APIClient):
         super().__init__()
+        self.signals = _WorkerSignals()
         self.client = client
     
     def run(self):
         result = self.client.check_connection()
-        self.finished.emit(result)
+        self.signals.finished.emit(result)
+
+
+class _CacheCleanRunnable(QRunnable):
+    """Loescht ein Cache-Verzeichnis im Hintergrund."""
+    
+    def __init__(self, cache_dir: str):
+        super().__init__()
+        self.cache_dir = cache_dir
+    
+    def run(self):
+        if os.path.isdir(self.cache_dir):
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            logger.info(f"Vorschau-Cache geloescht: {self.cache_dir}")
 
 
 class LoginDialog(QDialog):
@@ -69,19 +136,46 @@ class LoginDialog(QDialog):
             auth = dialog.get_auth()
     """
     
+    # Skaliertes Logo, einmal geladen und von allen Instanzen geteilt
+    _LOGO_PIXMAP: Optional[QPixmap] = None
+    # Titel-Schrift, ebenfalls nur einmal aufgebaut
+    _TITLE_FONT: Optional[QFont] = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        self.client = APIClient()
-        self.auth_api = AuthAPI(self.client)
-        self._login_worker = None
-        self._check_worker = None
+        # Client/Auth werden beim ersten Anzeigen im Hintergrund aufgebaut
+        self.client: Optional[APIClient] = None
+        self.auth_api: Optional[AuthAPI] = None
+        # Nur die Signal-Objekte werden gehalten, die Runnables gehoeren dem Pool
+        self._init_signals = None
+        self._login_signals = None
+        self._check_signals = None
+        self._auto_login_signals = None
+        # Nach dem Schliessen eintreffende Ergebnisse werden verworfen
+        self._closed = False
         
         self.setWindowTitle("ACENCIA ATLAS - Anmeldung")
         self.setFixedSize(400, 420)
         self.setModal(True)
         
         self._setup_ui()
+    
+    def showEvent(self, event):
+        """Startet beim ersten Anzeigen den Aufbau des API-Clients."""
+        super().showEvent(event)
+        if self._init_signals is None and self.client is None:
+            runnable = ClientInitRunnable()
+            self._init_signals = runnable.signals
+            self._init_signals.finished.connect(self._on_client_ready)
+            QThreadPool.globalInstance().start(runnable)
+    
+    def _on_client_ready(self, result: tuple):
+        """Callback nach Aufbau des API-Clients - prüft danach die Verbindung."""
+        if self._closed:
+            result[0].close()
+            return
+        self.client, self.auth_api = result
         self._check_connection()
     
     def _setup_ui(self):
@@ -93,19 +187,25 @@ class LoginDialog(QDialog):
         # App-Logo
         logo_label = QLabel()
         logo_label.setAlignment(Qt.AlignCenter)
-        logo_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "logo.png")
-        if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path)
-            scaled = pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            logo_label.setPixmap(scaled)
+        if LoginDialog._LOGO_PIXMAP is None:
+            # Fehlende Datei liefert ein Null-Pixmap, ein extra stat() ist unnoetig
+            pixmap = QPixmap(os.path.join(_ASSETS_DIR, "logo.png"))
+            if not pixmap.isNull():
+                LoginDialog._LOGO_PIXMAP = pixmap.scaled(
+                    100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation
+                )
+        if LoginDialog._LOGO_PIXMAP is not None:
+            logo_label.setPixmap(LoginDialog._LOGO_PIXMAP)
         layout.addWidget(logo_label)
         
         # Titel
         title = QLabel("ACENCIA ATLAS")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        if LoginDialog._TITLE_FONT is None:
+            title_font = QFont()
+            title_font.setPointSize(14)
+            title_font.setBold(True)
+            LoginDialog._TITLE_FONT = title_font
+        title.setFont(LoginDialog._TITLE_FONT)
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
@@ -118,7 +218,8 @@ class LoginDialog(QDialog):
         # Status-Label
         self.status_label = QLabel("Verbindung wird geprüft...")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("color: gray;")
+        self.status_label.setStyleSheet(_STATUS_QSS)
+        self.status_label.setProperty("status", "muted")
         layout.addWidget(self.status_label)
         
         # Formular
@@ -170,17 +271,41 @@ class LoginDialog(QDialog):
         """Fokus auf Passwort-Feld."""
         self.password_input.setFocus()
     
+    def _set_status(self, text: str, kind: str):
+        """Setzt Text und Farbe des Status-Labels ohne QSS neu zu parsen."""
+        self.status_label.setText(text)
+        if self.status_label.property("status") != kind:
+            self.status_label.setProperty("status", kind)
+            style = self.status_label.style()
+            style.unpolish(self.status_label)
+            style.polish(self.status_label)
+    
     def _check_connection(self):
-        """Prüft Verbindung zum Server."""
-        self._check_worker = ConnectionCheckWorker(self.client)
-        self._check_worker.finished.connect(self._on_connection_checked)
-        self._check_worker.start()
+        """Prüft Verbindung zum Server (entfaellt nach kurz zuvor erfolgreichem Test)."""
+        settings = QSettings("ACENCIA GmbH", "ACENCIA ATLAS")
+        last_ok = settings.value(_CONNECTION_OK_KEY, 0, type=int)
+        if 0 <= time.time() - last_ok < _CONNECTION_OK_TTL_S:
+            self._on_connection_checked(True)
+            return
+        runnable = ConnectionCheckRunnable(self.client)
+        self._check_signals = runnable.signals
+        self._check_signals.finished.connect(self._on_connection_result)
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _on_connection_result(self, connected: bool):
+        """Ergebnis des echten Verbindungstests - Erfolg wird gemerkt."""
+        if connected:
+            QSettings("ACENCIA GmbH", "ACENCIA ATLAS").setValue(
+                _CONNECTION_OK_KEY, int(time.time())
+            )
+        self._on_connection_checked(connected)
     
     def _on_connection_checked(self, connected: bool):
         """Callback nach Verbindungscheck."""
+        if self._closed:
+            return
         if connected:
-            self.status_label.setText("Verbunden mit Server")
-            self.status_label.setStyleSheet("color: green;")
+            self._set_status("Verbunden mit Server", "ok")
             self.login_button.setEnabled(True)
             self.username_input.setFocus()
             
@@ -190,58 +315,66 @@ class LoginDialog(QDialog):
                 state = try_dev_login(self.client, self.auth_api)
                 if state:
                     if state.is_authenticated:
-                        self.status_label.setText(f"Dev-Auth: Angemeldet als {state.user.username}")
-                        self.status_label.setStyleSheet("color: green;")
+                        self._set_status(f"Dev-Auth: Angemeldet als {state.user.username}", "ok")
                         self.accept()
                         return
                     if state.tenants:
-                        self.status_label.setText("Dev-Auth: Universe auswaehlen...")
-                        self.status_label.setStyleSheet(f"color: {BLUE_BRIGHT};")
+                        self._set_status("Dev-Auth: Universe auswaehlen...", "info")
                         self._show_universe_selector(state)
                         return
             self._try_auto_login()
         else:
-            self.status_label.setText("Server nicht erreichbar")
-            self.status_label.setStyleSheet("color: red;")
+            self._set_status("Server nicht erreichbar", "err")
             self.login_button.setEnabled(False)
     
     def _try_auto_login(self):
-        """Versucht Auto-Login mit gespeichertem Token."""
-        state = self.auth_api.try_auto_login()
+        """Versucht Auto-Login mit gespeichertem Token (im Hintergrund)."""
+        # Manueller Login erst nach dem Ergebnis, sonst konkurrieren beide um den Token
+        self.login_button.setEnabled(False)
+        self._set_status("Sitzung wird geprüft...", "muted")
+        runnable = AutoLoginRunnable(self.auth_api)
+        self._auto_login_signals = runnable.signals
+        self._auto_login_signals.finished.connect(self._on_auto_login_finished)
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _on_auto_login_finished(self, state: AuthState):
+        """Callback nach Auto-Login-Versuch."""
+        self._auto_login_signals = None
+        if self._closed:
+            return
+        self.login_button.setEnabled(True)
         if state.is_authenticated:
-            self.status_label.setText(f"Willkommen zurück, {state.user.username}!")
-            self.status_label.setStyleSheet("color: green;")
+            self._set_status(f"Willkommen zurück, {state.user.username}!", "ok")
             self.accept()
         else:
+            self._set_status("Verbunden mit Server", "ok")
             self._clear_local_caches()
     
     def _clear_local_caches(self):
-        """Loescht alle lokalen Caches wenn keine gueltige Session vorhanden ist."""
-        import shutil
-        import tempfile
+        """Loescht alle lokalen Caches wenn keine gueltige Session vorhanden ist.
         
+        Das Loeschen laeuft im globalen Thread-Pool, damit der Dialog auf
+        langsamen Laufwerken nicht einfriert.
+        """
         cache_dir = os.path.join(tempfile.gettempdir(), 'bipro_preview_cache')
-        if os.path.isdir(cache_dir):
-            try:
-                shutil.rmtree(cache_dir)
-                logger.info(f"Vorschau-Cache geloescht: {cache_dir}")
-            except Exception as e:
-                logger.debug(f"Cache-Bereinigung fehlgeschlagen: {e}")
+        QThreadPool.globalInstance().start(_CacheCleanRunnable(cache_dir))
     
     def _do_login(self):
         """Login durchführen."""
+        # Auch Enter im Passwortfeld wartet auf das Auto-Login-Ergebnis
+        if self.auth_api is None or self._auto_login_signals is not None:
+            return
+        
         username = self.username_input.text().strip()
         password = self.password_input.text()
         
         if not username:
-            self.status_label.setText("Bitte Benutzername eingeben.")
-            self.status_label.setStyleSheet(f"color: {ERROR};")
+            self._set_status("Bitte Benutzername eingeben.", "invalid")
             self.username_input.setFocus()
             return
         
         if not password:
-            self.status_label.setText("Bitte Passwort eingeben.")
-            self.status_label.setStyleSheet(f"color: {ERROR};")
+            self._set_status("Bitte Passwort eingeben.", "invalid")
             self.password_input.setFocus()
             return
         
@@ -250,37 +383,36 @@ class LoginDialog(QDialog):
         self.username_input.setEnabled(False)
         self.password_input.setEnabled(False)
         self.progress.show()
-        self.status_label.setText("Anmeldung läuft...")
-        self.status_label.setStyleSheet("color: gray;")
+        self._set_status("Anmeldung läuft...", "muted")
         
         # Login im Hintergrund
-        self._login_worker = LoginWorker(
+        runnable = LoginRunnable(
             self.auth_api,
             username,
             password,
             self.remember_check.isChecked()
         )
-        self._login_worker.finished.connect(self._on_login_finished)
-        self._login_worker.error.connect(self._on_login_error)
-        self._login_worker.start()
+        self._login_signals = runnable.signals
+        self._login_signals.finished.connect(self._on_login_finished)
+        self._login_signals.error.connect(self._on_login_error)
+        QThreadPool.globalInstance().start(runnable)
     
     def _on_login_finished(self, state: AuthState):
         """Callback nach Login."""
+        if self._closed:
+            return
         self.progress.hide()
         
         if state.is_authenticated:
-            self.status_label.setText(f"Willkommen, {state.user.username}!")
-            self.status_label.setStyleSheet("color: green;")
+            self._set_status(f"Willkommen, {state.user.username}!", "ok")
             self.accept()
         elif state.tenants and len(state.tenants) > 1:
             self._show_universe_selector(state)
         elif state.tenants and len(state.tenants) == 0:
-            self.status_label.setText("Kein Universe zugeordnet")
-            self.status_label.setStyleSheet("color: red;")
+            self._set_status("Kein Universe zugeordnet", "err")
             self._enable_inputs()
         else:
-            self.status_label.setText("Anmeldung fehlgeschlagen")
-            self.status_label.setStyleSheet("color: red;")
+            self._set_status("Anmeldung fehlgeschlagen", "err")
             self.password_input.clear()
             self.password_input.setFocus()
             self._enable_inputs()
@@ -290,15 +422,13 @@ class LoginDialog(QDialog):
         active_tenants = [t for t in state.tenants if t.status == 'active']
 
         if not active_tenants:
-            self.status_label.setText("Keine aktiven Universes verfuegbar")
-            self.status_label.setStyleSheet("color: red;")
+            self._set_status("Keine aktiven Universes verfuegbar", "err")
             self._enable_inputs()
             return
 
         dialog = UniverseSelectorDialog(state.tenants, self)
         if dialog.exec() == UniverseSelectorDialog.Accepted and dialog.selected_tenant_id:
-            self.status_label.setText("Universe wird geladen...")
-            self.status_label.setStyleSheet(f"color: {TEXT_SECONDARY};")
+            self._set_status("Universe wird geladen...", "secondary")
             self.progress.show()
 
             try:
@@ -309,31 +439,27 @@ class LoginDialog(QDialog):
                 self.progress.hide()
 
                 if select_state.is_authenticated:
-                    self.status_label.setText(
-                        f"Willkommen, {select_state.user.username}!"
-                    )
-                    self.status_label.setStyleSheet("color: green;")
+                    self._set_status(f"Willkommen, {select_state.user.username}!", "ok")
                     self.accept()
                 else:
-                    self.status_label.setText("Universe-Auswahl fehlgeschlagen")
-                    self.status_label.setStyleSheet("color: red;")
+                    self._set_status("Universe-Auswahl fehlgeschlagen", "err")
                     self._enable_inputs()
 
             except Exception as e:
                 self.progress.hide()
                 logger.error(f"Universe-Auswahl Fehler: {e}")
-                self.status_label.setText(str(e))
-                self.status_label.setStyleSheet("color: red;")
+                self._set_status(str(e), "err")
                 self._enable_inputs()
         else:
             self._enable_inputs()
     
     def _on_login_error(self, error_msg: str):
         """Callback bei Login-Fehler."""
+        if self._closed:
+            return
         self.progress.hide()
         display_msg = error_msg if error_msg else "Verbindungsfehler"
-        self.status_label.setText(display_msg)
-        self.status_label.setStyleSheet("color: red;")
+        self._set_status(display_msg, "err")
         self.password_input.clear()
         self.password_input.setFocus()
         self._enable_inputs()
@@ -344,6 +470,19 @@ class LoginDialog(QDialog):
         self.username_input.setEnabled(True)
         self.password_input.setEnabled(True)
     
+    def done(self, result: int):
+        """Schliesst den Dialog; laufende Hintergrund-Aufgaben werden ignoriert.
+
+        Die Runnables gehoeren dem globalen Pool und laufen ggf. noch zu Ende,
+        ihre Ergebnisse duerfen den geschlossenen Dialog aber nicht mehr
+        veraendern (z.B. ein spaetes accept() nach Abbrechen).
+        """
+        self._closed = True
+        if result != QDialog.Accepted and self.client is not None:
+            # Abbruch - offene Verbindungen des nicht genutzten Clients schliessen
+            self.client.close()
+        super().done(result)
+    
     def get_client(self) -> APIClient:
         """Gibt den authentifizierten API-Client zurück."""
         return self.client
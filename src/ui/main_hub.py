@@ -14,7 +14,7 @@ Design: ACENCIA Corporate Identity
 import os
 import logging
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -22,8 +22,11 @@ from PySide6.QtWidgets import (
     QProgressDialog
 )
 from ui.toast import ToastManager
-from PySide6.QtCore import Qt, Signal, QTimer, QThread
-from PySide6.QtGui import QFont, QIcon, QDragEnterEvent, QDropEvent
+from PySide6.QtCore import Qt, Signal, QTimer, QThread, QSize
+from PySide6.QtGui import (
+    QFont, QIcon, QPixmap, QPainter, QColor, QGuiApplication,
+    QDragEnterEvent, QDropEvent,
+)
 
 logger = logging.getLogger(__name__)
 hb_logger = logging.getLogger('heartbeat.core')
@@ -44,6 +47,30 @@ from ui.styles.tokens import (
     SIDEBAR_WIDTH_INT, BORDER_SUBTLE,
 )
 
+# Gemeinsames Stylesheet fuer die Labels der Hub-Sidebar (per objectName),
+# wird einmal an die Sidebar gehaengt statt je Label gesetzt
+_SIDEBAR_LABEL_QSS = f"""
+    QLabel#hubUserLabel {{
+        color: {PRIMARY_500};
+        font-size: {FONT_SIZE_CAPTION};
+    }}
+    QLabel#hubNavLabel {{
+        color: {PRIMARY_500};
+        font-size: {FONT_SIZE_CAPTION};
+        padding: 16px 20px 8px 20px;
+        letter-spacing: 1px;
+    }}
+    QLabel#hubNotificationBadge {{
+        background-color: {ACCENT_500};
+        color: white;
+        border-radius: 9px;
+        padding: 1px 5px;
+        font-size: 10px;
+        font-weight: bold;
+        min-width: 18px;
+    }}
+"""
+
 
 class UpdateCheckWorker(QThread):
     """Prueft periodisch auf Updates im Hintergrund."""
@@ -65,39 +92,75 @@ class UpdateCheckWorker(QThread):
             pass  # Periodischer Check darf nie crashen
 
 
+# Groesse der Navigations-Icons (logische Pixel)
+_NAV_ICON_SIZE = 20
+
+# Gerenderte Navigations-Icons je Glyph (einmal erzeugt, von allen Buttons geteilt)
+_ICONS: Dict[str, QIcon] = {}
+
+
+def _glyph_icon(glyph: str) -> QIcon:
+    """Rendert ein Emoji einmalig in ein Pixmap-Icon.
+
+    Der Button zeichnet danach nur noch das gecachte Pixmap, statt das
+    Emoji samt Font-Fallback bei jedem Repaint neu zu shapen.
+    """
+    icon = _ICONS.get(glyph)
+    if icon is None:
+        dpr = QGuiApplication.instance().devicePixelRatio()
+        pixmap = QPixmap(round(_NAV_ICON_SIZE * dpr), round(_NAV_ICON_SIZE * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QColor(0, 0, 0, 0))
+        painter = QPainter(pixmap)
+        font = QFont()
+        font.setPixelSize(_NAV_ICON_SIZE - 4)
+        painter.setFont(font)
+        painter.setPen(QColor(SIDEBAR_TEXT))
+        painter.drawText(0, 0, _NAV_ICON_SIZE, _NAV_ICON_SIZE, Qt.AlignmentFlag.AlignCenter, glyph)
+        painter.end()
+        icon = QIcon(pixmap)
+        _ICONS[glyph] = icon
+    return icon
+
+
 class NavButton(QPushButton):
     """
     Navigations-Button für die dunkle Sidebar.
     ACENCIA Design: Weiß auf dunkelblau, Orange bei aktiv.
     """
     
+    # Fuer alle Buttons gleich - einmal beim Import formatiert
+    _STYLE = f"""
+        QPushButton {{
+            background-color: transparent;
+            border: none;
+            border-left: 3px solid transparent;
+            border-radius: 0px;
+            padding: 12px 16px;
+            text-align: left;
+            font-family: {FONT_BODY};
+            font-size: {FONT_SIZE_BODY};
+            color: {SIDEBAR_TEXT};
+        }}
+        QPushButton:hover {{
+            background-color: {SIDEBAR_HOVER};
+        }}
+        QPushButton:checked {{
+            background-color: {SIDEBAR_HOVER};
+            border-left: 3px solid {ACCENT_500};
+            color: {SIDEBAR_TEXT};
+            font-weight: 500;
+        }}
+    """
+    
     def __init__(self, icon: str, text: str, parent=None):
         super().__init__(parent)
-        self.setText(f"  {icon}  {text}")
+        self.setIcon(_glyph_icon(icon))
+        self.setIconSize(QSize(_NAV_ICON_SIZE, _NAV_ICON_SIZE))
+        self.setText(f"  {text}")
         self.setCheckable(True)
         self.setMinimumHeight(48)
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                border-left: 3px solid transparent;
-                border-radius: 0px;
-                padding: 12px 16px;
-                text-align: left;
-                font-family: {FONT_BODY};
-                font-size: {FONT_SIZE_BODY};
-                color: {SIDEBAR_TEXT};
-            }}
-            QPushButton:hover {{
-                background-color: {SIDEBAR_HOVER};
-            }}
-            QPushButton:checked {{
-                background-color: {SIDEBAR_HOVER};
-                border-left: 3px solid {ACCENT_500};
-                color: {SIDEBAR_TEXT};
-                font-weight: 500;
-            }}
-        """)
+        self.setStyleSheet(NavButton._STYLE)
 
 
 class DropUploadWorker(QThread):
@@ -345,6 +408,9 @@ class MainHub(QMainWindow):
 
     back_to_dashboard_requested = Signal()
 
+    # Headline-Schrift der Placeholder, einmal aufgebaut und geteilt
+    _HEADLINE_FONT: Optional[QFont] = None
+
     def navigate_to_admin(self):
         """Oeffentliche Methode: Admin-Ansicht oeffnen (vom AppRouter aufrufbar)."""
         self._show_admin()
@@ -385,6 +451,7 @@ class MainHub(QMainWindow):
         
         self.api_client = api_client
         self.auth_api = auth_api
+        self._force_close = False
         
         # Lazy-loaded Views
         self._bipro_view = None
@@ -396,7 +463,8 @@ class MainHub(QMainWindow):
         self._chat_view = None
         
         # Fenstertitel
-        username = auth_api.current_user.username if auth_api.current_user else "Unbekannt"
+        user = auth_api.current_user
+        username = user.username if user else "Unbekannt"
         self.setWindowTitle(f"ACENCIA ATLAS - {username}")
         self.setMinimumSize(1400, 900)
         
@@ -436,7 +504,7 @@ class MainHub(QMainWindow):
         
         # System-Status (Live-Zugangs-Check, wird vom GlobalHeartbeat gesteuert)
         from ui.maintenance_overlay import MaintenanceOverlay
-        self._maintenance_overlay = MaintenanceOverlay(self.api_client, self.auth_api.current_user, self)
+        self._maintenance_overlay = MaintenanceOverlay(self.api_client, user, self)
         self._system_status_worker = None
         self._maintenance_pending = False
         
@@ -453,31 +521,26 @@ class MainHub(QMainWindow):
         main_layout.setSpacing(0)
         
         self._sidebar = ModuleSidebar("sidebar", parent=central)
+        self._sidebar.setStyleSheet(self._sidebar.styleSheet() + _SIDEBAR_LABEL_QSS)
         self._sidebar.back_requested.connect(self.back_to_dashboard_requested.emit)
 
         self._sidebar.add_spacing(8)
 
-        if self.auth_api.current_user:
+        # Einmal lesen, gilt fuer den gesamten Sidebar-Aufbau
+        user = self.auth_api.current_user
+        if user:
             user_container = QWidget()
             user_layout = QHBoxLayout(user_container)
             user_layout.setContentsMargins(20, 8, 20, 16)
 
-            user_label = QLabel(f"\u25CF {self.auth_api.current_user.username}")
-            user_label.setStyleSheet(f"""
-                color: {PRIMARY_500};
-                font-size: {FONT_SIZE_CAPTION};
-            """)
+            user_label = QLabel(f"\u25CF {user.username}")
+            user_label.setObjectName("hubUserLabel")
             user_layout.addWidget(user_label)
             user_layout.addStretch()
             self._sidebar.add_widget(user_container)
 
         nav_label = QLabel("BEREICHE")
-        nav_label.setStyleSheet(f"""
-            color: {PRIMARY_500};
-            font-size: {FONT_SIZE_CAPTION};
-            padding: 16px 20px 8px 20px;
-            letter-spacing: 1px;
-        """)
+        nav_label.setObjectName("hubNavLabel")
         self._sidebar.add_widget(nav_label)
 
         self.btn_center = NavButton("\U0001F514", texts.NAV_MESSAGE_CENTER)
@@ -485,17 +548,7 @@ class MainHub(QMainWindow):
         self._sidebar.add_widget(self.btn_center)
 
         self._notification_badge = QLabel("", self.btn_center)
-        self._notification_badge.setStyleSheet(f"""
-            QLabel {{
-                background-color: {ACCENT_500};
-                color: white;
-                border-radius: 9px;
-                padding: 1px 5px;
-                font-size: 10px;
-                font-weight: bold;
-                min-width: 18px;
-            }}
-        """)
+        self._notification_badge.setObjectName("hubNotificationBadge")
         self._notification_badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._notification_badge.setFixedHeight(18)
         self._notification_badge.move(self.btn_center.width() - 36, 6)
@@ -513,16 +566,14 @@ class MainHub(QMainWindow):
         self.btn_gdv.clicked.connect(self._show_gdv)
         self._sidebar.add_widget(self.btn_gdv)
 
-        user_core = self.auth_api.current_user
-        if user_core and user_core.is_module_admin('core'):
+        if user and user.is_module_admin('core'):
             self.btn_core_admin = NavButton("\U0001F6E0", texts.MODULE_ADMIN_BTN)
             self.btn_core_admin.clicked.connect(self._show_core_module_admin)
             self._sidebar.add_widget(self.btn_core_admin)
         else:
             self.btn_core_admin = None
 
-        user_prov = self.auth_api.current_user
-        if user_prov and user_prov.has_module('provision'):
+        if user and user.has_module('provision'):
             self.btn_provision = NavButton("\U0001F4B0", texts.PROVISION_NAV_TITLE)
             self.btn_provision.clicked.connect(self._show_provision)
         else:
@@ -531,7 +582,6 @@ class MainHub(QMainWindow):
         self._sidebar.add_stretch()
 
         self._admin_nav_widgets = []
-        user = self.auth_api.current_user
         if user and user.is_admin:
             self.btn_admin = NavButton("\U0001F465", texts.NAV_ADMIN_VIEW)
             self.btn_admin.clicked.connect(self._show_admin)
@@ -545,36 +595,17 @@ class MainHub(QMainWindow):
         self.content_stack.setStyleSheet(f"background-color: {PRIMARY_0};")
         main_layout.addWidget(self.content_stack)
         
-        # Placeholder-Widgets (werden bei Bedarf ersetzt)
-        # Index 0: Mitteilungszentrale
-        self._placeholder_center = self._create_placeholder(texts.MSG_CENTER_TITLE, texts.MSG_CENTER_LOADING)
-        self.content_stack.addWidget(self._placeholder_center)      # Index 0
-        
-        # Index 1: Datenabruf
-        self._placeholder_bipro = self._create_placeholder(texts.NAV_BIPRO, "Wird geladen...")
-        self.content_stack.addWidget(self._placeholder_bipro)       # Index 1
-        
-        # Index 2: Archiv
-        self._placeholder_archive = self._create_placeholder("Dokumentenarchiv", "Wird geladen...")
-        self.content_stack.addWidget(self._placeholder_archive)     # Index 2
-        
-        # Index 3: GDV
-        self._placeholder_gdv = self._create_placeholder("GDV Editor", "Wird geladen...")
-        self.content_stack.addWidget(self._placeholder_gdv)         # Index 3
-        
-        # Index 4: Provision (nur mit Recht)
-        if self.btn_provision:
-            self._placeholder_provision = self._create_placeholder(texts.PROVISION_NAV_TITLE, texts.PROVISION_LOADING)
-            self.content_stack.addWidget(self._placeholder_provision)  # Index 4
-        
-        # Index 5: Admin (nur fuer Admins) -- verschoben wg. Provision
-        if self.btn_admin:
-            self._placeholder_admin = self._create_placeholder(texts.NAV_ADMIN_VIEW, texts.LOADING)
-            self.content_stack.addWidget(self._placeholder_admin)   # Index 5 (oder 4 ohne Provision)
-        
-        # Index 6: Chat (Vollbild) - Placeholder
-        self._placeholder_chat = self._create_placeholder(texts.CHAT_TITLE, texts.MSG_CENTER_LOADING)
-        self.content_stack.addWidget(self._placeholder_chat)        # dynamischer Index
+        # Ein gemeinsamer Placeholder; die Views werden erst beim ersten
+        # Oeffnen erzeugt und dann an den Stack angehaengt
+        self._placeholder = self._create_placeholder(texts.LOADING, "")
+        self.content_stack.addWidget(self._placeholder)
+
+        # Feste Reihenfolge der umschaltbaren Navigation-Buttons
+        self._nav_buttons = tuple(
+            btn for btn in (self.btn_center, self.btn_bipro, self.btn_archive,
+                            self.btn_gdv, self.btn_provision, self.btn_admin)
+            if btn is not None
+        )
     
     def _create_placeholder(self, title: str, subtitle: str) -> QWidget:
         """Erstellt ein Placeholder-Widget im ACENCIA Design."""
@@ -584,7 +615,9 @@ class MainHub(QMainWindow):
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         title_label = QLabel(title)
-        title_label.setFont(QFont("Tenor Sans", 20))
+        if MainHub._HEADLINE_FONT is None:
+            MainHub._HEADLINE_FONT = QFont("Tenor Sans", 20)
+        title_label.setFont(MainHub._HEADLINE_FONT)
         title_label.setStyleSheet(f"""
             color: {PRIMARY_900};
             font-family: {FONT_HEADLINE};
@@ -601,13 +634,10 @@ class MainHub(QMainWindow):
     
     def _update_nav_buttons(self, active_btn):
         """Aktualisiert die Navigation-Buttons."""
-        all_btns = [self.btn_center, self.btn_bipro, self.btn_archive, self.btn_gdv]
-        if self.btn_provision:
-            all_btns.append(self.btn_provision)
-        if self.btn_admin:
-            all_btns.append(self.btn_admin)
-        for btn in all_btns:
-            btn.setChecked(btn == active_btn)
+        for btn in self._nav_buttons:
+            checked = btn is active_btn
+            if btn.isChecked() != checked:
+                btn.setChecked(checked)
     
     def _show_message_center(self):
         """Zeigt die Mitteilungszentrale."""
@@ -632,12 +662,10 @@ class MainHub(QMainWindow):
             self._message_center_view.set_bipro_events_api(self._bipro_events_api)
             self._message_center_view.open_chats_requested.connect(self._show_chat)
             
-            # Placeholder ersetzen
-            self.content_stack.removeWidget(self._placeholder_center)
-            self.content_stack.insertWidget(0, self._message_center_view)
+            self.content_stack.addWidget(self._message_center_view)
         
         self._message_center_view.refresh()
-        self.content_stack.setCurrentIndex(0)
+        self.content_stack.setCurrentWidget(self._message_center_view)
 
         # Sofort Badge aktualisieren (System-Meldungen wurden gerade gelesen)
         QTimer.singleShot(1500, self._refresh_badge_after_read)
@@ -659,11 +687,9 @@ class MainHub(QMainWindow):
             self._bipro_view.request_archive_view.connect(self._show_archive)
             self._apply_bipro_permissions()
             
-            # Placeholder ersetzen
-            self.content_stack.removeWidget(self._placeholder_bipro)
-            self.content_stack.insertWidget(1, self._bipro_view)
+            self.content_stack.addWidget(self._bipro_view)
         
-        self.content_stack.setCurrentIndex(1)
+        self.content_stack.setCurrentWidget(self._bipro_view)
 
     def _show_archive(self):
         """Zeigt das Dokumentenarchiv mit Box-System."""
@@ -677,15 +703,14 @@ class MainHub(QMainWindow):
                 self._archive_view.open_gdv_requested.connect(self._on_open_gdv_from_archive)
                 self._apply_archive_permissions()
                 
-                self.content_stack.removeWidget(self._placeholder_archive)
-                self.content_stack.insertWidget(2, self._archive_view)
+                self.content_stack.addWidget(self._archive_view)
             except Exception as e:
                 logger.exception(f"Dokumentenarchiv konnte nicht geladen werden: {e}")
                 if self._toast_manager:
                     self._toast_manager.show_error(texts.ARCHIVE_LOAD_ERROR)
                 return
         
-        self.content_stack.setCurrentIndex(2)
+        self.content_stack.setCurrentWidget(self._archive_view)
 
     def _show_gdv(self):
         """Zeigt den GDV-Editor."""
@@ -698,11 +723,9 @@ class MainHub(QMainWindow):
             # Permission Guards setzen
             self._apply_gdv_permissions()
             
-            # Placeholder ersetzen
-            self.content_stack.removeWidget(self._placeholder_gdv)
-            self.content_stack.insertWidget(3, self._gdv_view)
+            self.content_stack.addWidget(self._gdv_view)
         
-        self.content_stack.setCurrentIndex(3)
+        self.content_stack.setCurrentWidget(self._gdv_view)
 
     def _show_settings(self):
         """Öffnet den Einstellungen-Dialog."""
@@ -710,32 +733,11 @@ class MainHub(QMainWindow):
         dialog = SettingsDialog(self)
         dialog.exec()
     
-    def _get_provision_index(self) -> int:
-        """Dynamischer Stack-Index fuer Provision (4 wenn vorhanden)."""
-        return 4 if self.btn_provision else -1
-    
-    def _get_admin_index(self) -> int:
-        """Dynamischer Stack-Index fuer Admin."""
-        base = 4
-        if self.btn_provision:
-            base += 1
-        return base if self.btn_admin else -1
-    
-    def _get_chat_index(self) -> int:
-        """Dynamischer Stack-Index fuer Chat."""
-        base = 4
-        if self.btn_provision:
-            base += 1
-        if self.btn_admin:
-            base += 1
-        return base
-    
     def _show_provision(self):
         """Zeigt das Provisionsmanagement (Vollbild mit eigener Sidebar)."""
         if not self.btn_provision:
             return
         self._update_nav_buttons(self.btn_provision)
-        idx = self._get_provision_index()
         
         if self._provision_view is None:
             from ui.provision.provision_hub import ProvisionHub
@@ -743,11 +745,10 @@ class MainHub(QMainWindow):
             self._provision_view._toast_manager = self._toast_manager
             self._provision_view.back_requested.connect(self._leave_provision)
             
-            self.content_stack.removeWidget(self._placeholder_provision)
-            self.content_stack.insertWidget(idx, self._provision_view)
+            self.content_stack.addWidget(self._provision_view)
         
         self._sidebar.hide()
-        self.content_stack.setCurrentIndex(idx)
+        self.content_stack.setCurrentWidget(self._provision_view)
     
     def _leave_provision(self):
         """Verlaesst das Provisionsmanagement."""
@@ -762,7 +763,6 @@ class MainHub(QMainWindow):
         if not self.btn_admin:
             return
         self._update_nav_buttons(self.btn_admin)
-        idx = self._get_admin_index()
         
         if self._admin_view is None:
             from ui.admin import AdminView
@@ -770,11 +770,10 @@ class MainHub(QMainWindow):
             self._admin_view._toast_manager = self._toast_manager
             self._admin_view.back_requested.connect(self._leave_admin)
             
-            self.content_stack.removeWidget(self._placeholder_admin)
-            self.content_stack.insertWidget(idx, self._admin_view)
+            self.content_stack.addWidget(self._admin_view)
         
         self._sidebar.hide()
-        self.content_stack.setCurrentIndex(idx)
+        self.content_stack.setCurrentWidget(self._admin_view)
     
     def _show_chat(self):
         """Zeigt die Chat-Vollbild-Ansicht. Sidebar wird versteckt (wie Admin)."""
@@ -786,15 +785,11 @@ class MainHub(QMainWindow):
             self._chat_view = ChatView(chat_api)
             self._chat_view._toast_manager = self._toast_manager
             self._chat_view.back_requested.connect(self._leave_chat)
-            
-            chat_idx = self._get_chat_index()
-            self.content_stack.removeWidget(self._placeholder_chat)
-            self.content_stack.insertWidget(chat_idx, self._chat_view)
+            self.content_stack.addWidget(self._chat_view)
         
         self._chat_view.refresh()
         self._sidebar.hide()
-        chat_idx = self._get_chat_index()
-        self.content_stack.setCurrentIndex(chat_idx)
+        self.content_stack.setCurrentWidget(self._chat_view)
         self._chat_view.start_auto_refresh()
     
     def _leave_chat(self):
@@ -826,8 +821,7 @@ class MainHub(QMainWindow):
             self.content_stack.addWidget(self._core_module_admin_view)
 
         self._sidebar.hide()
-        idx = self.content_stack.indexOf(self._core_module_admin_view)
-        self.content_stack.setCurrentIndex(idx)
+        self.content_stack.setCurrentWidget(self._core_module_admin_view)
         self._core_module_admin_view.load_data()
 
     def _leave_core_module_admin(self):
@@ -988,16 +982,28 @@ class MainHub(QMainWindow):
     
     def _on_logout(self):
         """Benutzer abmelden."""
-        reply = QMessageBox.question(
-            self,
-            "Abmelden",
-            "Wirklich abmelden?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        self._ask_yes_no("Abmelden", "Wirklich abmelden?", self._do_logout)
+    
+    def _do_logout(self):
+        """Abmeldung nach Bestaetigung."""
+        self.auth_api.logout()
+        self.close()
+    
+    def _ask_yes_no(self, title: str, text: str, on_yes):
+        """Ja/Nein-Rueckfrage ohne verschachtelte Event-Loop (open() statt exec())."""
+        box = QMessageBox(
+            QMessageBox.Icon.Question, title, text,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            self
         )
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         
-        if reply == QMessageBox.StandardButton.Yes:
-            self.auth_api.logout()
-            self.close()
+        def on_finished(result: int):
+            if QMessageBox.StandardButton(result) == QMessageBox.StandardButton.Yes:
+                on_yes()
+        
+        box.finished.connect(on_finished)
+        box.open()
     
     # ================================================================
     # Module Heartbeat (gesteuert durch AppRouter)
@@ -1549,6 +1555,14 @@ class MainHub(QMainWindow):
         if hasattr(self, '_maintenance_overlay') and self._maintenance_overlay.isVisible():
             self._maintenance_overlay.setGeometry(self.centralWidget().rect())
 
+    def _close_discarding_changes(self):
+        """Schliesst trotz ungespeicherter Aenderungen (nach Rueckfrage)."""
+        self._force_close = True
+        try:
+            self.close()
+        finally:
+            self._force_close = False
+    
     def closeEvent(self, event):
         """Fenster schließen."""
         # Wenn Maintenance-Overlay aktiv: App SOFORT beenden, keine Rueckfragen
@@ -1574,17 +1588,16 @@ class MainHub(QMainWindow):
                 return
 
             # Prüfen auf ungespeicherte Änderungen im GDV-Editor
+            # (nach Bestaetigung erneuter close() mit _force_close)
             if self._gdv_view and hasattr(self._gdv_view, 'has_unsaved_changes'):
-                if self._gdv_view.has_unsaved_changes():
-                    reply = QMessageBox.question(
-                        self,
+                if self._gdv_view.has_unsaved_changes() and not self._force_close:
+                    event.ignore()
+                    self._ask_yes_no(
                         "Ungespeicherte Änderungen",
                         "Es gibt ungespeicherte Änderungen im GDV-Editor.\nWirklich beenden?",
-                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                        self._close_discarding_changes,
                     )
-                    if reply != QMessageBox.StandardButton.Yes:
-                        event.ignore()
-                        return
+                    return
         
         # Worker-Threads aufräumen
         if self._provision_view and hasattr(self._provision_view, 'cleanup'):
@@ -1613,4 +1626,7 @@ class MainHub(QMainWindow):
             self._drop_upload_worker.cancel()
             self._drop_upload_worker.wait(3000)
         
+        # Keep-Alive-Verbindungen freigeben
+        self.api_client.close()
+        
         event.accept()
@@ -8,16 +8,18 @@ Zeigt vier Kacheln:
 3. Nachrichten / Chats (rechts unten)
 """
 
+import html
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List, Dict
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QScrollArea, QSizePolicy, QSpacerItem
 )
-from PySide6.QtCore import Qt, Signal, QThread, Slot
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QRunnable, QThreadPool, QTimer, QRectF
+from PySide6.QtGui import QFont, QPainter, QPainterPath, QColor, QPen, QPalette
 
 from i18n import de as texts
 from ui.styles.tokens import (
@@ -30,7 +32,7 @@ from ui.styles.tokens import (
     ERROR, ERROR_LIGHT, INFO, INFO_LIGHT,
     FONT_HEADLINE, FONT_BODY,
     FONT_SIZE_H1, FONT_SIZE_H2, FONT_SIZE_H3, FONT_SIZE_BODY, FONT_SIZE_CAPTION,
-    FONT_WEIGHT_BOLD, FONT_WEIGHT_MEDIUM,
+    FONT_WEIGHT_NORMAL, FONT_WEIGHT_MEDIUM, FONT_WEIGHT_BOLD,
     SPACING_SM, SPACING_MD, SPACING_LG, SPACING_XL,
     RADIUS_MD, RADIUS_LG, SHADOW_MD,
     get_button_primary_style, get_button_secondary_style,
@@ -46,6 +48,7 @@ SEVERITY_COLORS = {
     'critical': ('#7c2d12', '#fef2f2'),
 }
 
+
 SEVERITY_LABELS = {
     'info': texts.MSG_CENTER_SEVERITY_INFO,
     'warning': texts.MSG_CENTER_SEVERITY_WARNING,
@@ -55,67 +58,95 @@ SEVERITY_LABELS = {
 
 
 # ============================================================================
-# Worker: Mitteilungen laden
+# Runnables: Laden im globalen Thread-Pool
 # ============================================================================
 
-class LoadMessagesWorker(QThread):
-    """Laedt Mitteilungen im Hintergrund."""
-    finished = Signal(list)
+class _WorkerSignals(QObject):
+    """Signale fuer die Runnables (QRunnable hat keine eigenen)."""
+    finished = Signal(object)
     error = Signal(str)
-    
-    def __init__(self, messages_api, parent=None):
-        super().__init__(parent)
+
+
+class LoadMessagesRunnable(QRunnable):
+    """Laedt Mitteilungen im Hintergrund."""
+
+    def __init__(self, messages_api):
+        super().__init__()
+        self.signals = _WorkerSignals()
         self._api = messages_api
-    
+
     def run(self):
         try:
             result = self._api.get_messages(page=1, per_page=50)
             messages = result.get('data', [])
-            self.finished.emit(messages)
+            self.signals.finished.emit(messages)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
-class LoadReleasesWorker(QThread):
+class LoadReleasesRunnable(QRunnable):
     """Laedt Releases im Hintergrund."""
-    finished = Signal(list)
-    error = Signal(str)
-    
-    def __init__(self, releases_api, parent=None):
-        super().__init__(parent)
+
+    def __init__(self, releases_api):
+        super().__init__()
+        self.signals = _WorkerSignals()
         self._api = releases_api
-    
+
     def run(self):
         try:
             releases = self._api.get_public_releases()
-            self.finished.emit(releases)
+            self.signals.finished.emit(releases)
         except Exception:
-            self.finished.emit([])
+            self.signals.finished.emit([])
 
 
-class LoadBiproEventsWorker(QThread):
-    """Laedt BiPRO-Events im Hintergrund."""
-    finished = Signal(list)
+class LoadBiproEventsRunnable(QRunnable):
+    """Laedt eine Seite BiPRO-Events im Hintergrund.
 
-    def __init__(self, bipro_events_api, parent=None):
-        super().__init__(parent)
+    finished liefert (events, has_more, unread_total). unread_total ist die
+    serverseitige Zahl ungelesener Events (auch ausserhalb der geladenen
+    Seiten) oder None, wenn with_summary False ist.
+    """
+
+    def __init__(self, bipro_events_api, page: int = 1, per_page: int = 25,
+                 with_summary: bool = False):
+        super().__init__()
+        self.signals = _WorkerSignals()
         self._api = bipro_events_api
+        self._page = page
+        self._per_page = per_page
+        self._with_summary = with_summary
 
     def run(self):
         try:
-            result = self._api.get_events(page=1, per_page=200)
-            self.finished.emit(result.get('data', []))
+            result = self._api.get_events(page=self._page, per_page=self._per_page)
+            events = result.get('data', [])
+            total_pages = int((result.get('pagination') or {}).get('total_pages', 0) or 0)
+            if total_pages:
+                has_more = self._page < total_pages
+            else:
+                has_more = len(events) >= self._per_page
         except Exception:
-            self.finished.emit([])
+            self.signals.finished.emit(([], False, None))
+            return
+        unread_total = None
+        if self._with_summary:
+            try:
+                unread_total = int(self._api.get_summary().get('unread_count', 0) or 0)
+            except Exception:
+                unread_total = None
+        self.signals.finished.emit((events, has_more, unread_total))
 
 
-class MarkBiproEventReadWorker(QThread):
-    """Markiert BiPRO-Events als gelesen im Hintergrund."""
-    finished = Signal(bool, int)  # success, updated_count
-    error = Signal(str)
+class MarkBiproEventReadRunnable(QRunnable):
+    """Markiert BiPRO-Events als gelesen im Hintergrund.
 
-    def __init__(self, bipro_events_api, event_ids: list, mark_all: bool = False, parent=None):
-        super().__init__(parent)
+    finished liefert die Anzahl aktualisierter Events.
+    """
+
+    def __init__(self, bipro_events_api, event_ids: list, mark_all: bool = False):
+        super().__init__()
+        self.signals = _WorkerSignals()
         self._api = bipro_events_api
         self._event_ids = event_ids
         self._mark_all = mark_all
@@ -127,9 +158,9 @@ class MarkBiproEventReadWorker(QThread):
             else:
                 result = self._api.mark_as_read(self._event_ids)
                 updated = result.get('updated', len(self._event_ids)) if isinstance(result, dict) else len(self._event_ids)
-            self.finished.emit(True, updated)
+            self.signals.finished.emit(updated)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 # ============================================================================
@@ -144,238 +175,349 @@ EVENT_TYPE_COLORS = {
 }
 
 
+
+def _build_card_list_qss() -> str:
+    """Baut das gemeinsame Stylesheet aller Message-/BiPRO-Cards.
+
+    Nur noch das Badge (abgerundeter Hintergrund) wird per Stylesheet
+    gestylt, ueber objectName und die Card-Property "kind"; die Regeln
+    werden einmal pro Liste (statt pro Card) geparst.
+    """
+    rules = [f"""
+        QLabel#cardBadge {{
+            color: {TEXT_INVERSE};
+            border-radius: 3px;
+            padding: 1px 6px;
+            font-size: {FONT_SIZE_CAPTION};
+            font-weight: {FONT_WEIGHT_BOLD};
+        }}
+    """]
+    for card_class, colors in (("MessageCard", SEVERITY_COLORS),
+                               ("BiproEventCard", EVENT_TYPE_COLORS)):
+        for kind, (fg_color, _bg_color) in colors.items():
+            rules.append(f"""
+        {card_class}[kind="{kind}"] QLabel#cardBadge {{
+            background-color: {fg_color};
+        }}""")
+    return "".join(rules)
+
+
+# Einmal beim Import aufgebaut, von den Listen-Containern gesetzt
+CARD_LIST_QSS = _build_card_list_qss()
+
+@lru_cache(maxsize=8)
+def _card_font(size: str, weight: str = FONT_WEIGHT_NORMAL) -> QFont:
+    """Schrift fuer Card-Labels aus Token-Groesse ("10pt"/"10px") und -Gewicht.
+
+    Von allen Cards geteilt (QFont ist implizit geteilt); erst bei Bedarf
+    erzeugt, da QFont eine laufende QApplication braucht.
+    """
+    font = QFont()
+    if size.endswith('px'):
+        font.setPixelSize(int(size[:-2]))
+    else:
+        font.setPointSizeF(float(size.rstrip('pt')))
+    font.setWeight(QFont.Weight(int(weight)))
+    return font
+
+
+@lru_cache(maxsize=8)
+def _card_palette(text_color: str) -> QPalette:
+    """Palette mit der Textfarbe text_color fuer Card-Labels."""
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(text_color))
+    return palette
+
+
+# Rich-Text-Huelle der Card-Nebenzeilen; pre-wrap erhaelt die doppelten
+# Leerzeichen der Meta-Trenner
+_CAPTION_HTML = '<div style="white-space: pre-wrap">{}</div>'
+
+# Dateiendungen, fuer die der referenzierte Dateiname angezeigt wird
+_KNOWN_FILE_EXTS = ('.pdf', '.gdv', '.csv', '.xlsx', '.zip', '.txt')
+
+# (kind, fg, bg) je Severity/Event-Type - ein Lookup pro Card, unbekannte
+# Werte fallen auf den Default zurueck
+_SEVERITY_STATE = {sev: (sev, fg, bg) for sev, (fg, bg) in SEVERITY_COLORS.items()}
+_SEVERITY_STATE_DEFAULT = _SEVERITY_STATE['info']
+_EVENT_TYPE_STATE = {et: (et, fg, bg) for et, (fg, bg) in EVENT_TYPE_COLORS.items()}
+_EVENT_TYPE_STATE_DEFAULT = _EVENT_TYPE_STATE['document_xml']
+
+
 # ============================================================================
-# Message Card Widget
+# Card-Rahmen (selbst gezeichnet statt per Stylesheet)
 # ============================================================================
 
-class MessageCard(QFrame):
-    """Einzelne Mitteilung als Card."""
-    
-    def __init__(self, message: Dict, parent=None):
+_CARD_RADIUS = int(RADIUS_MD.rstrip('px'))
+_CARD_PADDING = int(SPACING_SM.rstrip('px'))
+_CARD_ACCENT_WIDTH = 4
+_CARD_GAP = 4  # Abstand zur naechsten Card
+
+
+class _CardFrame(QFrame):
+    """Basis der Cards: zeichnet Hintergrund, Rahmen und Farbleiste selbst.
+
+    Der Rahmen ist fuer jede Card gleich aufgebaut und wird haeufig
+    instanziiert - ein paintEvent ist hier deutlich billiger als ein
+    Stylesheet pro Card.
+
+    Die Widgets einer Card werden einmal in _build_ui angelegt; set_data
+    befuellt sie neu, so dass Cards beim Aktualisieren der Liste
+    wiederverwendet werden koennen.
+
+    Die Nebenzeilen (Caption) entstehen erst beim ersten showEvent: Cards,
+    die in einer verborgenen Liste befuellt werden, legen das Label nicht
+    an, bis die Liste tatsaechlich angezeigt wird.
+    """
+
+    # Zeilenumbruch der Caption
+    _CAPTION_WORD_WRAP = False
+
+    def __init__(self, item=None, parent=None):
         super().__init__(parent)
-        self._setup_ui(message)
-    
-    def _setup_ui(self, msg: Dict):
-        severity = msg.get('severity', 'info')
-        fg_color, bg_color = SEVERITY_COLORS.get(severity, SEVERITY_COLORS['info'])
-        is_read = msg.get('is_read', False)
-        
-        self.setStyleSheet(f"""
-            MessageCard {{
-                background-color: {bg_color if not is_read else BG_TERTIARY};
-                border: 1px solid {BORDER_DEFAULT};
-                border-left: 4px solid {fg_color};
-                border-radius: {RADIUS_MD};
-                padding: {SPACING_SM};
-                margin-bottom: 4px;
-            }}
-        """)
-        
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, False)
+        # Entspricht Rand + Padding + Abstand des frueheren Stylesheets
+        self.setContentsMargins(
+            _CARD_ACCENT_WIDTH + _CARD_PADDING, 1 + _CARD_PADDING,
+            1 + _CARD_PADDING, 1 + _CARD_PADDING + _CARD_GAP,
+        )
+        self._accent = QColor(BORDER_DEFAULT)
+        self._background = QColor(BG_TERTIARY)
+        # Labels, deren Stil von den Card-Properties abhaengt
+        self._property_styled: tuple = ()
+        # Caption-Text bis zum ersten showEvent ('' = keine Nebenzeilen)
+        self._caption: Optional[QLabel] = None
+        self._caption_html = ''
+        self._built_secondary = False
+        self._build_ui()
+        if item is not None:
+            self.set_data(item)
+
+    def _build_ui(self) -> QVBoxLayout:
+        """Legt das Card-Layout an; Unterklassen fuegen ihre Zeilen hinzu."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 6, 8, 6)
         layout.setSpacing(2)
+        return layout
+
+    def set_data(self, item):
+        """Zeigt item in dieser Card an (der Rahmen selbst hat keine Daten)."""
+
+    def _set_caption(self, caption_html: str):
+        """Setzt die Nebenzeilen (Rich Text); vor dem ersten Anzeigen nur gemerkt."""
+        self._caption_html = caption_html
+        if self._built_secondary:
+            self._apply_caption()
+
+    def _apply_caption(self):
+        if self._caption_html:
+            self._caption.setText(_CAPTION_HTML.format(self._caption_html))
+        self._caption.setVisible(bool(self._caption_html))
+
+    def _build_secondary_rows(self):
+        """Legt das Caption-Label an und uebernimmt den gemerkten Text."""
+        self._caption = QLabel()
+        self._caption.setFont(_card_font(FONT_SIZE_CAPTION))
+        self._caption.setPalette(_card_palette(TEXT_SECONDARY))
+        self._caption.setTextFormat(Qt.TextFormat.RichText)
+        self._caption.setWordWrap(self._CAPTION_WORD_WRAP)
+        self.layout().addWidget(self._caption)
+        self._built_secondary = True
+        self._apply_caption()
+
+    def showEvent(self, event):
+        if not self._built_secondary:
+            self._build_secondary_rows()
+        super().showEvent(event)
+
+    @classmethod
+    def build_batch(cls, items, container_layout) -> list:
+        """Erzeugt Cards fuer alle items und haengt sie an container_layout an.
+
+        Updates des Containers sind waehrenddessen aus, damit Layout und
+        Repaint nur einmal fuer den ganzen Stapel laufen statt pro Card.
+        """
+        container = container_layout.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            cards = [cls(item) for item in items]
+            for card in cards:
+                container_layout.addWidget(card)
+        finally:
+            container.setUpdatesEnabled(True)
+        return cards
+
+    def _set_card_state(self, kind: str, fg_color: str, bg_color: str, is_read: bool):
+        """Setzt Farben und die Properties kind/read (Stil der Labels)."""
+        self._accent = QColor(fg_color)
+        self._background = QColor(BG_TERTIARY if is_read else bg_color)
+        read = "true" if is_read else "false"
+        if self.property("kind") != kind or self.property("read") != read:
+            self.setProperty("kind", kind)
+            self.setProperty("read", read)
+            # Property-Selektoren werden erst beim naechsten Polish ausgewertet
+            for label in self._property_styled:
+                if label.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+                    style = label.style()
+                    style.unpolish(label)
+                    style.polish(label)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5 - _CARD_GAP)
+        path = QPainterPath()
+        path.addRoundedRect(rect, _CARD_RADIUS, _CARD_RADIUS)
+        painter.fillPath(path, self._background)
+        painter.setPen(QPen(QColor(BORDER_DEFAULT), 1))
+        painter.drawPath(path)
+        painter.setClipPath(path)
+        painter.fillRect(
+            QRectF(rect.left() - 0.5, rect.top() - 0.5, _CARD_ACCENT_WIDTH, rect.height() + 1),
+            self._accent,
+        )
+        painter.end()
+
+
+# ============================================================================
+# Message Card Widget
+# ============================================================================
+
+class MessageCard(_CardFrame):
+    """Einzelne Mitteilung als Card."""
+    
+    _CAPTION_WORD_WRAP = True
+    
+    def _build_ui(self):
+        layout = super()._build_ui()
         
         # Zeile 1: Severity-Badge + Titel
         top_row = QHBoxLayout()
         
-        badge = QLabel(SEVERITY_LABELS.get(severity, severity))
-        badge.setStyleSheet(f"""
-            QLabel {{
-                background-color: {fg_color};
-                color: {TEXT_INVERSE};
-                border-radius: 3px;
-                padding: 1px 6px;
-                font-size: {FONT_SIZE_CAPTION};
-                font-weight: {FONT_WEIGHT_BOLD};
-            }}
-        """)
-        badge.setFixedHeight(18)
-        top_row.addWidget(badge)
+        self._badge = QLabel()
+        self._badge.setObjectName("cardBadge")
+        self._badge.setFixedHeight(18)
+        top_row.addWidget(self._badge)
         
-        title = QLabel(msg.get('title', ''))
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {TEXT_PRIMARY};
-                font-size: {FONT_SIZE_BODY};
-                font-weight: {FONT_WEIGHT_BOLD};
-                background: transparent;
-                border: none;
-            }}
-        """)
-        title.setWordWrap(True)
-        top_row.addWidget(title, 1)
+        self._title = QLabel()
+        self._title.setFont(_card_font(FONT_SIZE_BODY, FONT_WEIGHT_BOLD))
+        self._title.setPalette(_card_palette(TEXT_PRIMARY))
+        self._title.setWordWrap(True)
+        top_row.addWidget(self._title, 1)
         layout.addLayout(top_row)
         
-        # Zeile 2: Beschreibung (optional)
-        desc = msg.get('description', '')
-        if desc:
-            desc_label = QLabel(desc)
-            desc_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {TEXT_SECONDARY};
-                    font-size: {FONT_SIZE_CAPTION};
-                    background: transparent;
-                    border: none;
-                }}
-            """)
-            desc_label.setWordWrap(True)
-            layout.addWidget(desc_label)
+        self._property_styled = (self._badge,)
+    
+    def set_data(self, msg: Dict):
+        """Zeigt die Mitteilung msg in dieser Card an."""
+        severity = msg.get('severity', 'info')
+        is_read = msg.get('is_read', False)
         
-        # Zeile 3: Meta (Sender + Datum)
-        meta_row = QHBoxLayout()
+        self._set_card_state(
+            *_SEVERITY_STATE.get(severity, _SEVERITY_STATE_DEFAULT), bool(is_read)
+        )
         
-        sender = msg.get('sender_name', '')
-        created = msg.get('created_at', '')
-        try:
-            dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-            date_str = dt.strftime('%d.%m.%Y %H:%M')
-        except (ValueError, AttributeError):
-            date_str = created
+        self._badge.setText(SEVERITY_LABELS.get(severity, severity))
+        self._title.setText(msg.get('title', ''))
         
-        meta_text = texts.MSG_CENTER_FROM.format(sender=sender) + f"  ·  {date_str}"
-        meta = QLabel(meta_text)
-        meta.setStyleSheet(f"""
-            QLabel {{
-                color: {TEXT_SECONDARY};
-                font-size: {FONT_SIZE_CAPTION};
-                background: transparent;
-                border: none;
-            }}
-        """)
-        meta_row.addWidget(meta)
-        meta_row.addStretch()
-        layout.addLayout(meta_row)
+        sender = msg.get('sender_name', '')
+        date_str = _fmt_iso(msg.get('created_at', ''))
+        # Beschreibung (optional) + Meta (Sender + Datum) in der Caption
+        meta = html.escape(f"{texts.MSG_CENTER_FROM.format(sender=sender)}  ·  {date_str}")
+        desc = msg.get('description', '')
+        if desc:
+            desc = html.escape(desc).replace('\n', '<br>')
+            self._set_caption(f"{desc}<br>{meta}")
+        else:
+            self._set_caption(meta)
 
 
 # ============================================================================
 # BiPRO Event Card Widget
 # ============================================================================
 
-class BiproEventCard(QFrame):
+class BiproEventCard(_CardFrame):
     """Einzelner BiPRO-Event als Card mit Metadaten."""
     mark_read = Signal(int)
 
-    def __init__(self, event, parent=None):
-        super().__init__(parent)
+    def __init__(self, event=None, parent=None):
         self._event = event
-        self._setup_ui(event)
-
-    def _setup_ui(self, ev):
-        et = getattr(ev, 'event_type', '') if hasattr(ev, 'event_type') else ev.get('event_type', '')
-        is_read = getattr(ev, 'is_read', False) if hasattr(ev, 'is_read') else ev.get('is_read', False)
-        fg_color, bg_color = EVENT_TYPE_COLORS.get(et, EVENT_TYPE_COLORS['document_xml'])
+        super().__init__(event, parent)
 
-        self.setStyleSheet(f"""
-            BiproEventCard {{
-                background-color: {bg_color if not is_read else BG_TERTIARY};
-                border: 1px solid {BORDER_DEFAULT};
-                border-left: 4px solid {fg_color};
-                border-radius: {RADIUS_MD};
-                padding: {SPACING_SM};
-                margin-bottom: 4px;
-            }}
-        """)
+    def _build_ui(self):
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(8, 6, 8, 6)
-        layout.setSpacing(2)
+        layout = super()._build_ui()
 
         top_row = QHBoxLayout()
 
-        type_label_text = texts.BIPRO_EVENT_TYPE_LABELS.get(et, et)
-        badge = QLabel(type_label_text)
-        badge.setStyleSheet(f"""
-            QLabel {{
-                background-color: {fg_color};
-                color: {TEXT_INVERSE};
-                border-radius: 3px;
-                padding: 1px 6px;
-                font-size: {FONT_SIZE_CAPTION};
-                font-weight: {FONT_WEIGHT_BOLD};
-            }}
-        """)
-        badge.setFixedHeight(18)
-        top_row.addWidget(badge)
-
-        vu_name = _ev_get(ev, 'vu_name', '')
-        kurz = _ev_get(ev, 'kurzbeschreibung', '') or _ev_get(ev, 'freitext', '')
-        title_text = f"{vu_name}" + (f" — {kurz}" if kurz else '')
-        title = QLabel(title_text)
-        fw = FONT_WEIGHT_BOLD if not is_read else FONT_WEIGHT_MEDIUM
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {TEXT_PRIMARY};
-                font-size: {FONT_SIZE_BODY};
-                font-weight: {fw};
-                background: transparent; border: none;
-            }}
-        """)
-        title.setWordWrap(True)
-        top_row.addWidget(title, 1)
+        self._badge = QLabel()
+        self._badge.setObjectName("cardBadge")
+        self._badge.setFixedHeight(18)
+        top_row.addWidget(self._badge)
 
-        if not is_read:
-            dot = QLabel("●")
-            dot.setStyleSheet(f"color: {ACCENT_500}; font-size: 10px; background: transparent; border: none;")
-            top_row.addWidget(dot)
+        self._title = QLabel()
+        self._title.setPalette(_card_palette(TEXT_PRIMARY))
+        self._title.setWordWrap(True)
+        top_row.addWidget(self._title, 1)
+
+        self._dot = QLabel("●")
+        self._dot.setFont(_card_font("10px"))
+        self._dot.setPalette(_card_palette(ACCENT_500))
+        top_row.addWidget(self._dot)
 
         layout.addLayout(top_row)
 
+        self._property_styled = (self._badge,)
+
+    def set_data(self, ev):
+        """Zeigt den Event ev in dieser Card an."""
+        self._event = ev
+        # Dict oder Dataclass einmal pro Card unterscheiden statt je Feld
+        get = _ev_getter(ev)
+        et = get('event_type')
+        is_read = get('is_read', False)
+
+        self._set_card_state(
+            *_EVENT_TYPE_STATE.get(et, _EVENT_TYPE_STATE_DEFAULT), bool(is_read)
+        )
+
+        self._badge.setText(texts.BIPRO_EVENT_TYPE_LABELS.get(et, et))
+
+        vu_name = get('vu_name', '')
+        kurz = get('kurzbeschreibung', '') or get('freitext', '')
+        self._title.setText(f"{vu_name} — {kurz}" if kurz else vu_name)
+        self._title.setFont(_card_font(
+            FONT_SIZE_BODY, FONT_WEIGHT_MEDIUM if is_read else FONT_WEIGHT_BOLD))
+        self._dot.setVisible(not is_read)
+
         meta_parts = []
-        vsnr = _ev_get(ev, 'vsnr', '')
-        sparte = _ev_get(ev, 'sparte', '')
+        vsnr = get('vsnr', '')
+        sparte = get('sparte', '')
         if vsnr:
             meta_parts.append(f"{texts.BIPRO_EVENT_VSNR}: {vsnr}")
         if sparte:
             meta_parts.append(f"{texts.BIPRO_EVENT_SPARTE}: {sparte}")
 
-        created = _ev_get(ev, 'created_at', '')
-        try:
-            dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-            meta_parts.append(dt.strftime('%d.%m.%Y %H:%M'))
-        except (ValueError, AttributeError):
-            if created:
-                meta_parts.append(created)
+        date_str = _fmt_iso(get('created_at', ''))
+        if date_str:
+            meta_parts.append(date_str)
 
+        # Meta, VN und Datei als Zeilen der Caption
+        lines = []
         if meta_parts:
-            meta_label = QLabel('  |  '.join(meta_parts))
-            meta_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {TEXT_SECONDARY};
-                    font-size: {FONT_SIZE_CAPTION};
-                    background: transparent; border: none;
-                }}
-            """)
-            layout.addWidget(meta_label)
+            lines.append(html.escape('  |  '.join(meta_parts)))
 
-        vn_name = _ev_get(ev, 'vn_name', '')
+        vn_name = get('vn_name', '')
         if vn_name:
-            vn_label = QLabel(vn_name)
-            vn_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {TEXT_SECONDARY};
-                    font-size: {FONT_SIZE_CAPTION};
-                    font-style: italic;
-                    background: transparent; border: none;
-                }}
-            """)
-            layout.addWidget(vn_label)
-
-        ref_file = _ev_get(ev, 'referenced_filename', '')
-        if ref_file:
-            known_ext = any(ref_file.lower().endswith(ext)
-                           for ext in ('.pdf', '.gdv', '.csv', '.xlsx', '.zip', '.txt'))
-            if known_ext:
-                file_label = QLabel(f"\U0001F4CE {ref_file}")
-                file_label.setStyleSheet(f"""
-                    QLabel {{
-                        color: {TEXT_SECONDARY};
-                        font-size: {FONT_SIZE_CAPTION};
-                        font-style: italic;
-                        background: transparent; border: none;
-                    }}
-                """)
-                layout.addWidget(file_label)
+            lines.append(f"<i>{html.escape(vn_name)}</i>")
+
+        ref_file = get('referenced_filename', '')
+        if ref_file and ref_file.lower().endswith(_KNOWN_FILE_EXTS):
+            lines.append(f"<i>\U0001F4CE {html.escape(ref_file)}</i>")
+
+        self._set_caption('<br>'.join(lines))
 
     def mousePressEvent(self, event):
         ev_id = _ev_get(self._event, 'id', 0)
@@ -384,6 +526,30 @@ class BiproEventCard(QFrame):
         super().mousePressEvent(event)
 
 
+@lru_cache(maxsize=4096)
+def _fmt_iso(created: str) -> str:
+    """Formatiert einen ISO-Zeitstempel als 'TT.MM.JJJJ HH:MM'.
+
+    Gecacht, da beim Neuabruf dieselben Zeitstempel erneut formatiert
+    werden. Nicht parsebare Werte werden unveraendert zurueckgegeben.
+    """
+    try:
+        dt = datetime.fromisoformat(created[:-1] + '+00:00' if created.endswith('Z') else created)
+    except (ValueError, TypeError, AttributeError):
+        return created or ''
+    return f"{dt.day:02d}.{dt.month:02d}.{dt.year} {dt.hour:02d}:{dt.minute:02d}"
+
+
+def _ev_getter(ev):
+    """Liefert get(key, default='') fuer einen BiproEvent (Dataclass oder Dict).
+
+    Verhaelt sich wie _ev_get, prueft den Typ aber nur einmal.
+    """
+    if isinstance(ev, dict):
+        return lambda key, default='': ev.get(key) or default
+    return lambda key, default='': getattr(ev, key, None) or default
+
+
 def _ev_get(ev, key, default=''):
     """Zugriff auf BiproEvent (Dataclass oder Dict)."""
     if hasattr(ev, key):
@@ -406,6 +572,14 @@ class MessageCenterView(QWidget):
     """
     open_chats_requested = Signal()
     
+    BIPRO_RELOAD_DEBOUNCE_MS = 150
+    BIPRO_ACK_BATCH_MS = 250
+    BIPRO_PAGE_SIZE = 25
+    # Obergrenze fuer den Neuabruf aller geladenen Seiten in einem Request
+    BIPRO_RELOAD_MAX = 200
+    # Abstand zum Listenende (px), ab dem die naechste Seite geladen wird
+    BIPRO_LOAD_MORE_THRESHOLD = 200
+    
     def __init__(self, api_client, releases_api=None, parent=None):
         super().__init__(parent)
         self._api_client = api_client
@@ -416,11 +590,34 @@ class MessageCenterView(QWidget):
         self._messages: List[Dict] = []
         self._releases: List[Dict] = []
         self._bipro_events = []
+        # Wiederverwendete Cards der beiden Listen (siehe _sync_card_pool)
+        self._message_cards: List[MessageCard] = []
+        self._bipro_cards: List[BiproEventCard] = []
         self._show_all_releases = False
-        self._load_worker = None
-        self._releases_worker = None
-        self._bipro_events_worker = None
-        self._mark_read_worker = None
+        # Signal-Objekte laufender Runnables (None = nichts in Arbeit)
+        self._load_signals = None
+        self._releases_signals = None
+        self._bipro_events_signals = None
+        self._mark_read_signals = None
+        # BiPRO-Events: Generationszaehler gegen veraltete Antworten und
+        # entprellter Neuabruf nach Als-gelesen-Markierungen
+        self._bipro_load_gen = 0
+        self._bipro_reload_pending = False
+        # Seitenweises Nachladen beim Scrollen
+        self._bipro_pages_loaded = 0
+        self._bipro_has_more = False
+        # Ungelesene Events laut Server (inkl. nicht geladener Seiten)
+        self._bipro_unread_total = 0
+        self._bipro_reload_timer = QTimer(self)
+        self._bipro_reload_timer.setSingleShot(True)
+        self._bipro_reload_timer.setInterval(self.BIPRO_RELOAD_DEBOUNCE_MS)
+        self._bipro_reload_timer.timeout.connect(self._load_bipro_events)
+        # Einzelne Als-gelesen-Klicks werden gesammelt und gebuendelt gesendet
+        self._pending_ack: set = set()
+        self._ack_timer = QTimer(self)
+        self._ack_timer.setSingleShot(True)
+        self._ack_timer.setInterval(self.BIPRO_ACK_BATCH_MS)
+        self._ack_timer.timeout.connect(self._flush_pending_ack)
         
         self._setup_ui()
     
@@ -537,7 +734,7 @@ class MessageCenterView(QWidget):
         """)
 
         scroll_widget = QWidget()
-        scroll_widget.setStyleSheet("background: transparent;")
+        scroll_widget.setStyleSheet("* { background: transparent; }" + CARD_LIST_QSS)
         self._messages_container = QVBoxLayout(scroll_widget)
         self._messages_container.setContentsMargins(0, 0, 0, 0)
         self._messages_container.setSpacing(4)
@@ -560,21 +757,33 @@ class MessageCenterView(QWidget):
     
     def _populate_messages(self):
         """Fuellt die Mitteilungs-Kachel mit Daten."""
-        while self._messages_container.count():
-            item = self._messages_container.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        if not self._messages:
-            label = QLabel(texts.MSG_CENTER_NO_MESSAGES)
-            label.setStyleSheet(f"color: {TEXT_SECONDARY}; font-size: {FONT_SIZE_BODY}; padding: 16px;")
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._messages_container.addWidget(label)
-            return
-        
-        for msg in self._messages:
-            card = MessageCard(msg)
-            self._messages_container.addWidget(card)
+        self._msg_status_label.setText(texts.MSG_CENTER_NO_MESSAGES)
+        self._msg_status_label.setVisible(not self._messages)
+        self._sync_card_pool(
+            self._message_cards, self._messages,
+            self._messages_container, MessageCard,
+        )
+    
+    def _sync_card_pool(self, pool: list, items: list, container_layout, card_cls) -> list:
+        """Gleicht die Cards in pool mit items ab und liefert neu erzeugte Cards.
+
+        Vorhandene Cards werden per set_data neu befuellt statt geloescht und
+        neu aufgebaut; nur ueberzaehlige Cards werden entfernt.
+        """
+        container = container_layout.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            for card, item in zip(pool, items):
+                card.set_data(item)
+            for card in pool[len(items):]:
+                container_layout.removeWidget(card)
+                card.deleteLater()
+            del pool[len(items):]
+        finally:
+            container.setUpdatesEnabled(True)
+        new_cards = card_cls.build_batch(items[len(pool):], container_layout)
+        pool.extend(new_cards)
+        return new_cards
     
     # ====================================================================
     # Kachel: Aktuelles Release
@@ -886,7 +1095,7 @@ class MessageCenterView(QWidget):
         """)
 
         scroll_widget = QWidget()
-        scroll_widget.setStyleSheet("background: transparent;")
+        scroll_widget.setStyleSheet("* { background: transparent; }" + CARD_LIST_QSS)
         self._bipro_events_container = QVBoxLayout(scroll_widget)
         self._bipro_events_container.setContentsMargins(0, 0, 0, 0)
         self._bipro_events_container.setSpacing(4)
@@ -904,33 +1113,41 @@ class MessageCenterView(QWidget):
 
         bipro_scroll.setWidget(scroll_widget)
         layout.addWidget(bipro_scroll, 1)
+        # Naechste Seite laden, sobald das Listenende in Sicht kommt
+        bar = bipro_scroll.verticalScrollBar()
+        bar.valueChanged.connect(self._check_bipro_load_more)
+        bar.rangeChanged.connect(self._check_bipro_load_more)
+        self._bipro_scroll = bipro_scroll
 
         return card
 
     def _populate_bipro_events(self):
         """Fuellt die BiPRO-Events-Kachel mit Daten."""
-        while self._bipro_events_container.count():
-            item = self._bipro_events_container.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        if not self._bipro_events:
-            label = QLabel(texts.BIPRO_EVENT_NO_EVENTS)
-            label.setStyleSheet(
-                f"color: {TEXT_SECONDARY}; font-size: {FONT_SIZE_BODY}; padding: 16px;"
-            )
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._bipro_events_container.addWidget(label)
-            self._bipro_event_badge.setVisible(False)
-            self._mark_all_read_btn.setVisible(False)
-            return
+        self._bipro_status_label.setText(texts.BIPRO_EVENT_NO_EVENTS)
+        self._bipro_status_label.setVisible(not self._bipro_events)
+        new_cards = self._sync_card_pool(
+            self._bipro_cards, self._bipro_events,
+            self._bipro_events_container, BiproEventCard,
+        )
+        for card in new_cards:
+            card.mark_read.connect(self._on_bipro_event_clicked)
+        self._update_bipro_badge()
 
-        for ev in self._bipro_events:
-            card = BiproEventCard(ev)
+    def _add_bipro_event_cards(self, events: list):
+        """Haengt Karten fuer die uebergebenen Events an die Liste an."""
+        new_cards = BiproEventCard.build_batch(events, self._bipro_events_container)
+        self._bipro_cards.extend(new_cards)
+        for card in new_cards:
             card.mark_read.connect(self._on_bipro_event_clicked)
-            self._bipro_events_container.addWidget(card)
 
-        unread = sum(1 for e in self._bipro_events if not _ev_get(e, 'is_read', False))
+    def _bipro_unread_count(self) -> int:
+        """Ungelesene Events: Serverzahl, mindestens aber die der geladenen Seiten."""
+        loaded = sum(1 for e in self._bipro_events if not _ev_get(e, 'is_read', False))
+        return max(self._bipro_unread_total, loaded)
+
+    def _update_bipro_badge(self):
+        """Aktualisiert Badge und "Alle gelesen"-Button der BiPRO-Kachel."""
+        unread = self._bipro_unread_count()
         if unread > 0:
             self._bipro_event_badge.setText(str(unread))
             self._bipro_event_badge.setVisible(True)
@@ -944,34 +1161,50 @@ class MessageCenterView(QWidget):
         """Markiert einen BiPRO-Event als gelesen (async via Worker)."""
         if not self._bipro_events_api:
             return
-        if self._mark_read_worker and self._mark_read_worker.isRunning():
-            return
 
         for ev in self._bipro_events:
             if _ev_get(ev, 'id', 0) == event_id:
+                if not _ev_get(ev, 'is_read', False) and self._bipro_unread_total > 0:
+                    self._bipro_unread_total -= 1
                 if hasattr(ev, 'is_read'):
                     ev.is_read = True
                 elif isinstance(ev, dict):
                     ev['is_read'] = True
         self._populate_bipro_events()
 
-        self._mark_read_worker = MarkBiproEventReadWorker(
-            self._bipro_events_api, [event_id], mark_all=False, parent=self
-        )
-        self._mark_read_worker.error.connect(
-            lambda msg: logger.warning(f"mark_as_read fehlgeschlagen: {msg}")
+        # Klicks sammeln und gebuendelt in einem Request senden
+        self._pending_ack.add(event_id)
+        self._ack_timer.start()
+
+    def _flush_pending_ack(self):
+        """Sendet alle gesammelten Als-gelesen-Markierungen in einem Request."""
+        if not self._pending_ack or not self._bipro_events_api:
+            return
+        if self._mark_read_signals is not None:
+            # Laufende Markierung abwarten, Sammlung bleibt erhalten
+            self._ack_timer.start()
+            return
+        event_ids = list(self._pending_ack)
+        self._pending_ack.clear()
+
+        self._start_runnable(
+            '_mark_read_signals',
+            MarkBiproEventReadRunnable(self._bipro_events_api, event_ids, mark_all=False),
+            self._schedule_bipro_reload,
+            [
+                lambda msg: logger.warning(f"mark_as_read fehlgeschlagen: {msg}"),
+                self._schedule_bipro_reload,
+            ],
         )
-        self._mark_read_worker.start()
 
     def _mark_all_bipro_events_read(self):
         """Markiert alle BiPRO-Events als gelesen (async via Worker)."""
         if not self._bipro_events_api:
             return
-        if self._mark_read_worker and self._mark_read_worker.isRunning():
+        if self._mark_read_signals is not None:
             return
 
-        unread = sum(1 for e in self._bipro_events if not _ev_get(e, 'is_read', False))
-        if unread == 0:
+        if self._bipro_unread_count() == 0:
             if self._toast_manager:
                 self._toast_manager.show_info(texts.BIPRO_EVENT_MARK_ALL_READ_NONE)
             return
@@ -981,21 +1214,26 @@ class MessageCenterView(QWidget):
                 ev.is_read = True
             elif isinstance(ev, dict):
                 ev['is_read'] = True
+        self._bipro_unread_total = 0
         self._populate_bipro_events()
-
-        self._mark_read_worker = MarkBiproEventReadWorker(
-            self._bipro_events_api, [], mark_all=True, parent=self
-        )
-        self._mark_read_worker.finished.connect(self._on_mark_all_read_finished)
-        self._mark_read_worker.error.connect(
-            lambda msg: logger.warning(f"Alle als gelesen markieren fehlgeschlagen: {msg}")
+        # Gesammelte Einzel-Markierungen sind in "alle" enthalten
+        self._pending_ack.clear()
+        self._ack_timer.stop()
+
+        self._start_runnable(
+            '_mark_read_signals',
+            MarkBiproEventReadRunnable(self._bipro_events_api, [], mark_all=True),
+            [self._on_mark_all_read_finished, self._schedule_bipro_reload],
+            [
+                lambda msg: logger.warning(f"Alle als gelesen markieren fehlgeschlagen: {msg}"),
+                self._schedule_bipro_reload,
+            ],
         )
-        self._mark_read_worker.start()
 
-    @Slot(bool, int)
-    def _on_mark_all_read_finished(self, success: bool, updated: int):
+    @Slot(object)
+    def _on_mark_all_read_finished(self, updated: int):
         """Callback nach erfolgreichem Markieren aller Events als gelesen."""
-        if success and self._toast_manager:
+        if self._toast_manager:
             self._toast_manager.show_success(
                 texts.BIPRO_EVENT_MARK_ALL_READ_SUCCESS.format(count=updated)
             )
@@ -1004,18 +1242,50 @@ class MessageCenterView(QWidget):
     # Daten laden
     # ====================================================================
     
+    def _start_runnable(self, attr: str, runnable: QRunnable,
+                        on_finished=None, on_error=None) -> QObject:
+        """Startet ein Runnable im globalen Pool und merkt dessen Signale in attr.
+
+        attr wird nach finished/error wieder auf None gesetzt und dient so
+        als "laeuft bereits"-Sperre. on_finished/on_error duerfen auch Listen
+        von Callbacks sein; verbunden wird alles vor dem Start, sonst koennte
+        ein schnelles Runnable fertig sein, bevor der Callback haengt.
+        """
+        signals = runnable.signals
+        # Qt-Parent haelt das Objekt am Leben, bis alle Callbacks zugestellt sind
+        signals.setParent(self)
+        setattr(self, attr, signals)
+
+        def release(*_):
+            setattr(self, attr, None)
+            signals.deleteLater()
+
+        # Sperre vor den Callbacks freigeben, damit diese direkt neu starten koennen
+        signals.finished.connect(release)
+        signals.error.connect(release)
+        for signal, callbacks in ((signals.finished, on_finished),
+                                  (signals.error, on_error)):
+            if callable(callbacks):
+                callbacks = [callbacks]
+            for callback in callbacks or ():
+                signal.connect(callback)
+        QThreadPool.globalInstance().start(runnable)
+        return signals
+
     def _load_messages(self):
         if not self._messages_api:
             return
-        if self._load_worker and self._load_worker.isRunning():
+        if self._load_signals is not None:
             return
         
-        self._load_worker = LoadMessagesWorker(self._messages_api, self)
-        self._load_worker.finished.connect(self._on_messages_loaded)
-        self._load_worker.error.connect(self._on_messages_error)
-        self._load_worker.start()
+        self._start_runnable(
+            '_load_signals',
+            LoadMessagesRunnable(self._messages_api),
+            self._on_messages_loaded,
+            self._on_messages_error,
+        )
     
-    @Slot(list)
+    @Slot(object)
     def _on_messages_loaded(self, messages: list):
         self._messages = messages
         if self._messages_card:
@@ -1035,30 +1305,103 @@ class MessageCenterView(QWidget):
     def _load_releases(self):
         if not self._releases_api:
             return
-        if self._releases_worker and self._releases_worker.isRunning():
+        if self._releases_signals is not None:
             return
         
-        self._releases_worker = LoadReleasesWorker(self._releases_api, self)
-        self._releases_worker.finished.connect(self._on_releases_loaded)
-        self._releases_worker.error.connect(lambda e: None)
-        self._releases_worker.start()
+        self._start_runnable(
+            '_releases_signals',
+            LoadReleasesRunnable(self._releases_api),
+            self._on_releases_loaded,
+        )
     
-    @Slot(list)
+    @Slot(object)
     def _on_releases_loaded(self, releases: list):
         self._releases = releases
         if self._release_card:
             self._populate_releases()
 
     def _load_bipro_events(self):
+        """Laedt die BiPRO-Events neu (alle bisher geladenen Seiten)."""
         if not self._bipro_events_api:
             return
-        if self._bipro_events_worker and self._bipro_events_worker.isRunning():
+        self._bipro_load_gen += 1
+        if self._bipro_events_signals is not None:
+            # Hoechstens ein Abruf gleichzeitig; die laufende Antwort ist
+            # veraltet und wird nach ihrem Eintreffen durch einen Neuabruf ersetzt
+            self._bipro_reload_pending = True
             return
-        self._bipro_events_worker = LoadBiproEventsWorker(self._bipro_events_api, self)
-        self._bipro_events_worker.finished.connect(self._on_bipro_events_loaded)
-        self._bipro_events_worker.start()
+        gen = self._bipro_load_gen
+        # Bereits nachgeladene Seiten in einem Request erneuern, damit die
+        # Liste beim Neuabruf nicht auf die erste Seite zusammenschrumpft
+        # (gedeckelt; weitere Seiten laedt das Scrollen wieder nach)
+        per_page = min(max(self._bipro_pages_loaded, 1) * self.BIPRO_PAGE_SIZE,
+                       self.BIPRO_RELOAD_MAX)
+        self._start_runnable(
+            '_bipro_events_signals',
+            LoadBiproEventsRunnable(
+                self._bipro_events_api, page=1,
+                per_page=per_page, with_summary=True,
+            ),
+            lambda result: self._on_bipro_events_loaded(result, gen, 0, False),
+        )
 
-    @Slot(list)
-    def _on_bipro_events_loaded(self, events: list):
-        self._bipro_events = events
-        self._populate_bipro_events()
+    def _load_more_bipro_events(self):
+        """Laedt die naechste Seite BiPRO-Events und haengt sie an."""
+        if not self._bipro_events_api or not self._bipro_has_more:
+            return
+        if self._bipro_events_signals is not None:
+            return
+        gen = self._bipro_load_gen
+        page = self._bipro_pages_loaded + 1
+        self._start_runnable(
+            '_bipro_events_signals',
+            LoadBiproEventsRunnable(
+                self._bipro_events_api, page=page,
+                per_page=self.BIPRO_PAGE_SIZE,
+            ),
+            lambda result: self._on_bipro_events_loaded(result, gen, page, True),
+        )
+
+    def _check_bipro_load_more(self, *_):
+        """Startet das Nachladen, wenn das Listenende (fast) sichtbar ist."""
+        if not self._bipro_has_more or self._bipro_events_signals is not None:
+            return
+        bar = self._bipro_scroll.verticalScrollBar()
+        if bar.value() >= bar.maximum() - self.BIPRO_LOAD_MORE_THRESHOLD:
+            self._load_more_bipro_events()
+
+    def _schedule_bipro_reload(self, *_):
+        """Fasst Neuabrufe nach Als-gelesen-Markierungen zusammen (Debounce)."""
+        self._bipro_reload_timer.start()
+
+    def _on_bipro_events_loaded(self, result: tuple, gen: int,
+                                pages: int, append: bool):
+        """pages gilt nur fuers Anhaengen; beim Neuabruf zaehlen die gelieferten Zeilen."""
+        if self._bipro_reload_pending:
+            self._bipro_reload_pending = False
+            self._load_bipro_events()
+            return
+        if gen != self._bipro_load_gen:
+            return
+        events, has_more, unread_total = result
+        if not append:
+            # Der Server kann per_page kappen. Abrunden: eine angebrochene
+            # Seite lieber erneut laden (Duplikate werden unten verworfen)
+            # als Zeilen zu ueberspringen
+            pages = max(len(events) // self.BIPRO_PAGE_SIZE, 1)
+        self._bipro_pages_loaded = pages
+        self._bipro_has_more = has_more
+        if unread_total is not None:
+            self._bipro_unread_total = unread_total
+        if append and self._bipro_events:
+            # Nur die neuen Karten anhaengen statt die Liste neu aufzubauen
+            known = {_ev_get(e, 'id') for e in self._bipro_events}
+            events = [e for e in events if _ev_get(e, 'id') not in known]
+            self._bipro_events.extend(events)
+            self._add_bipro_event_cards(events)
+            self._update_bipro_badge()
+        else:
+            self._bipro_events = list(events)
+            self._populate_bipro_events()
+        # Fuellt die erste Seite den sichtbaren Bereich nicht, gleich weiterladen
+        self._check_bipro_load_more()
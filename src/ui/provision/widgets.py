@@ -41,7 +41,8 @@ class PillBadgeDelegate(QStyledItemDelegate):
     """Malt abgerundete Pill-Badges in Tabellenzellen.
 
     Farb-Mapping wird ueber ``color_map`` konfiguriert.
-    Jeder Eintrag: ``{"bg": "#hex", "text": "#hex"}``.
+    Jeder Eintrag: ``{"bg": "#hex", "text": "#hex"}`` oder nur ``"#hex"``
+    als Hintergrund (Textfarbe dann per Kontrast).
     Zusaetzlich kann ``label_map`` interne Werte in GF-Sprache uebersetzen.
     """
 
@@ -50,47 +51,79 @@ class PillBadgeDelegate(QStyledItemDelegate):
         self._color_map = color_map
         self._label_map = label_map or {}
 
+        # Mal-Ressourcen einmalig anlegen statt pro Zelle
+        self._font = QFont()
+        self._font.setFamily("Open Sans")
+        self._font.setPointSize(9)
+        self._font.setWeight(QFont.Medium)
+        self._metrics = QFontMetrics(self._font)
+        self._selected_bg = QColor(PRIMARY_100)
+        self._colors = self._build_color_table(color_map)
+        self._pill_sizes: dict[str, tuple[int, int]] = {}
+
+    @staticmethod
+    def _build_color_table(color_map: dict) -> dict[str, tuple[QColor, QColor]]:
+        """Normalisiert color_map einmalig zu {key: (Hintergrund, Text)}."""
+        table = {}
+        for key, colors in color_map.items():
+            if not colors:
+                continue
+            if isinstance(colors, dict):
+                bg = QColor(colors["bg"])
+                text = QColor(colors["text"])
+            else:
+                bg = QColor(colors)
+                text = QColor(PRIMARY_0 if bg.lightness() < 128 else TEXT_PRIMARY)
+            table[key] = (bg, text)
+        return table
+
+    def _pill_size(self, label: str) -> tuple[int, int]:
+        """Breite/Hoehe der Pill fuer ein Label (gecacht)."""
+        size = self._pill_sizes.get(label)
+        if size is None:
+            size = (self._metrics.horizontalAdvance(label) + 24,
+                    self._metrics.height() + 8)
+            self._pill_sizes[label] = size
+        return size
+
     def paint(self, painter: QPainter, option, index: QModelIndex):
         raw_value = index.data(Qt.DisplayRole)
-        if raw_value is None:
+        # Leere Zellen: Standard-Rendering (Auswahl-Hintergrund), kein Pill-Setup
+        if raw_value is None or raw_value == "":
+            super().paint(painter, option, index)
             return
 
         value = str(raw_value).strip()
+        if not value:
+            super().paint(painter, option, index)
+            return
         lookup_key = value.lower().replace(" ", "_")
-        colors = self._color_map.get(lookup_key)
+        colors = self._colors.get(lookup_key)
 
         if not colors:
             super().paint(painter, option, index)
             return
+        bg_color, text_color = colors
 
         painter.save()
         painter.setRenderHint(QPainter.Antialiasing)
 
         if option.state & QStyle.State_Selected:
-            painter.fillRect(option.rect, QColor(PRIMARY_100))
+            painter.fillRect(option.rect, self._selected_bg)
 
         label = self._label_map.get(lookup_key, value)
 
-        font = QFont()
-        font.setFamily("Open Sans")
-        font.setPointSize(9)
-        font.setWeight(QFont.Medium)
-        fm = QFontMetrics(font)
-        text_width = fm.horizontalAdvance(label)
-        text_height = fm.height()
-
-        pill_w = text_width + 24
-        pill_h = text_height + 8
+        pill_w, pill_h = self._pill_size(label)
         pill_x = option.rect.x() + (option.rect.width() - pill_w) // 2
         pill_y = option.rect.y() + (option.rect.height() - pill_h) // 2
         pill_rect = QRect(pill_x, pill_y, pill_w, pill_h)
 
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(colors["bg"]))
+        painter.setBrush(bg_color)
         painter.drawRoundedRect(pill_rect, pill_h // 2, pill_h // 2)
 
-        painter.setPen(QColor(colors["text"]))
-        painter.setFont(font)
+        painter.setPen(text_color)
+        painter.setFont(self._font)
         painter.drawText(pill_rect, Qt.AlignCenter, label)
 
         painter.restore()
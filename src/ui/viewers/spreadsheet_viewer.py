@@ -4,7 +4,9 @@ ACENCIA ATLAS - Spreadsheet Viewer Dialog
 Dialog zur Vorschau von CSV- und Excel-Dateien.
 """
 
+import io
 import os
+import sys
 import logging
 
 from PySide6.QtWidgets import (
@@ -28,6 +30,56 @@ except ImportError:
     pass
 
 
+# Endungen mit eindeutigem Trennzeichen (kein Sniffing noetig)
+_EXT_DELIMITERS = {'.tsv': '\t', '.psv': '|'}
+_CANDIDATE_DELIMITERS = ',;\t|'
+
+# Zellen bis zu dieser Laenge werden internalisiert (wiederholte Werte teilen
+# sich ein str-Objekt); lange Freitexte wiederholen sich selten.
+_INTERN_MAX_LEN = 64
+
+
+def _fit_row(row: list, n_cols: int) -> list:
+    """Bringt eine Zeile auf genau ``n_cols`` Zellen (auffuellen/abschneiden).
+
+    Bei ``n_cols == 0`` (Kopfzeile noch unbekannt) bleibt die Zeile unveraendert.
+    Dadurch braucht ``_display_sheet`` keine Bounds-Pruefung pro Zelle mehr.
+    """
+    if not n_cols or len(row) == n_cols:
+        return row
+    return (row + [""] * n_cols)[:n_cols]
+
+
+def _intern_cells(cells) -> list:
+    """Internalisiert kurze String-Zellen einer Zeile."""
+    intern = sys.intern
+    return [intern(c) if len(c) < _INTERN_MAX_LEN else c for c in cells]
+
+
+def _delimiter_from_header(content: str) -> str | None:
+    """Ermittelt das Trennzeichen aus der Kopfzeile, falls eindeutig.
+
+    Kommt genau ein Kandidat aus ``,;\\t|`` in der ersten Zeile vor, wird er
+    direkt verwendet. Enthaelt die Kopfzeile keinen Kandidaten (einspaltige
+    Datei), greift die einfache Fallback-Regel. Nur bei mehreren Kandidaten
+    wird ``None`` geliefert und der csv.Sniffer entscheidet.
+    """
+    first_line = content[:content.find('\n')] if '\n' in content else content
+    found = [d for d in _CANDIDATE_DELIMITERS if d in first_line]
+    if len(found) == 1:
+        return found[0]
+    if not found:
+        return ';' if ';' in content[:2000] else ','
+    return None
+
+
+def _synthesize_headers(rows: list) -> tuple:
+    """Erzeugt generische Spaltennamen und passt alle Zeilen an deren Breite an."""
+    max_cols = max(len(r) for r in rows)
+    headers = [f"Spalte {i+1}" for i in range(max_cols)]
+    return headers, [_fit_row(r, max_cols) for r in rows]
+
+
 class _SpreadsheetLoadWorker(QThread):
     """Laedt CSV/XLSX-Daten im Hintergrund."""
     finished = Signal(dict)
@@ -43,10 +95,10 @@ class _SpreadsheetLoadWorker(QThread):
         ext = os.path.splitext(self._file_path)[1].lower()
         try:
             sheets: dict = {}
-            if ext == '.csv':
+            if ext in _EXT_DELIMITERS:
+                self._load_csv(sheets, delimiter=_EXT_DELIMITERS[ext])
+            elif ext == '.csv':
                 self._load_csv(sheets)
-            elif ext == '.tsv':
-                self._load_csv(sheets, delimiter='\t')
             elif ext == '.xlsx':
                 self._load_xlsx(sheets)
             elif ext == '.xls':
@@ -71,6 +123,8 @@ class _SpreadsheetLoadWorker(QThread):
                 continue
         if content is None:
             raise ValueError("Encoding nicht erkannt")
+        if delimiter is None:
+            delimiter = _delimiter_from_header(content)
         if delimiter is None:
             sniffer = csv.Sniffer()
             try:
@@ -78,45 +132,74 @@ class _SpreadsheetLoadWorker(QThread):
                 delimiter = dialect.delimiter
             except csv.Error:
                 delimiter = ';' if ';' in content[:2000] else ','
-        lines = content.splitlines()
-        reader = csv.reader(lines, delimiter=delimiter)
+        # Nur die ersten max_rows Zeilen parsen, statt den ganzen Inhalt
+        # per splitlines() als Liste zu materialisieren. newline=None
+        # vereinheitlicht \r\n und \r (alte Mac-/Excel-Exporte) zu \n.
+        reader = csv.reader(io.StringIO(content, newline=None), delimiter=delimiter)
         rows, headers = [], []
+        n_cols = 0
         for i, row in enumerate(reader):
             if i == 0:
                 headers = [str(h).strip() for h in row]
+                n_cols = len(headers)
             else:
-                rows.append([str(cell) for cell in row])
+                rows.append(_fit_row(_intern_cells(row), n_cols))
             if i >= self._max_rows:
                 break
         if not headers and rows:
-            max_cols = max(len(r) for r in rows) if rows else 0
-            headers = [f"Spalte {i+1}" for i in range(max_cols)]
+            headers, rows = _synthesize_headers(rows)
         sheet_name = os.path.basename(self._file_path)
-        sheets[sheet_name] = (headers, rows, len(lines) - 1)
+        sheets[sheet_name] = (headers, rows, self._count_data_rows(content))
+
+    @staticmethod
+    def _count_data_rows(content: str) -> int:
+        """Zaehlt die Datenzeilen (ohne Kopfzeile) fuer die Info-Anzeige.
+
+        Gezaehlt wird im bereits gelesenen Inhalt (kein zweiter Dateizugriff);
+        das Lesen im Textmodus hat die Zeilenenden schon auf \n vereinheitlicht.
+        """
+        if not content:
+            return 0
+        newlines = content.count('\n')
+        if not content.endswith('\n'):
+            newlines += 1
+        return max(newlines - 1, 0)
 
     def _load_xlsx(self, sheets: dict):
         if not HAS_OPENPYXL:
             sheets["__no_openpyxl__"] = True
             return
+        # Ein Workbook fuer alle Blaetter: openpyxl parst in reinem Python
+        # (GIL-gebunden), Threads mit je eigener Instanz lesen Archiv und
+        # Shared Strings nur mehrfach
         wb = openpyxl.load_workbook(self._file_path, read_only=True, data_only=True)
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-            headers, rows, total_rows = [], [], 0
-            for i, row in enumerate(ws.iter_rows(values_only=True)):
-                if i == 0:
-                    headers = [str(c) if c is not None else "" for c in row]
-                else:
-                    rows.append([str(c) if c is not None else "" for c in row])
-                total_rows = i
-                if i >= self._max_rows:
-                    break
-            if not headers and not rows:
-                headers = ["(leer)"]
-            if not headers and rows:
-                max_cols = max(len(r) for r in rows) if rows else 0
-                headers = [f"Spalte {i+1}" for i in range(max_cols)]
-            sheets[sheet_name] = (headers, rows, total_rows)
-        wb.close()
+        try:
+            for sheet_name in wb.sheetnames:
+                sheets[sheet_name] = self._read_xlsx_sheet(wb[sheet_name])
+        finally:
+            wb.close()
+
+    def _read_xlsx_sheet(self, ws) -> tuple:
+        """Liest ein Arbeitsblatt als (headers, rows, total_rows)."""
+        headers, rows, total_rows = [], [], 0
+        n_cols = 0
+        for i, row in enumerate(ws.iter_rows(values_only=True)):
+            if i == 0:
+                headers = [str(c) if c is not None else "" for c in row]
+                n_cols = len(headers)
+            else:
+                rows.append(_fit_row(
+                    _intern_cells(str(c) if c is not None else "" for c in row),
+                    n_cols,
+                ))
+            total_rows = i
+            if i >= self._max_rows:
+                break
+        if not headers and not rows:
+            headers = ["(leer)"]
+        if not headers and rows:
+            headers, rows = _synthesize_headers(rows)
+        return headers, rows, total_rows
 
 
 class SpreadsheetViewerDialog(QDialog):
@@ -334,11 +417,10 @@ class SpreadsheetViewerDialog(QDialog):
         self.table.setHorizontalHeaderLabels(headers)
         self.table.setRowCount(len(rows))
         
+        # Zeilen sind beim Laden bereits auf len(headers) normiert (_fit_row)
         for row_idx, row_data in enumerate(rows):
             for col_idx, cell_value in enumerate(row_data):
-                if col_idx < len(headers):
-                    item = QTableWidgetItem(cell_value)
-                    self.table.setItem(row_idx, col_idx, item)
+                self.table.setItem(row_idx, col_idx, QTableWidgetItem(cell_value))
         
         # Spaltenbreiten anpassen
         self.table.resizeColumnsToContents()
@@ -2,6 +2,8 @@
 UseCase: Dokument herunterladen.
 """
 
+from typing import Optional
+
 from domain.archive.interfaces import IDocumentRepository
 from domain.archive.entities import Document, DownloadResult
 from domain.archive import archive_rules
@@ -14,11 +16,12 @@ class DownloadDocument:
         self._repo = repository
 
     def execute(
-        self, doc: Document, target_dir: str,
+        self, doc: Document, target_dir: str, filename: Optional[str] = None,
     ) -> DownloadResult:
+        """Laedt doc nach target_dir (als filename, sonst original_filename)."""
         saved_path = self._repo.download(
             doc.id, target_dir,
-            filename_override=doc.original_filename,
+            filename_override=filename or doc.original_filename,
         )
 
         if not saved_path: